@@ -3,7 +3,7 @@ import { useUser } from "../../contexts/UserContext";
 import {
 	analyzeJobAndResume,
 	getJobPostings,
-	type JobPosting,
+	type JobPostingSummary,
 } from "../../lib/api";
 
 const JobPostingList = () => {
@@ -32,7 +32,7 @@ const JobPostingList = () => {
 		<div className="p-4 border rounded">
 			<h2 className="mb-2 text-lg font-bold">Job Postings</h2>
 			<ul>
-				{data?.map((job: JobPosting) => (
+				{data?.items.map((job: JobPostingSummary) => (
 					<li key={job.id} className="mb-2">
 						<h3 className="font-bold">{job.title}</h3>
 						<p>{job.company}</p>
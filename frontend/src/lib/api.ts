@@ -22,6 +22,21 @@ export interface JobPosting {
 	content_doc?: string;
 }
 
+export interface JobPostingSummary {
+	id: number;
+	title: string;
+	company?: string;
+	location?: string;
+	url?: string;
+	posted_at?: string;
+	created_at?: string;
+}
+
+export interface JobPostingListPage {
+	items: JobPostingSummary[];
+	next_cursor: string | null;
+}
+
 export interface ResumeSource {
 	id?: number;
 	user_id: string;
@@ -44,9 +59,11 @@ export const get_resume_sources_by_user = async (userId: string) => {
 	return response.data;
 };
 
-export const get_latest_job_postings = async (limit: number = 10) => {
-	const response = await apiClient.get(`/job-postings?limit=${limit}`);
-	return response.data;
+export const get_latest_job_postings = async (
+	limit: number = 10,
+): Promise<JobPostingSummary[]> => {
+	const response = await apiClient.get("/job-postings", { params: { limit } });
+	return response.data.items;
 };
 
 export const uploadResumeSource = async (userId: string, file: File) => {
@@ -95,8 +112,20 @@ export const findJobPostings = async (userId: string, keyword?: string) => {
 	return response.data;
 };
 
-export const getJobPostings = async (limit: number = 10) => {
-	const response = await apiClient.get(`/job-postings?limit=${limit}`);
+export const getJobPostings = async (
+	limit: number = 10,
+	cursor?: string,
+): Promise<JobPostingListPage> => {
+	const response = await apiClient.get("/job-postings", {
+		params: { limit, cursor },
+	});
+	return response.data;
+};
+
+export const getJobPosting = async (
+	jobPostingId: number,
+): Promise<JobPosting> => {
+	const response = await apiClient.get(`/job-postings/${jobPostingId}`);
 	return response.data;
 };
 
@@ -6,25 +6,27 @@ import uvicorn
 import os
 
 from src.core.schemas.resume_source import ResumeSource
-from src.core.schemas.job_posting import JobPosting
-from src.core.services.resume_maker.source import upload_resume
-from src.core.database.resume_sources import (
-  get_resume_sources_by_user,
-  get_resume_source_by_id,
-  get_resume_source_content_by_id,
-  remove_resume_source,
+from src.core.schemas.job_posting import (
+  JobPosting,
+  JobPostingListPage,
+  JobPostingSearchPage,
 )
+from src.core.services.resume_maker.source import upload_resume
+from src.core.services.resume_maker.conversion import MAX_CONVERSION_FILE_SIZE
+from src.core.database import aio as db
 from src.core.services.resume_maker.workflow import run_resume_maker
 from src.core.services.job_search.workflow import run_job_search_workflow
-from src.core.database.job_postings import get_latest_job_postings
 from src.core.services.job_analysis.workflow import run_job_analysis
 from src.core.schemas.user import User, UserCreate
-from src.core.database.users import get_all_users, save_user, get_user_by_id
-from src.core.file_storage.file_manager import FileManager
-from src.core.file_storage.paths import FileStoragePaths
+from src.core.file_storage.storage import get_storage
 
 app = FastAPI()
 
+# Create the storage directories once, at startup
+get_storage()
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 origins = [
   "http://localhost",
   "http://localhost:5173",
@@ -45,16 +47,24 @@ async def upload_resume_source_api(user_id: str, file: UploadFile = File(...)):
   """
   Uploads a resume source file for a user.
   """
-  paths = FileStoragePaths()
-  file_manager = FileManager(paths)
-  file_path = paths.get_upload_path(user_id, file.filename)
-  content = await file.read()
-
-  if file.filename.lower().endswith((".txt", ".md", ".html")):
-    file_manager.write_file_sync(file_path, content.decode("utf-8", errors="ignore"))
-  else:
-    file_manager.write_binary_file(file_path, content)
-  resume_source = await upload_resume(file_path, file.filename, user_id)
+  storage = get_storage()
+  file_path = storage.paths.get_upload_path(user_id, file.filename)
+
+  async def _read_chunks():
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+      yield chunk
+
+  # Stream the upload to disk instead of holding it in memory
+  try:
+    content_hash = await storage.file_manager.write_stream_async(
+      file_path, _read_chunks(), max_size=MAX_CONVERSION_FILE_SIZE
+    )
+  except ValueError as e:
+    raise HTTPException(status_code=413, detail=str(e))
+
+  resume_source = await upload_resume(
+    str(file_path), file.filename, user_id, content_hash=content_hash
+  )
   return {
     "filename": file.filename,
     "resume_source_id": resume_source.id,
@@ -67,7 +77,7 @@ async def get_resume_api(user_id: str, resume_source_id: int):
   """
   Retrieves a specific resume source for a user.
   """
-  resume_source = get_resume_source_by_id(resume_source_id)
+  resume_source = await db.get_resume_source_by_id(resume_source_id)
   if not resume_source or resume_source.user_id != user_id:
     raise HTTPException(status_code=404, detail="Resume source not found")
   return resume_source
@@ -78,11 +88,11 @@ async def get_resume_content_api(user_id: str, resume_source_id: int):
   """
   Retrieves the content of a specific resume source for a user.
   """
-  resume_source = get_resume_source_by_id(resume_source_id)
+  resume_source = await db.get_resume_source_by_id(resume_source_id)
   if not resume_source or resume_source.user_id != user_id:
     raise HTTPException(status_code=404, detail="Resume source not found")
 
-  content = get_resume_source_content_by_id(resume_source_id)
+  content = await db.get_resume_source_content_by_id(resume_source_id)
   if content is None:
     raise HTTPException(status_code=404, detail="Resume content not found")
 
@@ -98,7 +108,7 @@ async def get_resume_sources_api(user_id: str):
   """
   Retrieves all resume sources for a user.
   """
-  return get_resume_sources_by_user(user_id)
+  return await db.get_resume_sources_by_user(user_id)
 
 
 @app.delete("/users/{user_id}/resume-sources/{resume_source_id}")
@@ -106,11 +116,11 @@ async def remove_resume_source_api(user_id: str, resume_source_id: int):
   """
   Deletes a resume source for a user.
   """
-  resume_source = get_resume_source_by_id(resume_source_id)
+  resume_source = await db.get_resume_source_by_id(resume_source_id)
   if not resume_source or resume_source.user_id != user_id:
     raise HTTPException(status_code=404, detail="Resume source not found")
 
-  remove_resume_source(resume_source_id)
+  await db.remove_resume_source(resume_source_id)
   return {"message": "Resume source deleted successfully"}
 
 
@@ -119,7 +129,7 @@ async def download_resume_source_api(user_id: str, resume_source_id: int):
   """
   Downloads a resume source file for a user.
   """
-  resume_source = get_resume_source_by_id(resume_source_id)
+  resume_source = await db.get_resume_source_by_id(resume_source_id)
   if not resume_source or resume_source.user_id != user_id:
     raise HTTPException(status_code=404, detail="Resume source not found")
 
@@ -135,11 +145,12 @@ async def download_resume_source_api(user_id: str, resume_source_id: int):
 
 
 @app.post("/users/{user_id}/{job_target}/resumes")
-async def make_resume_api(user_id: str, job_target: str):
+async def make_resume_api(user_id: str, job_target: str, force: bool = False):
   """
   Creates a resume for a user based on a job target.
+  Returns the cached resume if sources and job target are unchanged, unless forced.
   """
-  resume_path = await run_resume_maker(job_target, user_id)
+  resume_path = await run_resume_maker(job_target, user_id, force_regenerate=force)
   return {"resume_path": resume_path}
 
 
@@ -152,12 +163,49 @@ async def find_job_postings_api(user_id: str, keyword: str | None = None):
   return {"job_postings": job_postings}
 
 
-@app.get("/job-postings", response_model=List[JobPosting])
-async def get_job_postings_api(limit: int = 10):
+@app.get("/job-postings", response_model=JobPostingListPage)
+async def get_job_postings_api(
+  limit: int = 10, cursor: str | None = None, days: int | None = None
+):
+  """
+  Lists job postings newest first, without descriptions.
+
+  Pass the returned next_cursor as `cursor` to fetch the next page, and `days`
+  to only list postings saved within the last N days.
+  """
+  try:
+    return await db.list_job_postings(
+      limit=min(max(limit, 1), 100), after=cursor, days=days
+    )
+  except ValueError:
+    raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@app.get("/job-postings/search", response_model=JobPostingSearchPage)
+async def search_job_postings_api(q: str, limit: int = 20, cursor: str | None = None):
+  """
+  Full-text searches job postings, best matches first.
+
+  Pass the returned next_cursor as `cursor` to fetch the next page. For a very
+  broad query only the newest matches are ranked, and `truncated` is true.
+  """
+  if not q.strip():
+    raise HTTPException(status_code=400, detail="Search query must not be empty")
+  try:
+    return await db.search_job_postings(q, limit=min(max(limit, 1), 100), after=cursor)
+  except ValueError:
+    raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@app.get("/job-postings/{job_posting_id}", response_model=JobPosting)
+async def get_job_posting_api(job_posting_id: int):
   """
-  Retrieves the latest job postings.
+  Retrieves a single job posting with its description.
   """
-  return get_latest_job_postings(limit)
+  job_posting = await db.get_job_posting_by_id(job_posting_id)
+  if not job_posting:
+    raise HTTPException(status_code=404, detail="Job posting not found")
+  return job_posting
 
 
 @app.post("/users/{user_id}/analyze-job")
@@ -165,6 +213,7 @@ async def analyze_job_and_resume_api(user_id: str):
   """
   Analyzes a job posting against a user's resume.
   """
+  # Claims the user's next queued posting and records its delivery
   analysis_result = await run_job_analysis(user_id=user_id)
   return {"analysis_result": analysis_result}
 
@@ -184,7 +233,7 @@ async def get_all_users_api():
   """
   Retrieves all users.
   """
-  return get_all_users()
+  return await db.get_all_users()
 
 
 @app.post("/users", response_model=User)
@@ -192,7 +241,7 @@ async def save_user_api(user: UserCreate):
   """
   Creates a new user.
   """
-  return save_user(user)
+  return await db.save_user(user)
 
 
 @app.get("/users/{user_id}", response_model=User)
@@ -200,7 +249,7 @@ async def get_user_by_id_api(user_id: str):
   """
   Retrieves a user by their ID.
   """
-  user = get_user_by_id(user_id)
+  user = await db.get_user_by_id(user_id)
   if not user:
     raise HTTPException(status_code=404, detail="User not found")
   return user
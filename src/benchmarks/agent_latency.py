@@ -0,0 +1,71 @@
+import asyncio
+import itertools
+import os
+import statistics
+import time
+
+# Building the real chat model needs an API key but makes no request
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from langchain_core.language_models.fake_chat_models import (  # noqa: E402
+  GenericFakeChatModel,
+)
+from langchain_core.messages import AIMessage  # noqa: E402
+from src.core.agents.cache import AgentCache  # noqa: E402
+from src.core.agents.job_finding_agent import create_job_finding_agent  # noqa: E402
+from src.core.llm.providers import get_chat_model  # noqa: E402
+
+MESSAGES = 50
+USER_COUNT = 5
+REPLY = "Here are a few job postings that match your resume."
+
+
+class _FakeToolChatModel(GenericFakeChatModel):
+  """Streams a canned reply word by word; accepts tools and ignores them."""
+
+  def bind_tools(self, tools, **kwargs):
+    return self
+
+
+async def _first_token_ms(get_agent, user_id: str) -> float:
+  """Milliseconds from receiving a message to the agent's first streamed token."""
+  start = time.perf_counter()
+  agent = get_agent(user_id)
+  async for _ in agent.astream(
+    {"messages": [("user", "최근 공고 보여줘")]}, stream_mode="messages"
+  ):
+    break
+  return (time.perf_counter() - start) * 1000
+
+
+async def run_benchmark():
+  """
+  Compares message-to-first-token latency with an agent built per message
+  against the per-user agent cache. The reply comes from a fake streaming model,
+  so only the bot's own overhead is measured.
+  """
+  fake_llm = _FakeToolChatModel(messages=itertools.cycle([AIMessage(REPLY)]))
+
+  def build_per_message(user_id: str):
+    # Before: a new chat model client and a new ReAct graph for every message
+    get_chat_model.__wrapped__()
+    return create_job_finding_agent(user_id, llm=fake_llm)
+
+  cache = AgentCache(lambda user_id: create_job_finding_agent(user_id, llm=fake_llm))
+  users = [f"user_{i}" for i in range(USER_COUNT)]
+
+  print(f"--- Message to first token ({MESSAGES} messages, {USER_COUNT} users) ---")
+  print(f"{'agent':<18}{'mean (ms)':>12}{'p50 (ms)':>12}{'max (ms)':>12}")
+  for name, get_agent in [("per message", build_per_message), ("cached", cache.get)]:
+    samples = [
+      await _first_token_ms(get_agent, users[i % USER_COUNT]) for i in range(MESSAGES)
+    ]
+    print(
+      f"{name:<18}{statistics.mean(samples):>12.2f}"
+      f"{statistics.median(samples):>12.2f}{max(samples):>12.2f}"
+    )
+  print(f"Agent cache: {cache.stats()}")
+
+
+if __name__ == "__main__":
+  asyncio.run(run_benchmark())
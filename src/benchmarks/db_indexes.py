@@ -0,0 +1,143 @@
+import os
+import random
+import shutil
+import tempfile
+import time
+from src.core.database import config
+
+# Point the repositories at a throwaway database before any connection is opened
+_tmp_dir = tempfile.mkdtemp(prefix="job_finding_bot_bench_")
+config.DB_FILE = os.path.join(_tmp_dir, "bench.db")
+
+from src.core.database.connection import (  # noqa: E402
+  close_db_connection,
+  get_db_connection,
+)
+from src.core.database.init import init_all_database  # noqa: E402
+from src.core.database.migrations import MIGRATIONS, apply_migrations  # noqa: E402
+
+JOB_POSTING_ROWS = 1_000_000
+USER_COUNT = 1_000
+RESUME_SOURCE_ROWS = 200_000
+USER_MAP_ROWS = 1_000_000
+
+# The hot queries, as issued by the repository functions
+QUERIES = {
+  "get_unread_job_posting": (
+    """
+    SELECT id, title, company, location, description, url, posted_at, created_at, content_doc
+    FROM job_postings WHERE read_at IS NULL ORDER BY created_at ASC LIMIT 1
+    """,
+    (),
+  ),
+  "get_latest_job_postings": (
+    """
+    SELECT id, title, company, location, url, posted_at, created_at
+    FROM job_postings ORDER BY created_at DESC, id DESC LIMIT ?
+    """,
+    (10,),
+  ),
+  "get_resume_sources_by_user": (
+    """
+    SELECT id, user_id, source_file_name, original_file_name, content_hash
+    FROM resume_sources WHERE user_id = ?
+    """,
+    ("user_42",),
+  ),
+  "claim_next_job_posting_for_user": (
+    """
+    SELECT job_posting_id FROM job_postings_users_map
+    WHERE user_id = ? AND delivered_at IS NULL
+      AND (claimed_at IS NULL OR claimed_at <= datetime('now', '-900 seconds'))
+    ORDER BY job_posting_id ASC LIMIT 1
+    """,
+    ("user_42",),
+  ),
+  "get_users_by_job_posting": (
+    "SELECT user_id FROM job_postings_users_map WHERE job_posting_id = ?",
+    (424242,),
+  ),
+}
+
+
+def _populate():
+  """Fills the tables with synthetic rows; ~99% of postings are already read."""
+  print(f"Populating {JOB_POSTING_ROWS:,} job postings in {config.DB_FILE} ...")
+  rng = random.Random(0)
+  with get_db_connection() as conn:
+    conn.executemany(
+      """
+      INSERT INTO job_postings (title, company, location, description, url, created_at, read_at)
+      VALUES (?, ?, ?, ?, ?, datetime('2025-01-01', ? || ' seconds'), ?)
+      """,
+      (
+        (
+          f"Job {i}",
+          f"Company {i % 5000}",
+          "Seoul",
+          "description " * 20,
+          f"https://example.com/jobs/{i}",
+          i * 30,
+          None if rng.random() < 0.01 else "2025-06-01 00:00:00",
+        )
+        for i in range(JOB_POSTING_ROWS)
+      ),
+    )
+    conn.executemany(
+      """
+      INSERT INTO resume_sources (user_id, source_file_name, original_file_name, content_hash)
+      VALUES (?, ?, ?, ?)
+      """,
+      (
+        (f"user_{i % USER_COUNT}", f"{i}.md", f"{i}.pdf", f"{i:064x}")
+        for i in range(RESUME_SOURCE_ROWS)
+      ),
+    )
+    conn.executemany(
+      "INSERT OR IGNORE INTO job_postings_users_map (user_id, job_posting_id) VALUES (?, ?)",
+      (
+        (f"user_{i % USER_COUNT}", i // 2 * 7 % JOB_POSTING_ROWS)
+        for i in range(USER_MAP_ROWS)
+      ),
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+
+
+def _report(label: str, repeat: int = 20):
+  """Prints the query plan and mean latency of each hot query."""
+  print(f"\n=== {label} ===")
+  conn = get_db_connection()
+  for name, (sql, params) in QUERIES.items():
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    start = time.perf_counter()
+    for _ in range(repeat):
+      conn.execute(sql, params).fetchall()
+    elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+    print(f"{name}: {elapsed_ms:.3f} ms")
+    for row in plan:
+      print(f"    {row['detail']}")
+
+
+def run_benchmark():
+  """Compares query plans and latency before and after the index migrations."""
+  # Create the tables without the indexes, then fill them
+  latest_version = MIGRATIONS[-1][0]
+  pending_migrations = list(MIGRATIONS)
+  MIGRATIONS.clear()
+  init_all_database()
+  MIGRATIONS.extend(pending_migrations)
+  _populate()
+
+  _report("Before migrations")
+  apply_migrations()
+  get_db_connection().execute("ANALYZE")
+  _report(f"After migrations (user_version {latest_version})")
+
+
+if __name__ == "__main__":
+  try:
+    run_benchmark()
+  finally:
+    close_db_connection()
+    shutil.rmtree(_tmp_dir, ignore_errors=True)
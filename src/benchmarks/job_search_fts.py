@@ -0,0 +1,98 @@
+import os
+import random
+import shutil
+import tempfile
+import time
+from src.core.database import config
+
+# Point the repositories at a throwaway database before any connection is opened
+_tmp_dir = tempfile.mkdtemp(prefix="job_finding_bot_bench_")
+config.DB_FILE = os.path.join(_tmp_dir, "bench.db")
+
+from src.core.database.connection import (  # noqa: E402
+  close_db_connection,
+  get_db_connection,
+)
+from src.core.database.init import init_all_database  # noqa: E402
+from src.core.database.job_postings import search_job_postings  # noqa: E402
+
+JOB_POSTING_ROWS = 300_000
+PAGES = 3
+
+TITLES = [
+  "백엔드 개발자",
+  "프론트엔드 개발자",
+  "데이터 엔지니어",
+  "ML Engineer",
+  "DevOps 엔지니어",
+]
+COMPANIES = [f"Company {i}" for i in range(2000)]
+LOCATIONS = ["서울 강남구", "서울 마포구", "판교", "부산", "Remote"]
+STACK = [
+  "Python", "Java", "Kotlin", "Spring", "Django", "FastAPI", "React", "TypeScript",
+  "Kubernetes", "AWS", "PostgreSQL", "Redis", "Kafka", "Airflow", "Spark", "PyTorch",
+]  # fmt: skip
+
+# One posting in RARE_TERM_EVERY mentions a rare technology
+RARE_TERM = "Elixir"
+RARE_TERM_EVERY = 1000
+
+# Broad terms match a quarter of the table; the rare term a thousandth
+QUERIES = ["python", "백엔드 kafka", "kuber", "판교 spring", "pytorch 서울", "elixir"]
+
+
+def _populate():
+  """Fills job_postings with synthetic postings; the insert trigger indexes them."""
+  print(f"Populating {JOB_POSTING_ROWS:,} job postings in {config.DB_FILE} ...")
+  rng = random.Random(0)
+  with get_db_connection() as conn:
+    conn.executemany(
+      """
+      INSERT INTO job_postings (title, company, location, description, url)
+      VALUES (?, ?, ?, ?, ?)
+      """,
+      (
+        (
+          rng.choice(TITLES),
+          rng.choice(COMPANIES),
+          rng.choice(LOCATIONS),
+          "주요 업무: 서비스 개발 및 운영. 기술 스택: "
+          + ", ".join(rng.sample(STACK, 4))
+          + (f", {RARE_TERM}" if i % RARE_TERM_EVERY == 0 else "")
+          + ". 우대 사항: 대용량 트래픽 경험. " * 5,
+          f"https://example.com/jobs/{i}",
+        )
+        for i in range(JOB_POSTING_ROWS)
+      ),
+    )
+    conn.commit()
+
+
+def run_benchmark(repeat: int = 20):
+  """Measures search latency for the first pages of a few typical queries."""
+  init_all_database()
+  _populate()
+
+  print(f"\n=== Search ({repeat} runs each, limit 20) ===")
+  for query in QUERIES:
+    after = None
+    for page in range(1, PAGES + 1):
+      start = time.perf_counter()
+      for _ in range(repeat):
+        result = search_job_postings(query, limit=20, after=after)
+      elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+      truncated = ", truncated" if result.truncated else ""
+      print(
+        f"{query!r} page {page}: {elapsed_ms:.2f} ms ({len(result.hits)} hits{truncated})"
+      )
+      after = result.next_cursor
+      if not after:
+        break
+
+
+if __name__ == "__main__":
+  try:
+    run_benchmark()
+  finally:
+    close_db_connection()
+    shutil.rmtree(_tmp_dir, ignore_errors=True)
@@ -0,0 +1,47 @@
+import time
+from typing import Callable
+
+from src.core.services.job_analysis.workflow import (
+  build_job_analysis_workflow,
+  get_job_analysis_workflow,
+)
+from src.core.services.job_search.workflow import (
+  create_job_search_workflow,
+  get_job_search_workflow,
+)
+from src.core.services.resume_maker.workflow import (
+  build_resume_maker_workflow,
+  get_resume_maker_workflow,
+)
+
+ITERATIONS = 200
+
+
+def _measure(factory: Callable, iterations: int = ITERATIONS) -> float:
+  """Returns the mean time in milliseconds spent obtaining a compiled graph."""
+  start = time.perf_counter()
+  for _ in range(iterations):
+    factory()
+  return (time.perf_counter() - start) * 1000 / iterations
+
+
+def run_benchmark():
+  """Compares per-invocation graph overhead of recompiling vs the cached graph."""
+  workflows = [
+    ("job_analysis", build_job_analysis_workflow, get_job_analysis_workflow),
+    ("job_search", create_job_search_workflow, get_job_search_workflow),
+    ("resume_maker", build_resume_maker_workflow, get_resume_maker_workflow),
+  ]
+
+  print(f"--- Workflow compile overhead ({ITERATIONS} iterations) ---")
+  print(f"{'workflow':<15}{'recompile (ms)':>16}{'cached (ms)':>14}{'speedup':>10}")
+  for name, build, get_cached in workflows:
+    get_cached.cache_clear()
+    recompile_ms = _measure(build)
+    cached_ms = _measure(get_cached)
+    speedup = recompile_ms / cached_ms if cached_ms else float("inf")
+    print(f"{name:<15}{recompile_ms:>16.3f}{cached_ms:>14.4f}{speedup:>9.0f}x")
+
+
+if __name__ == "__main__":
+  run_benchmark()
@@ -1,16 +1,20 @@
 import logging
+import time
 import discord
 from discord.ext import commands
-from src.core.agents.job_finding_agent import create_job_finding_agent
-from src.core.database.users import save_user, get_user_by_id, update_user
+from src.core.agents.job_finding_agent import get_job_finding_agent
+from src.core.agents.memory import conversation_thread_id
+from src.core.database import aio as db
 from src.core.schemas.user import User
-from src.core.file_storage.paths import FileStoragePaths
-from src.core.file_storage.file_manager import FileManager
+from src.core.file_storage.storage import get_storage
+from src.core.services.resume_maker.conversion import MAX_CONVERSION_FILE_SIZE
+from src.core.services.utils.hashing import remember_file_hash
 import aiohttp
 
 # --- Bot Configuration ---
 BOT_COMMAND_PREFIX = "/"
 DISCORD_MESSAGE_LIMIT = 2000
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024
 
 # Initialize the Discord client with necessary intents
 intents = discord.Intents.default()
@@ -56,19 +60,20 @@ async def on_message(message: discord.Message):
   if message.author.bot:
     return
 
+  received_at = time.perf_counter()
   print(f"Received message from {message.author.name}: {message.content}")
 
   # Add or update user in the database
   try:
-    user = get_user_by_id(message.author.name)
+    user = await db.get_user_by_id(message.author.name)
     if user:
       if user.name != message.author.display_name:
-        update_user(message.author.name, name=message.author.display_name)
+        await db.update_user(message.author.name, name=message.author.display_name)
     else:
       new_user = User(
         id=message.author.name, name=message.author.display_name, resume_file=None
       )
-      save_user(new_user)
+      await db.save_user(new_user)
   except Exception as e:
     logger.error(f"Error handling user in database: {e}")
 
@@ -78,36 +83,53 @@ async def on_message(message: discord.Message):
     attachment = message.attachments[0]
     allowed_extensions = (".pdf", ".docx", ".xlsx", ".txt", ".md", ".pptx", ".html")
     if attachment.filename.lower().endswith(allowed_extensions):
-      # Use paths.py and file_manager.py for file path and saving
-      paths = FileStoragePaths()
-      file_manager = FileManager(paths)
-      file_path = paths.get_upload_path(message.author.name, attachment.filename)
+      if attachment.size > MAX_CONVERSION_FILE_SIZE:
+        await message.channel.send("파일이 너무 큽니다!")
+        return
+
+      # Use the process-wide storage for file path and saving
+      storage = get_storage()
+      file_path = storage.paths.get_upload_path(
+        message.author.name, attachment.filename
+      )
       async with aiohttp.ClientSession() as session:
         async with session.get(attachment.url) as resp:
-          if resp.status == 200:
-            content = await resp.read()
-            # Save file using FileManager
-            if attachment.filename.lower().endswith((".txt", ".md", ".html")):
-              file_manager.write_file_sync(
-                file_path, content.decode("utf-8", errors="ignore")
-              )
-            else:
-              file_manager.write_binary_file(file_path, content)
-          else:
+          if resp.status != 200:
             await message.channel.send("파일 다운로드 중 오류가 발생했습니다!")
             return
+          # Stream the attachment to disk in chunks
+          try:
+            content_hash = await storage.file_manager.write_stream_async(
+              file_path,
+              resp.content.iter_chunked(ATTACHMENT_CHUNK_SIZE),
+              max_size=MAX_CONVERSION_FILE_SIZE,
+            )
+          except ValueError:
+            await message.channel.send("파일이 너무 큽니다!")
+            return
+          # The agent's upload_resume_source tool reuses this digest
+          remember_file_hash(file_path, content_hash)
 
   # Process message with the agent
   if not message.content.startswith(BOT_COMMAND_PREFIX):
     try:
-      # Create the job finding agent
-      agent_executor = create_job_finding_agent(user_id=message.author.name)
+      # Reuse the user's compiled agent instead of building one per message
+      agent_executor = get_job_finding_agent(message.author.name)
       user_message = (
         message.content.strip()
         if file_path is None
         else f"{message.content.strip()}\nattachment file_path: {file_path}"
       )
-      response = await agent_executor.ainvoke({"messages": [("user", user_message)]})
+      # Only the new message is sent; earlier turns come from the checkpointer
+      thread_id = conversation_thread_id(message.channel.id, message.author.name)
+      response = await agent_executor.ainvoke(
+        {"messages": [("user", user_message)]},
+        config={"configurable": {"thread_id": thread_id}},
+      )
+      logger.info(
+        f"Agent replied to {message.author.name} in "
+        f"{(time.perf_counter() - received_at) * 1000:.0f} ms"
+      )
       await send_long_message(message.channel, response["messages"][-1].content)
     except Exception as e:
       logger.error(f"An error occurred during agent processing: {e}")
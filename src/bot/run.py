@@ -1,6 +1,7 @@
 import asyncio
 import os
 from src.bot.discord.discord_bot import bot
+from src.core.agents.memory import close_checkpointer
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,9 +17,13 @@ async def run_bot():
     )
     return
 
-  async with bot:
-    await bot.load_extension("src.bot.tasks.job_notifier")
-    await bot.start(DISCORD_BOT_TOKEN)
+  try:
+    async with bot:
+      await bot.load_extension("src.bot.tasks.job_notifier")
+      await bot.load_extension("src.bot.tasks.retention")
+      await bot.start(DISCORD_BOT_TOKEN)
+  finally:
+    await close_checkpointer()
 
 
 if __name__ == "__main__":
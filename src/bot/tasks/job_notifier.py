@@ -1,12 +1,10 @@
-import asyncio
 import datetime
 import os
 import discord
 from discord.ext import commands, tasks
-from src.core.database.job_postings import get_unread_job_posting, mark_job_as_read
+from src.core.database import aio as db
 from src.core.services.job_analysis.workflow import run_job_analysis
 from src.bot.discord.discord_bot import send_long_message
-from src.core.database.users import get_all_users
 import random
 
 # KST timezone
@@ -32,7 +30,7 @@ class JobNotifier(commands.Cog):
 
   @tasks.loop(hours=1)
   async def send_hourly_jobs(self):
-    """Fetches and sends one unread job posting every hour from 7 AM to 10 PM KST."""
+    """Sends one job posting not yet delivered to a user every hour from 7 AM to 10 PM KST."""
 
     # Check if current time is between 7 AM and 10 PM KST
     now = datetime.datetime.now(KST)
@@ -45,22 +43,24 @@ class JobNotifier(commands.Cog):
       print(f"Could not find text channel with ID {self.notification_channel_id}.")
       return
 
+    job = None
+    selected_user = None
     try:
-      # Get one unread job posting
-      job = await asyncio.to_thread(get_unread_job_posting)
-
-      if not job:
-        print("No unread job postings available.")
-        return
-
-      # Get all users and select a random one
-      users = get_all_users()
+      # Visit users in random order and claim the next posting queued for one
+      users = await db.get_all_users()
       if not users:
         print("No users found for resume selection.")
         return
 
-      # Select random user
-      selected_user = random.choice(users)
+      for user in random.sample(users, len(users)):
+        job = await db.claim_next_job_posting_for_user(user.id)
+        if job:
+          selected_user = user
+          break
+
+      if not job or not selected_user:
+        print("No undelivered job postings available.")
+        return
 
       print(f"Analyzing job posting: {job.title} at {job.company}")
       print(f"Selected user: {selected_user.name} (ID: {selected_user.id})")
@@ -68,40 +68,28 @@ class JobNotifier(commands.Cog):
       # Run job analysis workflow with selected user
       analysis_result = await run_job_analysis(
         user_id=selected_user.id,  # Pass the selected user ID
+        job_posting_id=job.id,  # Analyze the posting claimed above
       )
 
-      # Parse analysis result
-      try:
-        message = analysis_result["analysis_result"]
-
-        # Send the message
-        await send_long_message(channel, message)
+      report_file = analysis_result.get("report_file")
+      if not report_file:
+        raise RuntimeError(f"Job analysis produced no report for job {job.id}")
 
-        # Mark the job as read
-        await asyncio.to_thread(mark_job_as_read, job.url)
-        print(
-          f"Sent job analysis for {job.title} at {job.company} (user: {selected_user.name})"
-        )
+      await send_long_message(channel, analysis_result["analysis_result"])
 
-      except Exception as e:
-        print(f"Error parsing analysis result: {e}")
-        # Fallback to simple message
-        fallback_message = f"""📢 **새로운 채용 공고 분석**
-
-**💼 {job.title}**
-**🏢 {job.company}**
-**👤 대상 사용자**: {selected_user.name}
-**📍 {job.location}**
-**📅 {job.posted_at}**
-**🔗 URL:** <{job.url}>
-
-*상세 분석 중 오류가 발생했습니다. 원본 URL을 확인해주세요.*"""
-
-        await channel.send(fallback_message)
-        await asyncio.to_thread(mark_job_as_read, job.url)
+      # Record the delivery for this user only, once the report has been sent
+      await db.mark_job_posting_delivered(
+        selected_user.id, job.id, analysis_id=report_file
+      )
+      print(
+        f"Sent job analysis for {job.title} at {job.company} (user: {selected_user.name})"
+      )
 
     except Exception as e:
       print(f"Error in hourly job notification task: {e}")
+      # Give the claim back so the posting is retried instead of dropped
+      if job and selected_user:
+        await db.release_user_job_posting(selected_user.id, job.id)
       if channel:
         await channel.send("채용 공고 분석 중 오류가 발생했습니다.")
 
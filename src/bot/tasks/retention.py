@@ -0,0 +1,31 @@
+import asyncio
+from discord.ext import commands, tasks
+from src.core.services.job_search.retention import run_retention
+
+
+class Retention(commands.Cog):
+  """Cog that archives expired job postings and cleans up their files once a day."""
+
+  def __init__(self, bot: commands.Bot):
+    self.bot = bot
+    self.run_daily_retention.start()
+
+  def cog_unload(self):
+    self.run_daily_retention.cancel()
+
+  @tasks.loop(hours=24)
+  async def run_daily_retention(self):
+    """Runs the retention job off the event loop."""
+    try:
+      await asyncio.to_thread(run_retention)
+    except Exception as e:
+      print(f"Error in daily retention task: {e}")
+
+  @run_daily_retention.before_loop
+  async def before_run_daily_retention(self):
+    await self.bot.wait_until_ready()
+
+
+async def setup(bot: commands.Bot):
+  """Sets up the Retention cog."""
+  await bot.add_cog(Retention(bot))
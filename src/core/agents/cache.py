@@ -0,0 +1,75 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple
+
+AGENT_CACHE_SIZE = int(os.getenv("AGENT_CACHE_SIZE", "256"))
+AGENT_CACHE_TTL_SECONDS = float(os.getenv("AGENT_CACHE_TTL_SECONDS", "3600"))
+
+
+class _CacheEntry(NamedTuple):
+  created_at: float
+  agent: Any
+
+
+class AgentCache:
+  """
+  Bounded LRU of compiled agents, keyed by user id.
+
+  An agent is rebuilt with `factory` once it is older than ttl_seconds, and the
+  least recently used agent is dropped beyond max_size users.
+  """
+
+  def __init__(
+    self,
+    factory: Callable[[str], Any],
+    max_size: int = AGENT_CACHE_SIZE,
+    ttl_seconds: float = AGENT_CACHE_TTL_SECONDS,
+  ):
+    self.factory = factory
+    self.max_size = max_size
+    self.ttl_seconds = ttl_seconds
+    self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def get(self, user_id: str) -> Any:
+    """Returns the user's agent, building it if missing or expired."""
+    now = time.monotonic()
+    with self._lock:
+      entry = self._entries.get(user_id)
+      if entry and now - entry.created_at < self.ttl_seconds:
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry.agent
+
+      self.misses += 1
+      agent = self.factory(user_id)
+      self._entries[user_id] = _CacheEntry(now, agent)
+      self._entries.move_to_end(user_id)
+      while len(self._entries) > self.max_size:
+        self._entries.popitem(last=False)
+        self.evictions += 1
+      return agent
+
+  def invalidate(self, user_id: str):
+    """Drops a user's agent so the next message builds a new one."""
+    with self._lock:
+      self._entries.pop(user_id, None)
+
+  def clear(self):
+    with self._lock:
+      self._entries.clear()
+
+  def stats(self) -> Dict[str, int]:
+    """Returns hit/miss/eviction counters and the current size."""
+    with self._lock:
+      return {
+        "hits": self.hits,
+        "misses": self.misses,
+        "evictions": self.evictions,
+        "entries": len(self._entries),
+      }
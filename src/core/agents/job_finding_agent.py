@@ -1,5 +1,7 @@
 from langchain_core.tools import tool
 from langgraph.prebuilt import create_react_agent
+from src.core.agents.cache import AgentCache
+from src.core.agents.memory import compact_conversation, get_checkpointer
 from src.core.services.resume_maker.source import upload_resume
 from src.core.llm.providers import get_chat_model
 from src.core.services.job_analysis.workflow import run_job_analysis
@@ -7,8 +9,13 @@ from src.core.services.job_search.workflow import run_job_search_workflow
 from src.core.services.resume_maker.workflow import run_resume_maker
 
 
-def create_job_finding_agent(user_id: str = ""):
-  """Creates the job finding agent."""
+def create_job_finding_agent(user_id: str = "", llm=None, checkpointer=None):
+  """
+  Creates the job finding agent. Uses the shared chat model unless llm is given.
+
+  With a checkpointer, the conversation is kept per thread_id and compacted by
+  compact_conversation before each model call.
+  """
 
   @tool
   async def job_analysis():
@@ -21,9 +28,10 @@ def create_job_finding_agent(user_id: str = ""):
     return await run_job_search_workflow(user_id)
 
   @tool
-  async def resume_maker(job_target: str = ""):
-    """Creates a resume based on a user's portfolio and a target job."""
-    return await run_resume_maker(job_target, user_id)
+  async def resume_maker(job_target: str = "", force_regenerate: bool = False):
+    """Creates a resume based on a user's portfolio and a target job.
+    Set force_regenerate only when the user explicitly asks for a new version."""
+    return await run_resume_maker(job_target, user_id, force_regenerate)
 
   @tool
   async def upload_resume_source(file_path: str, file_name: str):
@@ -33,5 +41,20 @@ def create_job_finding_agent(user_id: str = ""):
 
   # Define the tools for the agent
   tools = [job_analysis, job_search, resume_maker, upload_resume_source]
-  llm = get_chat_model()
-  return create_react_agent(llm, tools)
+  return create_react_agent(
+    llm or get_chat_model(),
+    tools,
+    pre_model_hook=compact_conversation,
+    checkpointer=checkpointer,
+  )
+
+
+# Compiled agents per user; the tools are bound to the user id
+job_finding_agents = AgentCache(
+  lambda user_id: create_job_finding_agent(user_id, checkpointer=get_checkpointer())
+)
+
+
+def get_job_finding_agent(user_id: str):
+  """Returns the user's cached job finding agent, creating it on first use."""
+  return job_finding_agents.get(user_id)
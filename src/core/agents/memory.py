@@ -0,0 +1,152 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+import aiosqlite
+from langchain_core.messages import (
+  AIMessage,
+  BaseMessage,
+  HumanMessage,
+  RemoveMessage,
+  SystemMessage,
+  ToolMessage,
+)
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
+from src.core.llm.prompt_builder import PromptBuilder, estimate_tokens
+from src.core.llm.providers import SUMMARIZATION_MODEL, get_summarization_model
+
+CONVERSATION_DB_FILE = os.getenv("CONVERSATION_DB_FILE", ".sqlite/conversations.db")
+# Once a conversation exceeds CONVERSATION_MAX_TOKENS, the turns older than the
+# most recent CONVERSATION_WINDOW_TOKENS are folded into a running summary
+CONVERSATION_MAX_TOKENS = int(os.getenv("CONVERSATION_MAX_TOKENS", "8000"))
+CONVERSATION_WINDOW_TOKENS = int(os.getenv("CONVERSATION_WINDOW_TOKENS", "3000"))
+
+SUMMARY_MESSAGE_ID = "conversation_summary"
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+SUMMARIZE_CONVERSATION_PROMPT = """You maintain the memory of a job search assistant's conversation with a user.
+
+Update the summary of the conversation so far with the new turns below. Keep what the assistant needs to continue helping: the user's goals and preferences, jobs and companies discussed, resumes generated or uploaded, and open requests. Drop small talk. Answer with concise bullet points in the conversation's language.
+
+Current summary:
+{summary}
+
+New turns:
+{conversation}"""
+
+
+def conversation_thread_id(channel_id: int | str, user_id: str) -> str:
+  """Checkpointer thread of a user's conversation in a channel."""
+  return f"{channel_id}:{user_id}"
+
+
+@lru_cache(maxsize=1)
+def get_checkpointer() -> AsyncSqliteSaver:
+  """
+  Returns the process's conversation checkpointer, creating it on first use.
+
+  Must be called from the event loop the agents run on; the connection is
+  opened and the tables are created on the first checkpoint access.
+  """
+  Path(CONVERSATION_DB_FILE).parent.mkdir(parents=True, exist_ok=True)
+  return AsyncSqliteSaver(aiosqlite.connect(CONVERSATION_DB_FILE))
+
+
+async def close_checkpointer():
+  """Closes the checkpointer's connection, whose thread keeps the process alive."""
+  if get_checkpointer.cache_info().currsize:
+    await get_checkpointer().conn.close()
+    get_checkpointer.cache_clear()
+
+
+def _text(message: BaseMessage) -> str:
+  """The text parts of a message's content."""
+  if isinstance(message.content, str):
+    return message.content
+  return "".join(
+    part if isinstance(part, str) else part.get("text", "") for part in message.content
+  )
+
+
+def _message_tokens(message: BaseMessage) -> int:
+  return estimate_tokens(_text(message)) + sum(
+    estimate_tokens(str(call["args"])) for call in getattr(message, "tool_calls", [])
+  )
+
+
+def _format_turns(messages: Sequence[BaseMessage]) -> str:
+  lines = []
+  for message in messages:
+    if isinstance(message, HumanMessage):
+      lines.append(f"User: {_text(message)}")
+    elif isinstance(message, ToolMessage):
+      lines.append(f"Tool {message.name}: {_text(message)}")
+    elif isinstance(message, AIMessage):
+      calls = ", ".join(call["name"] for call in message.tool_calls)
+      if text := _text(message):
+        lines.append(f"Assistant: {text}")
+      if calls:
+        lines.append(f"Assistant called: {calls}")
+  return "\n".join(lines)
+
+
+def _split_window(messages: List[BaseMessage]) -> Tuple[str, List[BaseMessage], int]:
+  """
+  Returns the current summary, the messages after it and where the recent
+  window starts. The window always starts at a user message, so tool calls
+  are never separated from their results.
+  """
+  summary = ""
+  if messages and messages[0].id == SUMMARY_MESSAGE_ID:
+    summary = _text(messages[0]).removeprefix(SUMMARY_PREFIX)
+    messages = messages[1:]
+
+  start = len(messages)
+  window_tokens = 0
+  for i in range(len(messages) - 1, -1, -1):
+    window_tokens += _message_tokens(messages[i])
+    if isinstance(messages[i], HumanMessage):
+      if window_tokens > CONVERSATION_WINDOW_TOKENS and start < len(messages):
+        break
+      start = i
+  return summary, messages, start
+
+
+async def _summarize_turns(summary: str, turns: Sequence[BaseMessage]) -> str:
+  builder = PromptBuilder(
+    "summarize_conversation", SUMMARIZATION_MODEL, SUMMARIZE_CONVERSATION_PROMPT
+  )
+  builder.add_section("summary", summary or "(none)", priority=1, keep="tail")
+  builder.add_section("conversation", _format_turns(turns), keep="tail")
+  prompt = SUMMARIZE_CONVERSATION_PROMPT.format(**builder.build())
+  response = await get_summarization_model().ainvoke(prompt)
+  return str(response.content)
+
+
+async def compact_conversation(state: Dict) -> Dict:
+  """
+  Pre-model hook bounding the conversation sent to the model.
+
+  Below CONVERSATION_MAX_TOKENS the messages pass through. Above it, the older
+  turns are summarized into a system message and removed from the checkpointed
+  state, keeping the most recent turns verbatim. If summarizing fails, the
+  older turns are dropped and the previous summary is kept.
+  """
+  messages = state["messages"]
+  if sum(_message_tokens(m) for m in messages) <= CONVERSATION_MAX_TOKENS:
+    return {"llm_input_messages": messages}
+
+  summary, history, start = _split_window(messages)
+  if start == 0:
+    return {"llm_input_messages": messages}
+
+  try:
+    summary = await _summarize_turns(summary, history[:start])
+  except Exception as e:
+    print(f"Error summarizing conversation, dropping older turns: {e}")
+
+  kept: List[BaseMessage] = history[start:]
+  if summary:
+    kept = [SystemMessage(SUMMARY_PREFIX + summary, id=SUMMARY_MESSAGE_ID), *kept]
+  return {"messages": [RemoveMessage(id=REMOVE_ALL_MESSAGES), *kept]}
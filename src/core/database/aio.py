@@ -0,0 +1,92 @@
+# Async versions of the repository functions for use on the event loop.
+#
+# Each function has the same name and signature as its synchronous counterpart
+# and runs it in a worker thread, so a slow query or disk write never blocks the
+# FastAPI or Discord event loop:
+#
+#   from src.core.database import aio as db
+#   user = await db.get_user_by_id(user_id)
+
+import asyncio
+import functools
+from typing import Awaitable, Callable, TypeVar
+from src.core.database import (
+  job_postings,
+  job_postings_users_map,
+  resume_generations,
+  resume_sources,
+  users,
+)
+
+T = TypeVar("T")
+
+
+def _to_thread(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+  """Wraps a blocking repository function into a coroutine function."""
+
+  @functools.wraps(func)
+  async def wrapper(*args, **kwargs) -> T:
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+  return wrapper
+
+
+# Users
+get_user_by_id = _to_thread(users.get_user_by_id)
+get_all_users = _to_thread(users.get_all_users)
+save_user = _to_thread(users.save_user)
+update_user = _to_thread(users.update_user)
+delete_user = _to_thread(users.delete_user)
+get_user_resume_digest = _to_thread(users.get_user_resume_digest)
+update_user_resume_digest = _to_thread(users.update_user_resume_digest)
+
+# Job postings
+save_job_postings = _to_thread(job_postings.save_job_postings)
+upsert_job_postings = _to_thread(job_postings.upsert_job_postings)
+get_unread_job_posting = _to_thread(job_postings.get_unread_job_posting)
+get_job_posting_by_id = _to_thread(job_postings.get_job_posting_by_id)
+claim_next_job_posting = _to_thread(job_postings.claim_next_job_posting)
+release_job_posting = _to_thread(job_postings.release_job_posting)
+mark_job_as_read = _to_thread(job_postings.mark_job_as_read)
+list_job_postings = _to_thread(job_postings.list_job_postings)
+get_latest_job_postings = _to_thread(job_postings.get_latest_job_postings)
+get_latest_job_postings_by_day = _to_thread(job_postings.get_latest_job_postings_by_day)
+update_content_doc = _to_thread(job_postings.update_content_doc)
+update_job_digest = _to_thread(job_postings.update_job_digest)
+get_job_digests = _to_thread(job_postings.get_job_digests)
+update_job_search_body = _to_thread(job_postings.update_job_search_body)
+get_job_content_docs = _to_thread(job_postings.get_job_content_docs)
+search_job_postings = _to_thread(job_postings.search_job_postings)
+
+# Resume sources
+save_resume_source = _to_thread(resume_sources.save_resume_source)
+get_resume_sources_by_user = _to_thread(resume_sources.get_resume_sources_by_user)
+get_resume_source_by_id = _to_thread(resume_sources.get_resume_source_by_id)
+get_resume_source_by_hash = _to_thread(resume_sources.get_resume_source_by_hash)
+get_resume_source_content_by_id = _to_thread(
+  resume_sources.get_resume_source_content_by_id
+)
+remove_resume_source = _to_thread(resume_sources.remove_resume_source)
+get_resume_source_summaries = _to_thread(resume_sources.get_resume_source_summaries)
+save_resume_source_summary = _to_thread(resume_sources.save_resume_source_summary)
+
+# Job postings <-> users map
+save_job_posting_user_map = _to_thread(job_postings_users_map.save_job_posting_user_map)
+enqueue_job_postings = _to_thread(job_postings_users_map.enqueue_job_postings)
+claim_next_job_posting_for_user = _to_thread(
+  job_postings_users_map.claim_next_job_posting_for_user
+)
+mark_job_posting_delivered = _to_thread(
+  job_postings_users_map.mark_job_posting_delivered
+)
+release_user_job_posting = _to_thread(job_postings_users_map.release_user_job_posting)
+reset_user_deliveries = _to_thread(job_postings_users_map.reset_user_deliveries)
+get_job_postings_by_user = _to_thread(job_postings_users_map.get_job_postings_by_user)
+get_users_by_job_posting = _to_thread(job_postings_users_map.get_users_by_job_posting)
+delete_job_posting_user_map = _to_thread(
+  job_postings_users_map.delete_job_posting_user_map
+)
+
+# Resume generations
+get_resume_generation = _to_thread(resume_generations.get_resume_generation)
+save_resume_generation = _to_thread(resume_generations.save_resume_generation)
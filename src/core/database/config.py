@@ -1 +1,7 @@
+import os
+
 DB_FILE = ".sqlite/job_listings.db"
+
+# Postings saved within this many days are queued for a user when they join
+# (and were queued for the existing users when the delivery queue was added)
+QUEUE_BACKFILL_DAYS = int(os.getenv("QUEUE_BACKFILL_DAYS", "14"))
@@ -0,0 +1,50 @@
+import sqlite3
+import threading
+from pathlib import Path
+from src.core.database import config
+
+# Applied to every new connection
+PRAGMAS = (
+  # Takes effect on new databases; maintenance.compact_database converts old ones
+  "PRAGMA auto_vacuum = INCREMENTAL",
+  "PRAGMA journal_mode = WAL",
+  "PRAGMA synchronous = NORMAL",
+  "PRAGMA busy_timeout = 5000",
+  "PRAGMA cache_size = -20000",  # 20 MB page cache
+  "PRAGMA mmap_size = 268435456",  # 256 MB memory-mapped I/O
+  "PRAGMA temp_store = MEMORY",
+)
+
+_local = threading.local()
+
+
+def _connect(db_file: str) -> sqlite3.Connection:
+  """Opens a new connection with the shared pragmas applied."""
+  Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+  conn = sqlite3.connect(db_file, timeout=5.0)
+  conn.row_factory = sqlite3.Row
+  for pragma in PRAGMAS:
+    conn.execute(pragma)
+  return conn
+
+
+def get_db_connection() -> sqlite3.Connection:
+  """
+  Returns this thread's persistent database connection, opening it on first use.
+
+  Use it as `with get_db_connection() as conn:` so the block runs as one
+  transaction; the connection itself stays open and is reused by later calls.
+  """
+  conn = getattr(_local, "conn", None)
+  if conn is None:
+    conn = _connect(config.DB_FILE)
+    _local.conn = conn
+  return conn
+
+
+def close_db_connection():
+  """Closes this thread's database connection, if one is open."""
+  conn = getattr(_local, "conn", None)
+  if conn is not None:
+    conn.close()
+    _local.conn = None
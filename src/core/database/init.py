@@ -6,6 +6,8 @@ from src.core.database.resume_sources import init_resume_sources_db
 from src.core.database.job_postings_users_map import (
   init_job_postings_users_map_db,
 )
+from src.core.database.resume_generations import init_resume_generations_db
+from src.core.database.migrations import apply_migrations
 
 
 def init_all_database():
@@ -14,6 +16,8 @@ def init_all_database():
   init_job_postings_db()
   init_resume_sources_db()
   init_job_postings_users_map_db()
+  init_resume_generations_db()
+  apply_migrations()
 
 
 if __name__ == "__main__":
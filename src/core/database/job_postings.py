@@ -1,21 +1,21 @@
-import sqlite3
-from typing import List, Optional
-from src.core.schemas.job_posting import JobPosting
+from typing import Dict, Iterator, List, Optional, Tuple
+from src.core.schemas.job_posting import (
+  JobPosting,
+  JobPostingListPage,
+  JobPostingSearchHit,
+  JobPostingSearchPage,
+  JobPostingSummary,
+)
 from datetime import datetime
-from src.core.database.config import DB_FILE
-
-
-def _get_db_connection():
-  """Internal function to get a database connection."""
-  conn = sqlite3.connect(DB_FILE)
-  conn.row_factory = sqlite3.Row
-  return conn
+from src.core.database import config
+from src.core.database.connection import get_db_connection
+from src.core.database.migrations import add_column_if_missing
 
 
 def init_job_postings_db():
   """Initializes the database and creates tables if they don't exist."""
   print("--- Initializing Storage ---")
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute("""
             CREATE TABLE IF NOT EXISTS job_postings (
@@ -31,6 +31,8 @@ def init_job_postings_db():
                 content_doc TEXT
             )
         """)
+    add_column_if_missing(conn, "job_postings", "digest", "TEXT")
+    add_column_if_missing(conn, "job_postings", "claimed_at", "TIMESTAMP NULL")
     conn.commit()
   print("Storage initialized successfully.")
 
@@ -52,70 +54,134 @@ def _parse_posted_at(posted_at: Optional[str]) -> Optional[str]:
     return posted_at
 
 
-def save_job_postings(jobs: List[JobPosting]) -> List[JobPosting]:
-  """Saves a list of job postings to the database, ignoring duplicates, and returns the saved postings with their IDs."""
-  if not jobs:
-    return []
+# Rows per multi-row INSERT and URLs per SELECT ... IN, kept well below
+# SQLite's bound-variable limit (7 variables per inserted row)
+INSERT_CHUNK_SIZE = 100
+SELECT_CHUNK_SIZE = 500
+
+# How long a worker may hold a claimed posting before others can take it over
+CLAIM_LEASE_SECONDS = 15 * 60
+
+# Full-text search ranks every match unless a query matches more postings than
+# this; then only this many of the newest are ranked and the page is truncated
+SEARCH_RANK_WINDOW = 1000
+
+
+def _chunked(items: List, size: int) -> Iterator[List]:
+  """Yields consecutive slices of at most `size` items."""
+  for i in range(0, len(items), size):
+    yield items[i : i + size]
+
+
+def _row_to_job_posting(row) -> JobPosting:
+  """Builds a JobPosting from a job_postings row."""
+  return JobPosting(
+    id=row["id"],
+    title=row["title"],
+    company=row["company"],
+    location=row["location"],
+    posted_at=row["posted_at"],
+    description=row["description"],
+    url=row["url"],
+    content_doc=row["content_doc"],
+  )
+
+
+def upsert_job_postings(
+  jobs: List[JobPosting],
+) -> Tuple[List[JobPosting], List[JobPosting]]:
+  """
+  Bulk-inserts job postings in one transaction, ignoring duplicate URLs.
 
-  saved_jobs = []
-  urls = [job.url for job in jobs if job.url]
+  Returns (newly inserted postings, postings that already existed), both with
+  their database IDs. Postings without a URL are skipped.
+  """
+  unique_jobs = list({job.url: job for job in jobs if job.url}.values())
+  if not unique_jobs:
+    return [], []
 
-  with _get_db_connection() as conn:
+  inserted: Dict[str, JobPosting] = {}
+  existing: Dict[str, JobPosting] = {}
+
+  with get_db_connection() as conn:
     cursor = conn.cursor()
-    for job in jobs:
-      posted_at_ts = _parse_posted_at(job.posted_at)
+    for chunk in _chunked(unique_jobs, INSERT_CHUNK_SIZE):
+      placeholders = ",".join("(?, ?, ?, ?, ?, ?, ?)" for _ in chunk)
+      params = []
+      for job in chunk:
+        params.extend(
+          (
+            job.title,
+            job.company,
+            job.location,
+            job.description,
+            job.url,
+            _parse_posted_at(job.posted_at),
+            job.content_doc,
+          )
+        )
       cursor.execute(
-        """
-                INSERT OR IGNORE INTO job_postings (title, company, location, description, url, posted_at, content_doc)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+        f"""
+                INSERT INTO job_postings (title, company, location, description, url, posted_at, content_doc)
+                VALUES {placeholders}
+                ON CONFLICT(url) DO NOTHING
+                RETURNING id, title, company, location, description, url, posted_at, content_doc
             """,
-        (
-          job.title,
-          job.company,
-          job.location,
-          job.description,
-          job.url,
-          posted_at_ts,
-          job.content_doc,
-        ),
+        params,
       )
-    conn.commit()
+      for row in cursor.fetchall():
+        inserted[row["url"]] = _row_to_job_posting(row)
 
-    if urls:
-      # Fetch the rows that were just inserted or already existed
-      placeholders = ",".join("?" for _ in urls)
+    # Fetch the rows that already existed
+    missing_urls = [job.url for job in unique_jobs if job.url not in inserted]
+    for chunk in _chunked(missing_urls, SELECT_CHUNK_SIZE):
+      placeholders = ",".join("?" for _ in chunk)
       cursor.execute(
         f"""
-                SELECT id, title, company, location, description, url, posted_at, created_at, content_doc
+                SELECT id, title, company, location, description, url, posted_at, content_doc
                 FROM job_postings
                 WHERE url IN ({placeholders})
                 """,
-        urls,
+        chunk,
       )
-      rows = cursor.fetchall()
-      for row in rows:
-        saved_jobs.append(
-          JobPosting(
-            id=row["id"],
-            title=row["title"],
-            company=row["company"],
-            location=row["location"],
-            posted_at=row["posted_at"],
-            description=row["description"],
-            url=row["url"],
-            content_doc=row["content_doc"],
-          )
-        )
-  return saved_jobs
+      for row in cursor.fetchall():
+        existing[row["url"]] = _row_to_job_posting(row)
+    conn.commit()
+
+  return (
+    [inserted[job.url] for job in unique_jobs if job.url in inserted],
+    [existing[job.url] for job in unique_jobs if job.url in existing],
+  )
+
+
+def save_job_postings(jobs: List[JobPosting]) -> List[JobPosting]:
+  """Saves a list of job postings to the database, ignoring duplicates, and returns the saved postings with their IDs."""
+  inserted, existing = upsert_job_postings(jobs)
+  return inserted + existing
+
+
+def get_recent_job_posting_ids(days: int = config.QUEUE_BACKFILL_DAYS) -> List[int]:
+  """Fetches the IDs of the job postings saved within the last N days, oldest first."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+      SELECT id FROM job_postings
+      WHERE created_at >= datetime('now', ?)
+      ORDER BY created_at ASC, id ASC
+      """,
+      (f"-{days} days",),
+    )
+    return [row["id"] for row in cursor.fetchall()]
 
 
 def get_unread_job_posting() -> Optional[JobPosting]:
   """Fetches one unread job posting (read_at is NULL)."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
-            SELECT title, company, location, description, url, posted_at, created_at, content_doc
+            SELECT id, title, company, location, description, url, posted_at, created_at, content_doc
             FROM job_postings
             WHERE read_at IS NULL
             ORDER BY created_at ASC
@@ -125,6 +191,7 @@ def get_unread_job_posting() -> Optional[JobPosting]:
     row = cursor.fetchone()
     if row:
       return JobPosting(
+        id=row["id"],
         title=row["title"],
         company=row["company"],
         location=row["location"],
@@ -136,80 +203,176 @@ def get_unread_job_posting() -> Optional[JobPosting]:
     return None
 
 
-def mark_job_as_read(job_url: str):
-  """Marks a job posting as read by setting read_at timestamp."""
-  with _get_db_connection() as conn:
+def get_job_posting_by_id(job_id: int) -> Optional[JobPosting]:
+  """Fetches a job posting by ID."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+            SELECT id, title, company, location, description, url, posted_at, created_at, content_doc
+            FROM job_postings
+            WHERE id = ?
+        """,
+      (job_id,),
+    )
+    row = cursor.fetchone()
+    if row:
+      return _row_to_job_posting(row)
+    return None
+
+
+def claim_next_job_posting(
+  lease_seconds: int = CLAIM_LEASE_SECONDS,
+) -> Optional[JobPosting]:
+  """
+  Atomically claims the oldest unread job posting for this worker.
+
+  The claim is a lease: a posting claimed more than `lease_seconds` ago and
+  still unread (e.g. its worker crashed) can be claimed again. Call
+  mark_job_as_read when done, or release_job_posting to give it back early.
+  """
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
             UPDATE job_postings
-            SET read_at = CURRENT_TIMESTAMP
-            WHERE url = ?
+            SET claimed_at = CURRENT_TIMESTAMP
+            WHERE id = (
+                SELECT id
+                FROM job_postings
+                WHERE read_at IS NULL
+                  AND (claimed_at IS NULL OR claimed_at <= datetime('now', ?))
+                ORDER BY created_at ASC
+                LIMIT 1
+            )
+            RETURNING id, title, company, location, description, url, posted_at, content_doc
         """,
-      (job_url,),
+      (f"-{lease_seconds} seconds",),
     )
+    rows = cursor.fetchall()
     conn.commit()
+    if rows:
+      return _row_to_job_posting(rows[0])
+    return None
 
 
-def get_latest_job_postings_by_day(days: int) -> List[JobPosting]:
-  """Fetches job postings created within the last N days."""
-  with _get_db_connection() as conn:
+def release_job_posting(job_id: int):
+  """Releases a claimed job posting so another worker can pick it up."""
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
-            SELECT title, company, location, description, url, posted_at, created_at, content_doc
-            FROM job_postings
-            ORDER BY created_at DESC
+            UPDATE job_postings
+            SET claimed_at = NULL
+            WHERE id = ?
         """,
-      (days,),
+      (job_id,),
     )
-    rows = cursor.fetchall()
-    return [
-      JobPosting(
-        title=row["title"],
-        company=row["company"],
-        location=row["location"],
-        posted_at=row["posted_at"],
-        description=row["description"],
-        url=row["url"],
-        content_doc=row["content_doc"],
-      )
-      for row in rows
-    ]
+    conn.commit()
 
 
-def get_latest_job_postings(limit: int = 10) -> List[JobPosting]:
-  """Fetches the latest job postings with a limit."""
-  with _get_db_connection() as conn:
+def mark_job_as_read(job_url: str):
+  """Marks a job posting as read by setting read_at timestamp."""
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
-            SELECT id, title, company, location, description, url, posted_at, created_at, content_doc
-            FROM job_postings
-            ORDER BY created_at DESC
-            LIMIT ?
+            UPDATE job_postings
+            SET read_at = CURRENT_TIMESTAMP
+            WHERE url = ?
         """,
-      (limit,),
+      (job_url,),
+    )
+    conn.commit()
+
+
+def _encode_list_cursor(created_at: str, job_id: int) -> str:
+  return f"{created_at}|{job_id}"
+
+
+def _decode_list_cursor(cursor: str) -> Tuple[str, int]:
+  """Parses a cursor returned by list_job_postings; raises ValueError if invalid."""
+  created_at, job_id = cursor.split("|")
+  return created_at, int(job_id)
+
+
+def list_job_postings(
+  limit: int = 20, after: Optional[str] = None, days: Optional[int] = None
+) -> JobPostingListPage:
+  """
+  Lists job postings newest first, without their descriptions.
+
+  Pages are keyed on (created_at, id). idx_job_postings_created_at holds
+  both (id is the rowid), so a page is an index seek with no sort step; each
+  of its rows is then read from the table. Pass the previous page's
+  next_cursor as `after`. `days` restricts the list to postings saved within
+  the last N days. Use get_job_posting_by_id for the full posting.
+
+  Raises:
+      ValueError: If `after` is not a cursor returned by this function.
+  """
+  conditions = []
+  params: List = []
+  if days is not None:
+    conditions.append("created_at >= datetime('now', ?)")
+    params.append(f"-{days} days")
+  if after:
+    conditions.append("(created_at, id) < (?, ?)")
+    params.extend(_decode_list_cursor(after))
+  where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      f"""
+      SELECT id, title, company, location, url, posted_at, created_at
+      FROM job_postings
+      {where}
+      ORDER BY created_at DESC, id DESC
+      LIMIT ?
+      """,
+      (*params, limit + 1),
     )
     rows = cursor.fetchall()
-    return [
-      JobPosting(
-        id=row["id"],
-        title=row["title"],
-        company=row["company"],
-        location=row["location"],
-        posted_at=row["posted_at"],
-        description=row["description"],
-        url=row["url"],
-        content_doc=row["content_doc"],
-      )
-      for row in rows
-    ]
+
+  items = [
+    JobPostingSummary(
+      id=row["id"],
+      title=row["title"],
+      company=row["company"],
+      location=row["location"],
+      url=row["url"],
+      posted_at=row["posted_at"],
+      created_at=row["created_at"],
+    )
+    for row in rows[:limit]
+  ]
+  next_cursor = None
+  if len(rows) > limit:
+    next_cursor = _encode_list_cursor(items[-1].created_at, items[-1].id)
+  return JobPostingListPage(items=items, next_cursor=next_cursor)
+
+
+def get_latest_job_postings_by_day(days: int) -> List[JobPostingSummary]:
+  """Fetches the job postings created within the last N days, newest first."""
+  items: List[JobPostingSummary] = []
+  after = None
+  while True:
+    page = list_job_postings(limit=SELECT_CHUNK_SIZE, after=after, days=days)
+    items.extend(page.items)
+    after = page.next_cursor
+    if not after:
+      return items
+
+
+def get_latest_job_postings(limit: int = 10) -> List[JobPostingSummary]:
+  """Fetches the latest job postings with a limit."""
+  return list_job_postings(limit=limit).items
 
 
 def reset_all_read_at():
   """모든 job_postings의 read_at 필드를 NULL로 초기화합니다."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
@@ -221,9 +384,13 @@ def reset_all_read_at():
   print("All read_at fields have been reset to NULL.")
 
 
-def update_content_doc(job_id: int, content_doc: str):
-  """특정 id의 채용공고의 content_doc을 수정합니다."""
-  with _get_db_connection() as conn:
+def update_content_doc(job_id: int, content_doc: str, content: Optional[str] = None):
+  """
+  특정 id의 채용공고의 content_doc을 수정합니다.
+
+  content가 주어지면 전문 검색 인덱스의 본문도 content doc 텍스트로 교체합니다.
+  """
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
@@ -233,13 +400,257 @@ def update_content_doc(job_id: int, content_doc: str):
       """,
       (content_doc, job_id),
     )
+    if content is not None:
+      _update_search_body(cursor, job_id, content)
     conn.commit()
     print(f"content_doc updated for job_id: {job_id}")
 
 
+def _update_search_body(cursor, job_id: int, body: str):
+  cursor.execute(
+    """
+    UPDATE job_postings_fts
+    SET body = ?
+    WHERE rowid = ?
+    """,
+    (body, job_id),
+  )
+
+
+def update_job_search_body(job_id: int, body: str):
+  """Replaces the indexed body text of a job posting in the full-text index."""
+  with get_db_connection() as conn:
+    _update_search_body(conn.cursor(), job_id, body)
+    conn.commit()
+
+
+def get_job_content_docs() -> Dict[int, str]:
+  """Fetches the content doc file name of every job posting that has one."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+      SELECT id, content_doc
+      FROM job_postings
+      WHERE content_doc IS NOT NULL
+      """
+    )
+    return {row["id"]: row["content_doc"] for row in cursor.fetchall()}
+
+
+def _to_match_query(query: str) -> str:
+  """
+  Turns free text into an FTS5 MATCH expression.
+
+  Every whitespace-separated term is quoted (so input like `c++` or `node.js`
+  can't break the query syntax) and prefix-matched, so `백엔드` also finds
+  `백엔드를`. Terms are AND-ed.
+  """
+  terms = [term.replace('"', '""') for term in query.split()]
+  return " ".join(f'"{term}"*' for term in terms if term.strip('"'))
+
+
+def _encode_search_cursor(floor_id: int, score: float, job_id: int) -> str:
+  return f"{floor_id}:{score!r}:{job_id}"
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[int, float, int]:
+  """Parses a cursor returned by search_job_postings; raises ValueError if invalid."""
+  floor_id, score, job_id = cursor.split(":")
+  return int(floor_id), float(score), int(job_id)
+
+
+def search_job_postings(
+  query: str, limit: int = 20, after: Optional[str] = None
+) -> JobPostingSearchPage:
+  """
+  Full-text searches job postings by title, company, location and content.
+
+  Results are ordered by BM25 rank (title matches weigh most) and paginated
+  with a keyset cursor on (rank, id): pass the previous page's next_cursor as
+  `after`, so deep pages cost the same as the first.
+
+  A query matching more than SEARCH_RANK_WINDOW postings ranks only the newest
+  SEARCH_RANK_WINDOW of them, so a broad term costs the same on a large table as
+  on a small one; its pages are flagged `truncated`, since older (possibly
+  better) matches are left out.
+
+  Raises:
+      ValueError: If `after` is not a cursor returned by this function.
+  """
+  match_query = _to_match_query(query)
+  if not match_query:
+    return JobPostingSearchPage()
+
+  after_score, after_id = (None, None)
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    if after:
+      floor_id, after_score, after_id = _decode_search_cursor(after)
+    else:
+      # Lowest id among the newest matches; FTS5 walks ids in descending order cheaply
+      cursor.execute(
+        """
+        SELECT MIN(rowid) FROM (
+          SELECT rowid
+          FROM job_postings_fts
+          WHERE job_postings_fts MATCH ?
+          ORDER BY rowid DESC
+          LIMIT ?
+        )
+        """,
+        (match_query, SEARCH_RANK_WINDOW),
+      )
+      floor_id = cursor.fetchone()[0]
+      if floor_id is None:
+        return JobPostingSearchPage()
+
+    # Any match below the floor was cut off by the window
+    cursor.execute(
+      """
+      SELECT 1 FROM job_postings_fts
+      WHERE job_postings_fts MATCH ? AND rowid < ?
+      LIMIT 1
+      """,
+      (match_query, floor_id),
+    )
+    truncated = cursor.fetchone() is not None
+
+    cursor.execute(
+      """
+      SELECT j.id, j.title, j.company, j.location, j.url, j.posted_at,
+             snippet(job_postings_fts, -1, '<b>', '</b>', '…', 16) AS snippet,
+             job_postings_fts.rank AS score
+      FROM job_postings_fts
+      JOIN job_postings j ON j.id = job_postings_fts.rowid
+      WHERE job_postings_fts MATCH ?
+        AND job_postings_fts.rowid >= ?
+        AND (
+          ? IS NULL
+          OR job_postings_fts.rank > ?
+          OR (job_postings_fts.rank = ? AND job_postings_fts.rowid > ?)
+        )
+      ORDER BY job_postings_fts.rank, job_postings_fts.rowid
+      LIMIT ?
+      """,
+      (
+        match_query,
+        floor_id,
+        after_score,
+        after_score,
+        after_score,
+        after_id,
+        limit + 1,
+      ),
+    )
+    rows = cursor.fetchall()
+
+  hits = [
+    JobPostingSearchHit(
+      id=row["id"],
+      title=row["title"],
+      company=row["company"],
+      location=row["location"],
+      url=row["url"],
+      posted_at=row["posted_at"],
+      snippet=row["snippet"] or "",
+      score=row["score"],
+    )
+    for row in rows[:limit]
+  ]
+  next_cursor = None
+  if len(rows) > limit:
+    next_cursor = _encode_search_cursor(floor_id, hits[-1].score, hits[-1].id)
+  return JobPostingSearchPage(hits=hits, next_cursor=next_cursor, truncated=truncated)
+
+
+def update_job_digest(job_id: int, digest: str):
+  """Stores the structured digest (JSON) extracted from a job posting's content."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+      UPDATE job_postings
+      SET digest = ?
+      WHERE id = ?
+      """,
+      (digest, job_id),
+    )
+    conn.commit()
+
+
+def get_job_digests(job_ids: List[int]) -> Dict[int, str]:
+  """Fetches the stored digests (JSON) for the given job posting IDs."""
+  if not job_ids:
+    return {}
+
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    placeholders = ",".join("?" for _ in job_ids)
+    cursor.execute(
+      f"""
+      SELECT id, digest
+      FROM job_postings
+      WHERE id IN ({placeholders}) AND digest IS NOT NULL
+      """,
+      job_ids,
+    )
+    return {row["id"]: row["digest"] for row in cursor.fetchall()}
+
+
+def get_expired_job_postings(
+  days: int, after_id: int = 0, limit: int = SELECT_CHUNK_SIZE
+) -> List[Dict]:
+  """
+  Fetches up to `limit` full rows of postings older than N days, for archival.
+
+  A posting expires when it was saved, or posted (if posted_at is a parsed
+  date), more than `days` days ago. Rows are returned in id order starting
+  after `after_id`.
+  """
+  cutoff = f"-{days} days"
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+      SELECT *
+      FROM job_postings
+      WHERE id > ?
+        AND (
+          created_at < datetime('now', ?)
+          OR (
+            posted_at GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+            AND posted_at < datetime('now', ?)
+          )
+        )
+      ORDER BY id
+      LIMIT ?
+      """,
+      (after_id, cutoff, cutoff, limit),
+    )
+    return [dict(row) for row in cursor.fetchall()]
+
+
+def delete_job_postings(job_ids: List[int]) -> int:
+  """Deletes job postings and their delivery queue entries in one transaction."""
+  deleted = 0
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    for chunk in _chunked(job_ids, SELECT_CHUNK_SIZE):
+      placeholders = ",".join("?" for _ in chunk)
+      cursor.execute(
+        f"DELETE FROM job_postings_users_map WHERE job_posting_id IN ({placeholders})",
+        chunk,
+      )
+      cursor.execute(f"DELETE FROM job_postings WHERE id IN ({placeholders})", chunk)
+      deleted += cursor.rowcount
+    conn.commit()
+  return deleted
+
+
 def delete_all_job_postings():
   """Deletes all records from the job_postings table."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute("DELETE FROM job_postings")
     conn.commit()
@@ -1,20 +1,16 @@
-import sqlite3
-from typing import List
+import json
+from typing import Dict, List, Optional
+from src.core.schemas.job_posting import JobPosting
 from src.core.schemas.job_posting_user_map import JobPostingUserMap
-from src.core.database.config import DB_FILE
-
-
-def _get_db_connection():
-  """Internal function to get a database connection."""
-  conn = sqlite3.connect(DB_FILE)
-  conn.row_factory = sqlite3.Row
-  return conn
+from src.core.database.connection import get_db_connection
+from src.core.database.job_postings import CLAIM_LEASE_SECONDS, get_job_posting_by_id
+from src.core.database.migrations import add_column_if_missing
 
 
 def init_job_postings_users_map_db():
   """Initializes the job_postings_users_map table if it doesn't exist."""
   print("--- Initializing Job Postings Users Map Storage ---")
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute("""
             CREATE TABLE IF NOT EXISTS job_postings_users_map (
@@ -25,13 +21,21 @@ def init_job_postings_users_map_db():
                 FOREIGN KEY (job_posting_id) REFERENCES job_postings(id) ON DELETE CASCADE
             )
         """)
+    # Each row is a delivery queue entry: undelivered until delivered_at is set
+    add_column_if_missing(
+      conn, "job_postings_users_map", "delivered_at", "TIMESTAMP NULL"
+    )
+    add_column_if_missing(conn, "job_postings_users_map", "analysis_id", "TEXT")
+    add_column_if_missing(
+      conn, "job_postings_users_map", "claimed_at", "TIMESTAMP NULL"
+    )
     conn.commit()
   print("Job Postings Users Map storage initialized successfully.")
 
 
 def save_job_posting_user_map(mapping: JobPostingUserMap):
   """Saves a job posting and user mapping."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
@@ -43,9 +47,147 @@ def save_job_posting_user_map(mapping: JobPostingUserMap):
     conn.commit()
 
 
+def enqueue_job_postings(
+  job_posting_ids: List[int], user_ids: Optional[List[str]] = None
+) -> int:
+  """
+  Queues job postings for delivery to users, in a single statement.
+
+  Postings are queued for every user unless `user_ids` is given; entries that
+  already exist are left untouched. Returns the number of entries queued.
+  """
+  if not job_posting_ids:
+    return 0
+
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    if user_ids is None:
+      cursor.execute(
+        """
+        INSERT OR IGNORE INTO job_postings_users_map (user_id, job_posting_id)
+        SELECT users.id, postings.value
+        FROM users, json_each(?) AS postings
+        """,
+        (json.dumps(job_posting_ids),),
+      )
+    else:
+      cursor.execute(
+        """
+        INSERT OR IGNORE INTO job_postings_users_map (user_id, job_posting_id)
+        SELECT queued_users.value, postings.value
+        FROM json_each(?) AS queued_users, json_each(?) AS postings
+        """,
+        (json.dumps(user_ids), json.dumps(job_posting_ids)),
+      )
+    queued = cursor.rowcount
+    conn.commit()
+  return queued
+
+
+def claim_next_job_posting_for_user(
+  user_id: str, lease_seconds: int = CLAIM_LEASE_SECONDS
+) -> Optional[JobPosting]:
+  """
+  Atomically claims the oldest job posting not yet delivered to a user.
+
+  Like claim_next_job_posting, the claim is a lease that expires after
+  `lease_seconds`. Call mark_job_posting_delivered when done, or
+  release_user_job_posting to give it back early.
+  """
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+      UPDATE job_postings_users_map
+      SET claimed_at = CURRENT_TIMESTAMP
+      WHERE user_id = ?
+        AND job_posting_id = (
+          SELECT job_posting_id
+          FROM job_postings_users_map
+          WHERE user_id = ?
+            AND delivered_at IS NULL
+            AND (claimed_at IS NULL OR claimed_at <= datetime('now', ?))
+          ORDER BY job_posting_id ASC
+          LIMIT 1
+        )
+      RETURNING job_posting_id
+      """,
+      (user_id, user_id, f"-{lease_seconds} seconds"),
+    )
+    rows = cursor.fetchall()
+    conn.commit()
+  if rows:
+    return get_job_posting_by_id(rows[0]["job_posting_id"])
+  return None
+
+
+def mark_job_posting_delivered(
+  user_id: str, job_posting_id: int, analysis_id: Optional[str] = None
+):
+  """Marks a job posting as delivered to a user, with the analysis sent for it."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+      INSERT INTO job_postings_users_map (user_id, job_posting_id, delivered_at, analysis_id)
+      VALUES (?, ?, CURRENT_TIMESTAMP, ?)
+      ON CONFLICT(user_id, job_posting_id) DO UPDATE
+      SET delivered_at = excluded.delivered_at,
+          analysis_id = excluded.analysis_id,
+          claimed_at = NULL
+      """,
+      (user_id, job_posting_id, analysis_id),
+    )
+    conn.commit()
+
+
+def release_user_job_posting(user_id: str, job_posting_id: int):
+  """Releases a user's claimed job posting so it can be claimed again."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+      UPDATE job_postings_users_map
+      SET claimed_at = NULL
+      WHERE user_id = ? AND job_posting_id = ?
+      """,
+      (user_id, job_posting_id),
+    )
+    conn.commit()
+
+
+def reset_user_deliveries(user_id: str):
+  """Marks every job posting queued for a user as undelivered again."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+      UPDATE job_postings_users_map
+      SET delivered_at = NULL, analysis_id = NULL, claimed_at = NULL
+      WHERE user_id = ? AND delivered_at IS NOT NULL
+      """,
+      (user_id,),
+    )
+    conn.commit()
+
+
+def get_analysis_ids() -> Dict[str, int]:
+  """Fetches the analysis IDs (report file names) recorded for deliveries, with their job posting ID."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+      SELECT analysis_id, job_posting_id
+      FROM job_postings_users_map
+      WHERE analysis_id IS NOT NULL
+      """
+    )
+    return {row["analysis_id"]: row["job_posting_id"] for row in cursor.fetchall()}
+
+
 def get_job_postings_by_user(user_id: int) -> List[int]:
   """Fetches all job posting IDs associated with a user."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
@@ -60,7 +202,7 @@ def get_job_postings_by_user(user_id: int) -> List[int]:
 
 def get_users_by_job_posting(job_posting_id: int) -> List[int]:
   """Fetches all user IDs associated with a job posting."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
@@ -75,7 +217,7 @@ def get_users_by_job_posting(job_posting_id: int) -> List[int]:
 
 def delete_job_posting_user_map(user_id: int, job_posting_id: int):
   """Deletes a specific user-job posting mapping."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
@@ -0,0 +1,28 @@
+from typing import Optional
+from src.core.database.connection import get_db_connection
+
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+def compact_database(max_pages: Optional[int] = None) -> int:
+  """
+  Returns free pages to the filesystem with an incremental vacuum.
+
+  Databases created before auto_vacuum was enabled are converted once with a
+  full VACUUM. Frees at most `max_pages` pages (all free pages if None) and
+  returns the number of pages freed.
+  """
+  conn = get_db_connection()
+  auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+  if auto_vacuum != AUTO_VACUUM_INCREMENTAL:
+    print("Enabling incremental auto_vacuum (one-time full VACUUM)...")
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("VACUUM")
+
+  free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+  # executescript steps the pragma to completion; execute frees a single page
+  pages = 0 if max_pages is None else int(max_pages)
+  conn.executescript(f"PRAGMA incremental_vacuum({pages});")
+  freed = free_pages - conn.execute("PRAGMA freelist_count").fetchone()[0]
+  print(f"Incremental vacuum freed {freed} pages.")
+  return freed
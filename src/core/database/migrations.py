@@ -0,0 +1,157 @@
+import sqlite3
+from typing import List, Tuple
+from src.core.database import config
+from src.core.database.connection import get_db_connection
+
+# Versioned schema migrations, applied in order after the tables are created.
+# PRAGMA user_version stores the last applied version.
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+  (
+    1,
+    "Index hot query columns",
+    [
+      # get_unread_job_posting: WHERE read_at IS NULL ORDER BY created_at
+      """
+      CREATE INDEX IF NOT EXISTS idx_job_postings_unread
+      ON job_postings(created_at) WHERE read_at IS NULL
+      """,
+      # list_job_postings: ORDER BY created_at DESC, id DESC. The index stores
+      # (created_at, rowid), so pages need no sort; not covering, the listed
+      # columns are read from the table
+      """
+      CREATE INDEX IF NOT EXISTS idx_job_postings_created_at
+      ON job_postings(created_at)
+      """,
+      # get_resume_sources_by_user / get_resume_source_by_hash
+      """
+      CREATE INDEX IF NOT EXISTS idx_resume_sources_user_hash
+      ON resume_sources(user_id, content_hash)
+      """,
+      # get_users_by_job_posting (user_id lookups use the primary key)
+      """
+      CREATE INDEX IF NOT EXISTS idx_job_postings_users_map_job_posting
+      ON job_postings_users_map(job_posting_id)
+      """,
+    ],
+  ),
+  (
+    2,
+    "Full-text search index over job postings",
+    [
+      # rowid = job_postings.id; body holds the content doc text (or the
+      # listing description until the content doc has been scraped)
+      """
+      CREATE VIRTUAL TABLE IF NOT EXISTS job_postings_fts USING fts5(
+        title, company, location, body,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+      )
+      """,
+      # Default ranking: matches in the title weigh most, then company, location, body
+      """
+      INSERT INTO job_postings_fts(job_postings_fts, rank)
+      VALUES ('rank', 'bm25(10.0, 5.0, 2.0, 1.0)')
+      """,
+      # Keep the index in sync with inserts (save_job_postings) and deletes
+      """
+      CREATE TRIGGER IF NOT EXISTS job_postings_fts_insert
+      AFTER INSERT ON job_postings BEGIN
+        INSERT INTO job_postings_fts(rowid, title, company, location, body)
+        VALUES (new.id, new.title, new.company, new.location, COALESCE(new.description, ''));
+      END
+      """,
+      """
+      CREATE TRIGGER IF NOT EXISTS job_postings_fts_update
+      AFTER UPDATE OF title, company, location ON job_postings BEGIN
+        UPDATE job_postings_fts
+        SET title = new.title, company = new.company, location = new.location
+        WHERE rowid = new.id;
+      END
+      """,
+      """
+      CREATE TRIGGER IF NOT EXISTS job_postings_fts_delete
+      AFTER DELETE ON job_postings BEGIN
+        DELETE FROM job_postings_fts WHERE rowid = old.id;
+      END
+      """,
+      # Backfill; content docs of existing postings are indexed by
+      # src.core.services.job_search.search_index.reindex_content_docs
+      """
+      INSERT INTO job_postings_fts(rowid, title, company, location, body)
+      SELECT id, title, company, location, COALESCE(description, '')
+      FROM job_postings
+      """,
+    ],
+  ),
+  (
+    3,
+    "Index per-user delivery queue",
+    [
+      # claim_next_job_posting_for_user: WHERE user_id = ? AND delivered_at IS NULL
+      # ORDER BY job_posting_id
+      """
+      CREATE INDEX IF NOT EXISTS idx_job_postings_users_map_undelivered
+      ON job_postings_users_map(user_id, job_posting_id) WHERE delivered_at IS NULL
+      """,
+      # Queue the recent postings for every existing user; afterwards scraping
+      # and save_user keep the queue filled
+      f"""
+      INSERT OR IGNORE INTO job_postings_users_map (user_id, job_posting_id)
+      SELECT users.id, job_postings.id
+      FROM users CROSS JOIN job_postings
+      WHERE job_postings.created_at >= datetime('now', '-{config.QUEUE_BACKFILL_DAYS} days')
+      """,
+    ],
+  ),
+  (
+    4,
+    "Make resume sources unique per user and content",
+    [
+      # Keep the first of any duplicates left by concurrent uploads
+      """
+      DELETE FROM resume_sources
+      WHERE content_hash IS NOT NULL AND id NOT IN (
+        SELECT MIN(id) FROM resume_sources
+        WHERE content_hash IS NOT NULL
+        GROUP BY user_id, content_hash
+      )
+      """,
+      # save_resume_source: ON CONFLICT(user_id, content_hash) DO NOTHING
+      """
+      CREATE UNIQUE INDEX IF NOT EXISTS idx_resume_sources_user_hash_unique
+      ON resume_sources(user_id, content_hash)
+      """,
+      # Superseded by the unique index on the same columns
+      "DROP INDEX IF EXISTS idx_resume_sources_user_hash",
+    ],
+  ),
+]
+
+
+def add_column_if_missing(
+  conn: sqlite3.Connection, table: str, column: str, definition: str
+):
+  """Adds a column to an existing table if it is not present yet."""
+  cursor = conn.cursor()
+  cursor.execute(f"PRAGMA table_info({table})")
+  columns = {row[1] for row in cursor.fetchall()}
+  if column not in columns:
+    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    print(f"Added column {table}.{column}")
+
+
+def apply_migrations():
+  """Applies the migrations newer than the database's user_version."""
+  print("--- Applying Database Migrations ---")
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    current_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+    for version, description, statements in MIGRATIONS:
+      if version <= current_version:
+        continue
+      for statement in statements:
+        cursor.execute(statement)
+      cursor.execute(f"PRAGMA user_version = {version}")
+      conn.commit()
+      print(f"Applied migration {version}: {description}")
+  print("Database migrations are up to date.")
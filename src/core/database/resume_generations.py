@@ -0,0 +1,67 @@
+from typing import Optional, Tuple
+from src.core.database.connection import get_db_connection
+
+
+def init_resume_generations_db():
+  """Initializes the resume_generations table if it doesn't exist."""
+  print("--- Initializing Resume Generations Storage ---")
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute("""
+            CREATE TABLE IF NOT EXISTS resume_generations (
+                cache_key TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                job_target TEXT,
+                model TEXT NOT NULL,
+                plan TEXT NOT NULL,
+                final_resume TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+            )
+        """)
+    conn.commit()
+  print("Resume Generations storage initialized successfully.")
+
+
+def get_resume_generation(cache_key: str) -> Optional[Tuple[str, str]]:
+  """Fetches the cached (plan, final_resume) for a cache key."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+            SELECT plan, final_resume
+            FROM resume_generations
+            WHERE cache_key = ?
+            """,
+      (cache_key,),
+    )
+    row = cursor.fetchone()
+    if row:
+      return row["plan"], row["final_resume"]
+    return None
+
+
+def save_resume_generation(
+  cache_key: str,
+  user_id: str,
+  job_target: str,
+  model: str,
+  plan: str,
+  final_resume: str,
+):
+  """Stores a generated plan and resume under their cache key."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+            INSERT OR REPLACE INTO resume_generations
+                (cache_key, user_id, job_target, model, plan, final_resume)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+      (cache_key, user_id, job_target, model, plan, final_resume),
+    )
+    conn.commit()
+
+
+if __name__ == "__main__":
+  init_resume_generations_db()
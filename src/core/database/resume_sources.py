@@ -1,20 +1,13 @@
-import sqlite3
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.core.schemas.resume_source import ResumeSource
-from src.core.database.config import DB_FILE
-
-
-def _get_db_connection():
-  """Internal function to get a database connection."""
-  conn = sqlite3.connect(DB_FILE)
-  conn.row_factory = sqlite3.Row
-  return conn
+from src.core.database.connection import get_db_connection
+from src.core.database.migrations import add_column_if_missing
 
 
 def init_resume_sources_db():
   """Initializes the resume_sources table if it doesn't exist."""
   print("--- Initializing Resume Sources Storage ---")
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute("""
             CREATE TABLE IF NOT EXISTS resume_sources (
@@ -25,36 +18,64 @@ def init_resume_sources_db():
                 FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
             )
         """)
+    add_column_if_missing(conn, "resume_sources", "content_hash", "TEXT")
+    cursor.execute("""
+            CREATE TABLE IF NOT EXISTS resume_source_summaries (
+                content_hash TEXT NOT NULL,
+                model TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (content_hash, model)
+            )
+        """)
     conn.commit()
   print("Resume Sources storage initialized successfully.")
 
 
-def save_resume_source(resume_source: ResumeSource):
-  """Saves a resume source to the database."""
-  with _get_db_connection() as conn:
+def save_resume_source(resume_source: ResumeSource) -> int:
+  """
+  Saves a resume source to the database and returns its ID.
+
+  A user uploads each content hash once: if the user already has a source with
+  the same hash (e.g. saved by a concurrent upload), its ID is returned instead.
+  """
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
-            INSERT INTO resume_sources (user_id, source_file_name, original_file_name)
-            VALUES (?, ?, ?)
+            INSERT INTO resume_sources (user_id, source_file_name, original_file_name, content_hash)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(user_id, content_hash) DO NOTHING
+            RETURNING id
             """,
       (
         resume_source.user_id,
         resume_source.source_file_name,
         resume_source.original_file_name,
+        resume_source.content_hash,
       ),
     )
+    row = cursor.fetchone()
+    if row is None:
+      cursor.execute(
+        """
+            SELECT id FROM resume_sources
+            WHERE user_id = ? AND content_hash = ?
+            """,
+        (resume_source.user_id, resume_source.content_hash),
+      )
+      row = cursor.fetchone()
     conn.commit()
-    return cursor.lastrowid
+    return row["id"]
 
 
 def get_resume_sources_by_user(user_id: str) -> List[ResumeSource]:
   """Fetches all resume sources for a given user."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
-            SELECT id, user_id, source_file_name, original_file_name
+            SELECT id, user_id, source_file_name, original_file_name, content_hash
             FROM resume_sources
             WHERE user_id = ?
             """,
@@ -67,6 +88,7 @@ def get_resume_sources_by_user(user_id: str) -> List[ResumeSource]:
         user_id=row["user_id"],
         source_file_name=row["source_file_name"],
         original_file_name=row["original_file_name"],
+        content_hash=row["content_hash"],
       )
       for row in rows
     ]
@@ -74,11 +96,11 @@ def get_resume_sources_by_user(user_id: str) -> List[ResumeSource]:
 
 def get_resume_source_by_id(resume_source_id: int) -> Optional[ResumeSource]:
   """Fetches a resume source by ID."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
-            SELECT id, user_id, source_file_name, original_file_name
+            SELECT id, user_id, source_file_name, original_file_name, content_hash
             FROM resume_sources
             WHERE id = ?
             """,
@@ -91,27 +113,91 @@ def get_resume_source_by_id(resume_source_id: int) -> Optional[ResumeSource]:
         user_id=row["user_id"],
         source_file_name=row["source_file_name"],
         original_file_name=row["original_file_name"],
+        content_hash=row["content_hash"],
+      )
+    return None
+
+
+def get_resume_source_by_hash(
+  user_id: str, content_hash: str
+) -> Optional[ResumeSource]:
+  """Fetches a user's resume source uploaded with the given content hash."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+            SELECT id, user_id, source_file_name, original_file_name, content_hash
+            FROM resume_sources
+            WHERE user_id = ? AND content_hash = ?
+            LIMIT 1
+            """,
+      (user_id, content_hash),
+    )
+    row = cursor.fetchone()
+    if row:
+      return ResumeSource(
+        id=row["id"],
+        user_id=row["user_id"],
+        source_file_name=row["source_file_name"],
+        original_file_name=row["original_file_name"],
+        content_hash=row["content_hash"],
       )
     return None
 
 
 def get_resume_source_content_by_id(resume_source_id: int) -> Optional[str]:
   """Fetches the content of a resume source by ID."""
-  from src.core.file_storage.file_manager import FileManager
+  from src.core.file_storage.storage import get_storage
   from pathlib import Path
 
   resume_source = get_resume_source_by_id(resume_source_id)
   if not resume_source:
     return None
 
-  file_manager = FileManager()
-  content = file_manager.read_file_sync(Path(resume_source.source_file_name))
+  content = get_storage().file_manager.read_file_sync(
+    Path(resume_source.source_file_name)
+  )
   return content
 
 
+def get_resume_source_summaries(
+  content_hashes: List[str], model: str
+) -> Dict[str, str]:
+  """Fetches cached source summaries for the given content hashes and model."""
+  if not content_hashes:
+    return {}
+
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    placeholders = ",".join("?" for _ in content_hashes)
+    cursor.execute(
+      f"""
+            SELECT content_hash, summary
+            FROM resume_source_summaries
+            WHERE model = ? AND content_hash IN ({placeholders})
+            """,
+      [model, *content_hashes],
+    )
+    return {row["content_hash"]: row["summary"] for row in cursor.fetchall()}
+
+
+def save_resume_source_summary(content_hash: str, model: str, summary: str):
+  """Caches the summary of a source text keyed by its content hash and model."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+            INSERT OR REPLACE INTO resume_source_summaries (content_hash, model, summary)
+            VALUES (?, ?, ?)
+            """,
+      (content_hash, model, summary),
+    )
+    conn.commit()
+
+
 def delete_resume_source(resume_source_id: int):
   """Deletes a resume source by ID."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
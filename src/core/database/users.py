@@ -1,20 +1,15 @@
-import sqlite3
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from src.core.schemas.user import User, UserCreate
-from src.core.database.config import DB_FILE
-
-
-def _get_db_connection():
-  """Internal function to get a database connection."""
-  conn = sqlite3.connect(DB_FILE)
-  conn.row_factory = sqlite3.Row
-  return conn
+from src.core.database.connection import get_db_connection
+from src.core.database.job_postings import get_recent_job_posting_ids
+from src.core.database.job_postings_users_map import enqueue_job_postings
+from src.core.database.migrations import add_column_if_missing
 
 
 def remove_all_users():
   """Removes all users from the database."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute("DELETE FROM users")
     conn.commit()
@@ -24,7 +19,7 @@ def remove_all_users():
 def init_users_db():
   """Initializes the users table if it doesn't exist."""
   print("--- Initializing Users Storage ---")
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute("""
             CREATE TABLE IF NOT EXISTS users (
@@ -34,13 +29,15 @@ def init_users_db():
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+    add_column_if_missing(conn, "users", "resume_digest", "TEXT")
+    add_column_if_missing(conn, "users", "resume_digest_hash", "TEXT")
     conn.commit()
   print("Users storage initialized successfully.")
 
 
 def save_user(user: UserCreate) -> User:
-  """Saves a single user to the database."""
-  with _get_db_connection() as conn:
+  """Saves a single user to the database and queues the recent job postings for them."""
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     user_id = str(uuid.uuid4())
     cursor.execute(
@@ -51,12 +48,13 @@ def save_user(user: UserCreate) -> User:
       (user_id, user.name, user.resume_file),
     )
     conn.commit()
-    return get_user_by_id(user_id)
+  enqueue_job_postings(get_recent_job_posting_ids(), [user_id])
+  return get_user_by_id(user_id)
 
 
 def get_user_by_id(user_id: str) -> Optional[User]:
   """Fetches a user by ID."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
@@ -79,7 +77,7 @@ def get_user_by_id(user_id: str) -> Optional[User]:
 
 def get_all_users() -> List[User]:
   """Fetches all users from the database."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
@@ -104,7 +102,7 @@ def update_user(
   user_id: str, name: Optional[str] = None, resume_file: Optional[str] = None
 ):
   """Updates user information."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     updates = []
     params = []
@@ -121,9 +119,42 @@ def update_user(
       conn.commit()
 
 
+def get_user_resume_digest(user_id: str) -> Optional[Tuple[str, str]]:
+  """Fetches the stored resume digest and the content hash it was built from."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+            SELECT resume_digest, resume_digest_hash
+            FROM users
+            WHERE id = ?
+            """,
+      (user_id,),
+    )
+    row = cursor.fetchone()
+    if row and row["resume_digest"] and row["resume_digest_hash"]:
+      return row["resume_digest"], row["resume_digest_hash"]
+    return None
+
+
+def update_user_resume_digest(user_id: str, resume_digest: str, content_hash: str):
+  """Stores the resume digest for a user keyed by the resume content hash."""
+  with get_db_connection() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+      """
+            UPDATE users
+            SET resume_digest = ?, resume_digest_hash = ?
+            WHERE id = ?
+            """,
+      (resume_digest, content_hash, user_id),
+    )
+    conn.commit()
+
+
 def delete_user(user_id: str):
   """Deletes a user by ID."""
-  with _get_db_connection() as conn:
+  with get_db_connection() as conn:
     cursor = conn.cursor()
     cursor.execute(
       """
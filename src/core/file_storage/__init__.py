@@ -1,4 +1,13 @@
+from .cache import FileContentCache, shared_file_cache
 from .file_manager import FileManager
 from .paths import FileStoragePaths
+from .storage import StorageContext, get_storage
 
-__all__ = ["FileManager", "FileStoragePaths"]
+__all__ = [
+  "FileContentCache",
+  "FileManager",
+  "FileStoragePaths",
+  "StorageContext",
+  "get_storage",
+  "shared_file_cache",
+]
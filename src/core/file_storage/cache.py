@@ -0,0 +1,95 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+FILE_CACHE_MAX_BYTES = int(os.getenv("FILE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+class _CacheEntry(NamedTuple):
+  mtime_ns: int
+  size: int
+  content: str
+  nbytes: int
+
+
+class FileContentCache:
+  """
+  Bounded in-memory LRU of decoded file contents, keyed by path.
+
+  Entries are validated against the file's mtime and size on every lookup, so
+  a file changed by another process is re-read. The bound is on the memory
+  held by the cached strings; a single file larger than a quarter of it is not
+  cached. Thread-safe, since FileManager reads run in executor threads.
+  """
+
+  def __init__(self, max_bytes: int = FILE_CACHE_MAX_BYTES):
+    self.max_bytes = max_bytes
+    self.max_entry_bytes = max_bytes // 4
+    self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+    self._bytes = 0
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def get(self, file_path: Path, stat: os.stat_result) -> Optional[str]:
+    """Returns the cached content if it is still current for `stat`."""
+    key = str(file_path)
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.content
+      if entry:
+        self._remove(key)
+      self.misses += 1
+      return None
+
+  def put(self, file_path: Path, stat: os.stat_result, content: str):
+    """Caches content read from a file whose stat was taken before reading."""
+    nbytes = sys.getsizeof(content)
+    if nbytes > self.max_entry_bytes:
+      return
+    key = str(file_path)
+    with self._lock:
+      if key in self._entries:
+        self._remove(key)
+      self._entries[key] = _CacheEntry(stat.st_mtime_ns, stat.st_size, content, nbytes)
+      self._bytes += nbytes
+      while self._bytes > self.max_bytes:
+        self._remove(next(iter(self._entries)))
+        self.evictions += 1
+
+  def invalidate(self, file_path: Path):
+    """Drops a path from the cache, e.g. after writing to it."""
+    with self._lock:
+      self._remove(str(file_path))
+
+  def clear(self):
+    with self._lock:
+      self._entries.clear()
+      self._bytes = 0
+
+  def stats(self) -> Dict[str, int]:
+    """Returns hit/miss/eviction counters and the current size."""
+    with self._lock:
+      return {
+        "hits": self.hits,
+        "misses": self.misses,
+        "evictions": self.evictions,
+        "entries": len(self._entries),
+        "bytes": self._bytes,
+      }
+
+  def _remove(self, key: str):
+    entry = self._entries.pop(key, None)
+    if entry:
+      self._bytes -= entry.nbytes
+
+
+# Shared by the FileManagers on hot read paths (resumes, job content docs)
+shared_file_cache = FileContentCache()
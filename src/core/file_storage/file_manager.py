@@ -1,25 +1,95 @@
 import asyncio
+import gzip
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import IO, AsyncIterable, Iterator, Optional
+from src.core.file_storage.cache import FileContentCache
+
+
+def _open_text(
+  file_path: Path, mode: str, compressed: Optional[bool] = None
+) -> IO[str]:
+  """Opens a text file, transparently (de)compressing `.gz` files."""
+  if compressed is None:
+    compressed = file_path.suffix == ".gz"
+  if compressed:
+    return gzip.open(file_path, f"{mode}t", encoding="utf-8")
+  return open(file_path, mode, encoding="utf-8")
+
+
+def _temp_path(file_path: Path) -> Path:
+  """Creates an empty temp file next to file_path, on the same filesystem."""
+  file_path.parent.mkdir(parents=True, exist_ok=True)
+  fd, temp_name = tempfile.mkstemp(
+    prefix=f".{file_path.name}.", suffix=".tmp", dir=file_path.parent
+  )
+  os.fchmod(fd, 0o644)  # mkstemp creates 0600; match a regular open()
+  os.close(fd)
+  return Path(temp_name)
+
+
+@contextmanager
+def _atomic_open(file_path: Path, mode: str) -> Iterator[IO]:
+  """
+  Opens a temp file that replaces file_path when the block exits cleanly.
+
+  Readers never see a partially written file, and a failed write leaves the
+  previous content in place.
+  """
+  temp_path = _temp_path(file_path)
+  try:
+    if "b" in mode:
+      f = open(temp_path, mode)
+    else:
+      f = _open_text(temp_path, mode, compressed=file_path.suffix == ".gz")
+    with f:
+      yield f
+    os.replace(temp_path, file_path)
+  except BaseException:
+    temp_path.unlink(missing_ok=True)
+    raise
 
 
 class FileManager:
-  """Utility class for file I/O operations."""
+  """Utility class for file I/O operations. Files ending in `.gz` are gzip-compressed."""
 
-  def __init__(self, paths="FileStoragePaths"):
+  def __init__(
+    self, paths="FileStoragePaths", cache: Optional[FileContentCache] = None
+  ):
     self.paths = paths
+    self.cache = cache
 
-  async def read_file_async(self, file_path: Path) -> Optional[str]:
-    """Read file content asynchronously."""
+  def _read_text(self, file_path: Path) -> Optional[str]:
+    """Reads a text file through the cache, if any; None if it doesn't exist."""
     try:
-      if not file_path.exists():
-        return None
+      stat = file_path.stat()
+    except FileNotFoundError:
+      return None
 
-      def _read():
-        with open(file_path, "r", encoding="utf-8") as f:
-          return f.read()
+    if self.cache is not None:
+      cached = self.cache.get(file_path, stat)
+      if cached is not None:
+        return cached
 
-      return await asyncio.get_event_loop().run_in_executor(None, _read)
+    with _open_text(file_path, "r") as f:
+      content = f.read()
+    if self.cache is not None:
+      self.cache.put(file_path, stat, content)
+    return content
+
+  def _invalidate(self, file_path: Path):
+    if self.cache is not None:
+      self.cache.invalidate(file_path)
+
+  async def read_file_async(self, file_path: Path) -> Optional[str]:
+    """Read file content asynchronously."""
+    try:
+      return await asyncio.get_event_loop().run_in_executor(
+        None, self._read_text, file_path
+      )
     except Exception as e:
       print(f"Error reading file {file_path}: {e}")
       return None
@@ -29,11 +99,7 @@ class FileManager:
     try:
       if isinstance(file_path, str):
         file_path = Path(file_path)
-      if not file_path.exists():
-        return None
-
-      with open(file_path, "r", encoding="utf-8") as f:
-        return f.read()
+      return self._read_text(file_path)
     except Exception as e:
       print(f"Error reading file {file_path}: {e}")
       return None
@@ -43,11 +109,11 @@ class FileManager:
     try:
 
       def _write():
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
+        with _atomic_open(file_path, "w") as f:
           f.write(content)
 
       await asyncio.get_event_loop().run_in_executor(None, _write)
+      self._invalidate(file_path)
       return True
     except Exception as e:
       print(f"Error writing file {file_path}: {e}")
@@ -56,9 +122,9 @@ class FileManager:
   def write_file_sync(self, file_path: Path, content: str) -> bool:
     """Write content to file synchronously."""
     try:
-      file_path.parent.mkdir(parents=True, exist_ok=True)
-      with open(file_path, "w", encoding="utf-8") as f:
+      with _atomic_open(file_path, "w") as f:
         f.write(content)
+      self._invalidate(file_path)
       return True
     except Exception as e:
       print(f"Error writing file {file_path}: {e}")
@@ -66,14 +132,50 @@ class FileManager:
 
   def write_binary_file(self, file_path: Path, content: bytes) -> bool:
     try:
-      file_path.parent.mkdir(parents=True, exist_ok=True)
-      with open(file_path, "wb") as f:
+      with _atomic_open(file_path, "wb") as f:
         f.write(content)
+      self._invalidate(file_path)
       return True
     except Exception as e:
       print(f"Error writing binary file {file_path}: {e}")
       return False
 
+  async def write_stream_async(
+    self,
+    file_path: Path,
+    chunks: AsyncIterable[bytes],
+    max_size: Optional[int] = None,
+  ) -> str:
+    """
+    Stream binary chunks to a file, hashing them on the fly.
+
+    The chunks go to a temp file that replaces file_path once complete. Returns
+    the SHA-256 hex digest of the written content. Raises ValueError, leaving
+    file_path untouched, if the content exceeds max_size bytes.
+    """
+    loop = asyncio.get_running_loop()
+    digest = hashlib.sha256()
+    size = 0
+
+    temp_path = await loop.run_in_executor(None, _temp_path, file_path)
+    try:
+      f = await loop.run_in_executor(None, open, temp_path, "wb")
+      try:
+        async for chunk in chunks:
+          size += len(chunk)
+          if max_size is not None and size > max_size:
+            raise ValueError(f"File exceeds the maximum size of {max_size} bytes")
+          digest.update(chunk)
+          await loop.run_in_executor(None, f.write, chunk)
+      finally:
+        f.close()
+      os.replace(temp_path, file_path)
+    except BaseException:
+      temp_path.unlink(missing_ok=True)
+      raise
+    self._invalidate(file_path)
+    return digest.hexdigest()
+
   def file_exists(self, file_path: Path) -> bool:
     """Check if file exists."""
     return file_path.exists()
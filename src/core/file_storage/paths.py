@@ -1,8 +1,17 @@
+import re
 from pathlib import Path
 
+# content_doc values that are SHA-256 hashes refer to the compressed blob store
+_CONTENT_HASH_PATTERN = re.compile(r"[0-9a-f]{64}")
+
 
 class FileStoragePaths:
-  """Centralized file storage path management."""
+  """
+  Centralized file storage path management.
+
+  Creating an instance creates the storage directories; use
+  src.core.file_storage.storage.get_storage() for the process-wide instance.
+  """
 
   def __init__(self, base_path: str = ".file_storage"):
     self.base_path = Path(base_path)
@@ -17,6 +26,8 @@ class FileStoragePaths:
       self.base_path / "job_postings",
       self.base_path / "prompts",
       self.base_path / "resume_sources",  # 이력서 소스 디렉토리 추가
+      self.base_path / "archive",
+      self.base_path / "uploads",
     ]
 
     for directory in directories:
@@ -47,6 +58,11 @@ class FileStoragePaths:
     """Directory for resume source files."""
     return self.base_path / "resume_sources"
 
+  @property
+  def archive_dir(self) -> Path:
+    """Directory for compressed archives of expired job postings."""
+    return self.base_path / "archive"
+
   @property
   def uploads_dir(self) -> Path:
     """Directory for uploaded files."""
@@ -62,7 +78,14 @@ class FileStoragePaths:
     return self.input_dir / filename
 
   def get_job_content_path(self, filename: str) -> Path:
-    """Get job posting content file path."""
+    """
+    Get job posting content file path.
+
+    A SHA-256 content hash maps to a gzip-compressed blob sharded by its first
+    two byte pairs (ab/cd/<hash>.md.gz); any other name is a legacy plain file.
+    """
+    if _CONTENT_HASH_PATTERN.fullmatch(filename):
+      return self.job_postings_dir / filename[:2] / filename[2:4] / f"{filename}.md.gz"
     return self.job_postings_dir / filename
 
   def get_output_report_path(self, prefix: str) -> Path:
@@ -0,0 +1,24 @@
+from functools import lru_cache
+from src.core.file_storage.cache import shared_file_cache
+from src.core.file_storage.file_manager import FileManager
+from src.core.file_storage.paths import FileStoragePaths
+
+
+class StorageContext:
+  """Process-wide file storage: the directory layout and the FileManager using it."""
+
+  def __init__(self, paths: FileStoragePaths, file_manager: FileManager):
+    self.paths = paths
+    self.file_manager = file_manager
+
+
+@lru_cache(maxsize=1)
+def get_storage() -> StorageContext:
+  """
+  Returns the process's storage context, creating it on first use.
+
+  The storage directories are created once here instead of every time paths
+  are needed; the FileManager shares the process-wide content cache.
+  """
+  paths = FileStoragePaths()
+  return StorageContext(paths, FileManager(paths, cache=shared_file_cache))
@@ -1,8 +1,15 @@
 from langchain.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from src.core.llm.providers import get_chat_model, get_summarization_model
+from src.core.llm.providers import (
+  CHAT_MODEL,
+  SUMMARIZATION_MODEL,
+  get_chat_model,
+  get_summarization_model,
+)
+from src.core.llm.prompt_builder import PromptBuilder
 from typing import TypedDict, List
 from src.core.schemas.job_posting import JobPosting
+from src.core.database import aio as db
 import json
 from pathlib import Path
 
@@ -102,14 +109,13 @@ async def get_job_ai_response(messages: List[MessageDict], job_info_context):
 
   messages_string = convert_messages_to_string(messages)
 
+  builder = PromptBuilder("job_chat", CHAT_MODEL, job_prompt_template.template)
+  builder.add_section("default_prompt", default_prompt, priority=2)
+  builder.add_section("job_context", context_string, priority=0)
+  builder.add_section("messages", messages_string, priority=1, keep="tail")
+
   try:
-    response = await job_llm_chain.ainvoke(
-      {
-        "default_prompt": default_prompt,
-        "job_context": context_string,
-        "messages": messages_string,
-      }
-    )
+    response = await job_llm_chain.ainvoke(builder.build())
     return response
   except Exception as e:
     print(f"Error calling LangChain LLM: {e}")
@@ -121,10 +127,12 @@ async def get_job_ai_response(messages: List[MessageDict], job_info_context):
 async def get_general_llm_response(messages: List[MessageDict]):
   messages_string = convert_messages_to_string(messages)
 
+  builder = PromptBuilder("general_chat", CHAT_MODEL, general_prompt_template.template)
+  builder.add_section("default_prompt", default_prompt, priority=1)
+  builder.add_section("messages", messages_string, priority=0, keep="tail")
+
   try:
-    response = await general_llm_chain.ainvoke(
-      {"default_prompt": default_prompt, "messages": messages_string}
-    )
+    response = await general_llm_chain.ainvoke(builder.build())
     return response
   except Exception as e:
     print(f"Error calling LangChain LLM: {e}")
@@ -138,8 +146,20 @@ async def get_summary_from_jobs(jobs: List[JobPosting]) -> str:
   llm = get_summarization_model()
   chain = summary_prompt_template | llm | StrOutputParser()
 
-  jobs_dict = [job.model_dump() for job in jobs]
+  # Prefer the digest extracted at scrape time over the full description
+  digests = await db.get_job_digests([job.id for job in jobs if job.id])
+  jobs_dict = []
+  for job in jobs:
+    job_dict = job.model_dump()
+    if job.id in digests:
+      job_dict["description"] = json.loads(digests[job.id])
+    jobs_dict.append(job_dict)
   jobs_str = json.dumps(jobs_dict, ensure_ascii=False)
 
-  summary = await chain.ainvoke({"jobs": jobs_str})
+  builder = PromptBuilder(
+    "job_summary", SUMMARIZATION_MODEL, summary_prompt_template.template
+  )
+  builder.add_section("jobs", jobs_str)
+
+  summary = await chain.ainvoke(builder.build())
   return summary
@@ -0,0 +1,174 @@
+import math
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+from src.core.llm.providers import get_prompt_token_budget
+
+TRUNCATION_MARKER = "\n...(truncated)...\n"
+
+
+def estimate_tokens(text: str) -> int:
+  """
+  Roughly estimates the token count of a text without a model tokenizer.
+
+  ASCII text averages about 4 characters per token, while Hangul and other
+  non-ASCII characters are much denser and are counted at 1.5 characters per token.
+  """
+  if not text:
+    return 0
+  ascii_chars = sum(1 for c in text if c.isascii())
+  return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars) / 1.5)
+
+
+def _truncate_to_tokens(text: str, max_tokens: int, keep: str) -> str:
+  """Cuts a text down to roughly max_tokens, keeping its head or its tail."""
+  if max_tokens <= estimate_tokens(TRUNCATION_MARKER):
+    return ""
+
+  length = int(len(text) * max_tokens / estimate_tokens(text))
+  while length > 0:
+    if keep == "tail":
+      truncated = TRUNCATION_MARKER + text[-length:]
+    else:
+      truncated = text[:length] + TRUNCATION_MARKER
+    if estimate_tokens(truncated) <= max_tokens:
+      return truncated
+    length = int(length * 0.9)
+  return ""
+
+
+class PromptSection(BaseModel):
+  """A named, truncatable part of a prompt."""
+
+  name: str = Field(description="Template variable the section is rendered into")
+  text: str = Field(default="", description="Section content")
+  priority: int = Field(
+    default=0, description="Sections with a lower priority are truncated first"
+  )
+  keep: Literal["head", "tail"] = Field(
+    default="head", description="Which end of the text survives truncation"
+  )
+
+
+class SectionUsage(BaseModel):
+  """Token usage of a single prompt section."""
+
+  name: str
+  original_tokens: int
+  kept_tokens: int
+
+
+class PromptBudgetReport(BaseModel):
+  """How a prompt was fitted into its model's token budget."""
+
+  call_name: str
+  model: str
+  budget: int
+  overhead_tokens: int
+  sections: List[SectionUsage] = Field(default_factory=list)
+
+  @property
+  def total_tokens(self) -> int:
+    return self.overhead_tokens + sum(s.kept_tokens for s in self.sections)
+
+  @property
+  def truncated_tokens(self) -> int:
+    return sum(s.original_tokens - s.kept_tokens for s in self.sections)
+
+
+# Per call name: number of calls, calls that needed truncation and tokens cut
+_truncation_stats: Dict[str, Dict[str, int]] = {}
+
+
+def get_truncation_stats() -> Dict[str, Dict[str, int]]:
+  """Returns the truncation counters recorded by PromptBuilder in this process."""
+  return {name: dict(stats) for name, stats in _truncation_stats.items()}
+
+
+class PromptBuilder:
+  """
+  Assembles prompt variables within a per-model token budget.
+
+  Sections are measured individually; when the prompt is over budget, sections
+  are truncated in ascending priority order until it fits. The result of each
+  build is recorded in `report` and in the process-wide truncation stats.
+  """
+
+  def __init__(
+    self,
+    call_name: str,
+    model: str,
+    template: str = "",
+    budget: Optional[int] = None,
+  ):
+    self.call_name = call_name
+    self.model = model
+    self.template = template
+    self.budget = budget if budget is not None else get_prompt_token_budget(model)
+    self.sections: List[PromptSection] = []
+    self.report: Optional[PromptBudgetReport] = None
+
+  def add_section(
+    self,
+    name: str,
+    text: Optional[str],
+    priority: int = 0,
+    keep: Literal["head", "tail"] = "head",
+  ) -> "PromptBuilder":
+    """Adds a section rendered into the template variable `name`."""
+    self.sections.append(
+      PromptSection(name=name, text=text or "", priority=priority, keep=keep)
+    )
+    return self
+
+  def build(self) -> Dict[str, str]:
+    """Returns the (possibly truncated) section texts keyed by variable name."""
+    overhead = estimate_tokens(self.template)
+    texts = {s.name: s.text for s in self.sections}
+    original = {s.name: estimate_tokens(s.text) for s in self.sections}
+    kept = dict(original)
+
+    excess = overhead + sum(kept.values()) - self.budget
+    for section in sorted(self.sections, key=lambda s: s.priority):
+      if excess <= 0:
+        break
+      target = max(kept[section.name] - excess, 0)
+      texts[section.name] = _truncate_to_tokens(section.text, target, section.keep)
+      new_tokens = estimate_tokens(texts[section.name])
+      excess -= kept[section.name] - new_tokens
+      kept[section.name] = new_tokens
+
+    self.report = PromptBudgetReport(
+      call_name=self.call_name,
+      model=self.model,
+      budget=self.budget,
+      overhead_tokens=overhead,
+      sections=[
+        SectionUsage(
+          name=s.name, original_tokens=original[s.name], kept_tokens=kept[s.name]
+        )
+        for s in self.sections
+      ],
+    )
+    self._record(self.report)
+    return texts
+
+  @staticmethod
+  def _record(report: PromptBudgetReport):
+    stats = _truncation_stats.setdefault(
+      report.call_name, {"calls": 0, "truncated_calls": 0, "tokens_cut": 0}
+    )
+    stats["calls"] += 1
+    if report.truncated_tokens <= 0:
+      return
+
+    stats["truncated_calls"] += 1
+    stats["tokens_cut"] += report.truncated_tokens
+    cut_sections = ", ".join(
+      f"{s.name} {s.original_tokens}->{s.kept_tokens}"
+      for s in report.sections
+      if s.kept_tokens < s.original_tokens
+    )
+    print(
+      f"Prompt budget [{report.call_name}]: cut {report.truncated_tokens} tokens "
+      f"to fit {report.budget} for {report.model} ({cut_sections})"
+    )
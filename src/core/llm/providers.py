@@ -1,3 +1,4 @@
+from functools import lru_cache
 from langchain_community.chat_models import ChatDeepInfra
 from langchain_core.rate_limiters import InMemoryRateLimiter
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -10,7 +11,26 @@ CHAT_MODEL = "gemini-2.5-flash"
 JOB_ANALYSIS_MODEL = "mistralai/Mistral-Small-3.2-24B-Instruct-2506"
 RESUME_GENERATION_MODEL = "gemini-2.5-flash-lite-preview-06-17"
 
+# Input token budgets per model, enforced by src.core.llm.prompt_builder
+DEFAULT_PROMPT_TOKEN_BUDGET = 30000
+PROMPT_TOKEN_BUDGETS = {
+  "gemini-2.5-flash": 100000,
+  "gemini-2.5-flash-lite-preview-06-17": 100000,
+  "mistralai/Mistral-Small-3.2-24B-Instruct-2506": 32000,
+}
 
+
+def get_prompt_token_budget(model: str) -> int:
+  """Returns the input token budget for the given model name."""
+  return PROMPT_TOKEN_BUDGETS.get(model, DEFAULT_PROMPT_TOKEN_BUDGET)
+
+
+# The model getters return one shared client per process: building a client
+# takes tens of milliseconds, and a shared rate limiter actually bounds the
+# request rate across callers.
+
+
+@lru_cache(maxsize=1)
 def get_chat_model():
   """Returns the configured chat model for general conversation."""
   limiter = InMemoryRateLimiter(
@@ -26,6 +46,7 @@ def get_chat_model():
   )
 
 
+@lru_cache(maxsize=1)
 def get_agent_model():
   """Returns the configured agent model."""
   limiter = InMemoryRateLimiter(
@@ -41,6 +62,7 @@ def get_agent_model():
   )
 
 
+@lru_cache(maxsize=1)
 def get_structured_output_model():
   """Returns the configured structured output model."""
   limiter = InMemoryRateLimiter(
@@ -56,6 +78,7 @@ def get_structured_output_model():
   )
 
 
+@lru_cache(maxsize=1)
 def get_summarization_model():
   """Returns the configured summarization model."""
   limiter = InMemoryRateLimiter(
@@ -68,6 +91,7 @@ def get_summarization_model():
   )
 
 
+@lru_cache(maxsize=1)
 def get_job_analysis_model():
   """Returns the configured job analysis model."""
   limiter = InMemoryRateLimiter(
@@ -84,6 +108,7 @@ def get_job_analysis_model():
   )
 
 
+@lru_cache(maxsize=1)
 def get_resume_generation_model():
   """Returns the configured resume generation model."""
   limiter = InMemoryRateLimiter(
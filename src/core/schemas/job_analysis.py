@@ -5,7 +5,16 @@ class JobAnalysisState(TypedDict):
   """Represents the state of the job analysis workflow."""
 
   resume_content: str  # Resume content
+  resume_digest: str  # Compact resume profile used instead of the raw text
+  use_full_resume: bool  # Send the raw resume instead of the digest
   detailed_job_info: str  # Detailed job information
+  job_digest: str  # Structured job summary used instead of the full posting text
+  use_full_job_posting: bool  # Send the full posting text instead of the digest
   analysis_result: str  # Analysis result as free-form text
+  analysis_failed: bool  # The analysis raised; analysis_result holds the error
   report_content: str  # Report content
+  report_file: str  # File name of the saved report, recorded as the delivered analysis
   user_id: str  # User ID of the person whose resume is being analyzed
+  job_posting_id: (
+    int  # Job posting to analyze; claims the next one queued for the user if unset
+  )
@@ -0,0 +1,22 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class JobDigest(BaseModel):
+  """A structured summary of a job posting used in place of the full page text."""
+
+  seniority: Optional[str] = Field(
+    default=None, description="Required seniority or years of experience"
+  )
+  location: Optional[str] = Field(
+    default=None, description="Work location and remote/hybrid policy"
+  )
+  requirements: List[str] = Field(
+    default_factory=list, description="Mandatory qualifications for the role"
+  )
+  preferred_skills: List[str] = Field(
+    default_factory=list, description="Preferred (nice-to-have) qualifications"
+  )
+  tech_stack: List[str] = Field(
+    default_factory=list, description="Languages, frameworks and tools used"
+  )
@@ -29,6 +29,61 @@ class JobPostingList(BaseModel):
   )
 
 
+class JobPostingSummary(BaseModel):
+  """A job posting without its description, for list views."""
+
+  id: int = Field(description="The id of the job posting database")
+  title: str = Field(description="The title of the job posting")
+  company: Optional[str] = Field(default="", description="The name of the company")
+  location: Optional[str] = Field(default="", description="The location of the job")
+  url: Optional[str] = Field(default="", description="The URL to the job posting")
+  posted_at: Optional[str] = Field(
+    default=None, description="The date and time the job was posted"
+  )
+  created_at: Optional[str] = Field(
+    default=None, description="When the job posting was saved"
+  )
+
+
+class JobPostingListPage(BaseModel):
+  """One page of job postings, newest first."""
+
+  items: List[JobPostingSummary] = Field(default_factory=list)
+  next_cursor: Optional[str] = Field(
+    default=None, description="Pass as `cursor` to fetch the next page"
+  )
+
+
+class JobPostingSearchHit(BaseModel):
+  """A job posting matched by a full-text search."""
+
+  id: int = Field(description="The id of the job posting database")
+  title: str = Field(description="The title of the job posting")
+  company: Optional[str] = Field(default="", description="The name of the company")
+  location: Optional[str] = Field(default="", description="The location of the job")
+  url: Optional[str] = Field(default="", description="The URL to the job posting")
+  posted_at: Optional[str] = Field(
+    default=None, description="The date and time the job was posted"
+  )
+  snippet: str = Field(
+    default="", description="Excerpt around the matched terms, marked with <b></b>"
+  )
+  score: float = Field(description="BM25 rank; lower is a better match")
+
+
+class JobPostingSearchPage(BaseModel):
+  """One page of full-text search results."""
+
+  hits: List[JobPostingSearchHit] = Field(default_factory=list)
+  next_cursor: Optional[str] = Field(
+    default=None, description="Pass as `cursor` to fetch the next page"
+  )
+  truncated: bool = Field(
+    default=False,
+    description="The query matched too many postings; only the newest were ranked",
+  )
+
+
 class JobPostingExtractionState(BaseModel):
   """State for job posting extraction workflow."""
 
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -6,3 +7,9 @@ class JobPostingUserMap(BaseModel):
 
   user_id: str = Field(description="The ID of the user")
   job_posting_id: int = Field(description="The ID of the job posting")
+  delivered_at: Optional[str] = Field(
+    default=None, description="When the job posting was delivered to the user"
+  )
+  analysis_id: Optional[str] = Field(
+    default=None, description="The analysis report delivered with the job posting"
+  )
@@ -0,0 +1,18 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class ResumeDigest(BaseModel):
+  """A compact profile of a user's resume used in place of the raw text."""
+
+  summary: str = Field(default="", description="A short professional summary")
+  years_of_experience: Optional[float] = Field(
+    default=None, description="Total years of professional experience"
+  )
+  skills: List[str] = Field(
+    default_factory=list, description="Technical and professional skills"
+  )
+  key_projects: List[str] = Field(
+    default_factory=list,
+    description="One-line summaries of the most notable projects and their impact",
+  )
@@ -10,8 +10,24 @@ class ResumeMakerState(BaseModel):
   source_files: List[Path] = Field(
     default_factory=list, description="List of source file paths"
   )
+  source_contents: List[str] = Field(
+    default_factory=list, description="Contents of the source files, read once"
+  )
+  condensed_sources: List[str] = Field(
+    default_factory=list,
+    description="Summarized source contents fed to planning and generation",
+  )
   job_target: str = Field(default="", description="Target job/position")
   plan_to_write_resume: str = Field(
     default="", description="Analysis and plan on how to write the resume"
   )
   final_resume: str = Field(default="", description="Final generated resume")
+  force_regenerate: bool = Field(
+    default=False, description="Ignore the cached resume and call the LLM again"
+  )
+  cache_key: str = Field(
+    default="", description="Hash of (sources, job target, model) for the cache"
+  )
+  cache_hit: bool = Field(
+    default=False, description="Whether plan and resume came from the cache"
+  )
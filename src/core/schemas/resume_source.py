@@ -14,3 +14,6 @@ class ResumeSource(BaseModel):
     description="The name or path of the resume source file"
   )
   original_file_name: str = Field(description="The original name of the uploaded file")
+  content_hash: Optional[str] = Field(
+    default=None, description="SHA-256 of the uploaded file, used for deduplication"
+  )
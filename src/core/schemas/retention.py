@@ -0,0 +1,19 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class RetentionStats(BaseModel):
+  """What a retention run archived and deleted (or would, in a dry run)."""
+
+  dry_run: bool = Field(description="Nothing was changed if True")
+  retention_days: int = Field(description="Postings older than this were expired")
+  archived_postings: int = Field(default=0, description="Expired postings archived")
+  archive_file: Optional[str] = Field(
+    default=None, description="Path of the archive written by this run"
+  )
+  deleted_content_docs: int = Field(
+    default=0, description="Content docs of archived postings and orphaned ones"
+  )
+  deleted_reports: int = Field(default=0, description="Unreferenced expired reports")
+  bytes_freed: int = Field(default=0, description="Size of the deleted files")
+  pages_freed: int = Field(default=0, description="Database pages vacuumed")
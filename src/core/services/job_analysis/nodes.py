@@ -1,89 +1,102 @@
 from datetime import datetime
 from langchain_core.prompts import PromptTemplate
-from src.core.llm.providers import get_job_analysis_model
+from src.core.llm.providers import JOB_ANALYSIS_MODEL, get_job_analysis_model
+from src.core.llm.prompt_builder import PromptBuilder
 from src.core.schemas.job_analysis import JobAnalysisState
-from src.core.database.job_postings import get_unread_job_posting
-from src.core.file_storage.paths import FileStoragePaths
-from src.core.file_storage.file_manager import FileManager
-from src.core.database.users import get_all_users
+from src.core.database import aio as db
+from src.core.schemas.job_digest import JobDigest
+from src.core.services.job_search.digest import format_job_digest
+from src.core.file_storage.storage import get_storage
+from src.core.services.resume_maker.digest import (
+  format_resume_digest,
+  get_or_create_resume_digest,
+)
 import random
 
 
 # Initialize file storage
-file_paths = FileStoragePaths()
-file_manager = FileManager(file_paths)
+storage = get_storage()
+file_paths = storage.paths
+file_manager = storage.file_manager
 
 
-async def scrape_job_details_node(state: JobAnalysisState) -> JobAnalysisState:
+async def scrape_job_details_node(state: JobAnalysisState) -> dict:
   """채용공고 텍스트 파일을 읽어서 상세 정보를 가져옵니다."""
   print("--- Reading Job Details from Content File ---")
 
   try:
-    # Get job posting from database
-    job_posting = get_unread_job_posting()
+    # Get job posting from database (run_job_analysis claims one if none was given)
+    job_posting_id = state.get("job_posting_id")
+    job_posting = None
+    if job_posting_id:
+      job_posting = await db.get_job_posting_by_id(job_posting_id)
 
     if not job_posting:
-      print("No unread job posting found")
-      state["detailed_job_info"] = state["job_description"]
-      return state
+      print(f"Job posting not found: {job_posting_id}")
+      return {"detailed_job_info": state.get("detailed_job_info", "")}
+
+    update = {"job_posting_id": job_posting.id}
+    if not state.get("use_full_job_posting") and job_posting.id:
+      digests = await db.get_job_digests([job_posting.id])
+      if job_posting.id in digests:
+        digest = JobDigest.model_validate_json(digests[job_posting.id])
+        update["job_digest"] = format_job_digest(job_posting, digest)
 
     # Read content from content_doc file
     if job_posting.content_doc:
       content_file = file_paths.get_job_content_path(job_posting.content_doc)
-      text_content = file_manager.read_file_sync(content_file)
+      text_content = await file_manager.read_file_async(content_file)
       if text_content:
-        state["detailed_job_info"] = text_content
         print(f"Successfully read job details from {content_file}")
-      else:
-        print(f"Content file not found: {content_file}")
-        state["detailed_job_info"] = job_posting.description
-    else:
-      # Fallback to description if content_doc is not provided
-      state["detailed_job_info"] = job_posting.description
+        return {**update, "detailed_job_info": text_content}
+      print(f"Content file not found: {content_file}")
+
+    # Fallback to description if content_doc is not available
+    return {**update, "detailed_job_info": job_posting.description or ""}
 
   except Exception as e:
     print(f"Error reading job details: {e}")
-    state["detailed_job_info"] = state.get("job_description", "")
+    return {"detailed_job_info": state.get("detailed_job_info", "")}
 
-  return state
 
-
-def load_resume_node(state: JobAnalysisState) -> JobAnalysisState:
+async def load_resume_node(state: JobAnalysisState) -> dict:
   """이력서 파일을 로드합니다."""
   print("--- Loading Resume ---")
 
   # Get a random user and their resume file
-  users = get_all_users()
+  users = await db.get_all_users()
   if not users:
-    state["resume_content"] = "사용자가 없습니다."
-    return state
+    return {"resume_content": "사용자가 없습니다."}
 
   # Select random user if no specific user_id is provided
-  if hasattr(state, "user_id") and state.user_id:
-    selected_user = next((user for user in users if user.id == state.user_id), None)
-    if not selected_user:
-      selected_user = random.choice(users)
-  else:
+  user_id = state.get("user_id")
+  selected_user = next((user for user in users if user.id == user_id), None)
+  if not selected_user:
     selected_user = random.choice(users)
 
-  if selected_user and selected_user.resume_file:
-    resume_path = file_paths.get_resume_path(selected_user.resume_file)
-    resume_content = file_manager.read_file_sync(resume_path)
-    if resume_content:
-      state["resume_content"] = resume_content
-      state["user_id"] = selected_user.id  # Store which user's resume we used
-      print(f"Loaded resume for user {selected_user.name} from {resume_path}")
-    else:
-      state["resume_content"] = "이력서 파일을 찾을 수 없습니다."
-      print("Resume file not found")
-  else:
-    state["resume_content"] = "이력서가 없습니다."
+  if not selected_user.resume_file:
     print("No resume file available")
+    return {"resume_content": "이력서가 없습니다."}
+
+  resume_path = file_paths.get_resume_path(selected_user.resume_file)
+  resume_content = await file_manager.read_file_async(resume_path)
+  if not resume_content:
+    print("Resume file not found")
+    return {"resume_content": "이력서 파일을 찾을 수 없습니다."}
 
-  return state
+  print(f"Loaded resume for user {selected_user.name} from {resume_path}")
+  # Store which user's resume we used
+  update = {"resume_content": resume_content, "user_id": selected_user.id}
 
+  if not state.get("use_full_resume"):
+    digest = await get_or_create_resume_digest(selected_user.id, resume_content)
+    if digest:
+      update["resume_digest"] = format_resume_digest(digest)
 
-async def analyze_job_fit_node(state: JobAnalysisState) -> JobAnalysisState:
+  return update
+
+
+async def analyze_job_fit_node(state: JobAnalysisState) -> dict:
   """채용공고와 이력서의 적합성을 분석합니다."""
   print("--- Starting Job Fit Analysis ---")
 
@@ -135,24 +148,41 @@ async def analyze_job_fit_node(state: JobAnalysisState) -> JobAnalysisState:
   )
 
   try:
+    # 이력서 요약이 있으면 원문 대신 사용 (use_full_resume 플래그로 원문 사용 가능)
+    resume = state["resume_content"]
+    if not state.get("use_full_resume") and state.get("resume_digest"):
+      resume = state["resume_digest"]
+
+    # 채용공고 요약이 있으면 전체 본문 대신 사용 (use_full_job_posting 플래그로 원문 사용 가능)
+    job_info = state["detailed_job_info"]
+    if not state.get("use_full_job_posting") and state.get("job_digest"):
+      job_info = state["job_digest"]
+
+    builder = PromptBuilder("job_analysis", JOB_ANALYSIS_MODEL, prompt.template)
+    builder.add_section("job_info", job_info, priority=0)
+    builder.add_section("resume", resume, priority=1)
+
     chain = prompt | llm
-    result = await chain.ainvoke(
-      {"job_info": state["detailed_job_info"], "resume": state["resume_content"]}
-    )
+    result = await chain.ainvoke(builder.build())
     print("Job analysis completed successfully")
-    state["analysis_result"] = str(result.content)
+    return {"analysis_result": str(result.content)}
 
   except Exception as e:
     print(f"Error in job analysis: {e}")
-    state["analysis_result"] = f"분석 중 오류가 발생했습니다: {str(e)}"
-
-  return state
+    return {
+      "analysis_result": f"분석 중 오류가 발생했습니다: {str(e)}",
+      "analysis_failed": True,
+    }
 
 
-def generate_report_node(state: JobAnalysisState) -> JobAnalysisState:
+async def generate_report_node(state: JobAnalysisState) -> dict:
   """분석 결과를 바탕으로 상세한 보고서를 생성합니다."""
   print("--- Generating Analysis Report ---")
 
+  # A failed analysis gets no report, so callers don't record it as delivered
+  if state.get("analysis_failed"):
+    return {"report_content": state["analysis_result"]}
+
   try:
     analysis_data = state["analysis_result"]
 
@@ -167,16 +197,13 @@ def generate_report_node(state: JobAnalysisState) -> JobAnalysisState:
 *분석 일시: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}*
 """
 
-    state["report_content"] = report
-
     # 파일로 저장
     output_path = file_paths.get_output_report_path("job_analysis")
-    file_manager.write_file_sync(output_path, report)
+    await file_manager.write_file_async(output_path, report)
 
     print(f"Report saved to: {output_path}")
+    return {"report_content": report, "report_file": output_path.name}
 
   except Exception as e:
     print(f"Error generating report: {e}")
-    state["report_content"] = "보고서 생성 중 오류가 발생했습니다."
-
-  return state
+    return {"report_content": "보고서 생성 중 오류가 발생했습니다."}
@@ -1,4 +1,6 @@
-from langgraph.graph import StateGraph, END
+from functools import lru_cache
+from langgraph.graph import StateGraph, START, END
+from src.core.database import aio as db
 from src.core.schemas.job_analysis import JobAnalysisState
 from src.core.services.job_analysis.nodes import (
   scrape_job_details_node,
@@ -20,32 +22,95 @@ def build_job_analysis_workflow():
   workflow.add_node("analyze_job_fit", analyze_job_fit_node)
   workflow.add_node("generate_report", generate_report_node)
 
-  # 엣지 연결 (순차적 실행)
-  workflow.set_entry_point("scrape_job_details")
-  workflow.add_edge("scrape_job_details", "load_resume")
-  workflow.add_edge("load_resume", "analyze_job_fit")
+  # 엣지 연결 (채용공고 로드와 이력서 로드는 병렬 실행)
+  workflow.add_edge(START, "scrape_job_details")
+  workflow.add_edge(START, "load_resume")
+  workflow.add_edge(["scrape_job_details", "load_resume"], "analyze_job_fit")
   workflow.add_edge("analyze_job_fit", "generate_report")
   workflow.add_edge("generate_report", END)
 
   return workflow.compile()
 
 
+@lru_cache(maxsize=1)
+def get_job_analysis_workflow():
+  """컴파일된 채용공고 분석 워크플로우를 프로세스당 한 번만 생성하여 재사용합니다."""
+  return build_job_analysis_workflow()
+
+
+async def _complete_claim(user_id: str, job_posting, report_file: str):
+  """Records a claimed posting as analyzed: delivered to the user, or read."""
+  if user_id:
+    await db.mark_job_posting_delivered(
+      user_id, job_posting.id, analysis_id=report_file
+    )
+  else:
+    await db.mark_job_as_read(job_posting.url)
+
+
+async def _release_claim(user_id: str, job_posting):
+  """Gives a claimed posting back so a later run retries it."""
+  if user_id:
+    await db.release_user_job_posting(user_id, job_posting.id)
+  else:
+    await db.release_job_posting(job_posting.id)
+
+
 async def run_job_analysis(
   user_id: str = "",
+  job_posting_id: int = 0,
+  use_full_resume: bool = False,
+  use_full_job_posting: bool = False,
 ):
-  """채용공고 분석을 실행합니다."""
+  """
+  채용공고 분석을 실행합니다.
+
+  Without job_posting_id, the next posting queued for the user (or the next
+  unread posting, without a user) is claimed here and the claim is completed
+  with the run: the posting is marked delivered (or read) when a report was
+  produced and released otherwise. With job_posting_id, the caller owns the
+  claim (see JobNotifier, which marks delivery once the report is sent).
+  """
+  claimed = None
+  if not job_posting_id:
+    if user_id:
+      claimed = await db.claim_next_job_posting_for_user(user_id)
+    else:
+      claimed = await db.claim_next_job_posting()
+    if not claimed:
+      print("No queued job posting found")
+      return {"analysis_result": "분석할 채용공고가 없습니다.", "report_file": ""}
+    job_posting_id = claimed.id
 
   # 초기 상태 설정
   initial_state = JobAnalysisState(
     resume_content="",
+    resume_digest="",
+    use_full_resume=use_full_resume,
     detailed_job_info="",
+    job_digest="",
+    use_full_job_posting=use_full_job_posting,
     analysis_result="",
+    analysis_failed=False,
     report_content="",
+    report_file="",
     user_id=user_id,
+    job_posting_id=job_posting_id,
   )
 
   # 워크플로우 실행
-  workflow = build_job_analysis_workflow()
-  final_state = await workflow.ainvoke(initial_state)
+  workflow = get_job_analysis_workflow()
+  try:
+    final_state = await workflow.ainvoke(initial_state)
+  except BaseException:
+    if claimed:
+      await _release_claim(user_id, claimed)
+    raise
+
+  if claimed:
+    if final_state.get("report_file"):
+      await _complete_claim(user_id, claimed, final_state["report_file"])
+    else:
+      await _release_claim(user_id, claimed)
 
   return final_state
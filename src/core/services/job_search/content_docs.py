@@ -0,0 +1,44 @@
+import asyncio
+from src.core.database import aio as db
+from src.core.file_storage.storage import get_storage
+from src.core.services.utils.hashing import compute_content_hash
+
+
+async def migrate_content_docs_to_blobs() -> int:
+  """
+  Moves legacy plain-text content docs ({id}_{random}.md) into the compressed,
+  content-addressed blob store and points content_doc at the content hash.
+
+  Returns the number of postings migrated.
+  """
+  storage = get_storage()
+  file_paths = storage.paths
+  file_manager = storage.file_manager
+  content_docs = await db.get_job_content_docs()
+
+  migrated = 0
+  for job_id, content_doc in content_docs.items():
+    legacy_path = file_paths.get_job_content_path(content_doc)
+    if legacy_path.suffix == ".gz":
+      continue  # Already a blob
+
+    content = await file_manager.read_file_async(legacy_path)
+    if content is None:
+      print(f"Content doc not found for job_id {job_id}: {content_doc}")
+      continue
+
+    content_hash = compute_content_hash(content)
+    blob_path = file_paths.get_job_content_path(content_hash)
+    if not file_manager.file_exists(blob_path):
+      if not await file_manager.write_file_async(blob_path, content):
+        continue
+    await db.update_content_doc(job_id, content_hash)
+    legacy_path.unlink(missing_ok=True)
+    migrated += 1
+
+  print(f"Migrated {migrated} content docs to the blob store.")
+  return migrated
+
+
+if __name__ == "__main__":
+  asyncio.run(migrate_content_docs_to_blobs())
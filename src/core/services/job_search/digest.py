@@ -0,0 +1,48 @@
+from typing import Optional
+from src.core.llm.providers import get_structured_output_model
+from src.core.schemas.job_digest import JobDigest
+from src.core.schemas.job_posting import JobPosting
+
+
+def format_job_digest(job_posting: JobPosting, digest: JobDigest) -> str:
+  """Renders a job posting and its digest as compact Markdown for prompts."""
+  lines = [
+    f"- **채용공고**: {job_posting.title}",
+    f"- **회사**: {job_posting.company or 'N/A'}",
+    f"- **근무지**: {digest.location or job_posting.location or 'N/A'}",
+  ]
+  if digest.seniority:
+    lines.append(f"- **경력 수준**: {digest.seniority}")
+  if digest.tech_stack:
+    lines.append(f"- **기술 스택**: {', '.join(digest.tech_stack)}")
+  if digest.requirements:
+    lines.append("- **자격 요건**:")
+    lines.extend(f"  - {item}" for item in digest.requirements)
+  if digest.preferred_skills:
+    lines.append("- **우대 사항**:")
+    lines.extend(f"  - {item}" for item in digest.preferred_skills)
+  return "\n".join(lines)
+
+
+async def extract_job_digest(content: str) -> Optional[JobDigest]:
+  """Extracts a structured digest from the full job posting text."""
+  structured_llm = get_structured_output_model().with_structured_output(JobDigest)
+
+  prompt = f"""다음 채용 공고 텍스트를 분석해서 JobDigest 객체에 맞는 JSON으로 요약해줘.
+- 'seniority': 요구 경력 수준 (예: '신입', '3년 이상', '시니어')
+- 'location': 근무지와 재택/하이브리드 여부
+- 'requirements': 필수 자격 요건 목록
+- 'preferred_skills': 우대 사항 목록
+- 'tech_stack': 언급된 언어, 프레임워크, 도구 목록
+복리후생, 채용 절차, 회사 소개 같은 내용은 제외해줘. 찾을 수 없는 필드는 비워둬.
+
+---
+{content}
+---
+"""
+
+  try:
+    return await structured_llm.ainvoke(prompt)
+  except Exception as e:
+    print(f"  -> 채용 공고 요약 추출 중 오류 발생: {e}")
+    return None
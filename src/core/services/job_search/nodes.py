@@ -3,16 +3,16 @@ from pydantic import BaseModel, Field
 
 from src.core.schemas.job_search import JobSearchState
 from src.core.database.users import get_user_by_id
-from src.core.file_storage.file_manager import FileManager
-from src.core.file_storage.paths import FileStoragePaths
+from src.core.file_storage.storage import get_storage
 from src.core.schemas.job_posting import JobPosting
 from src.core.services.job_search.scraping import collect_and_extract_job_postings
 
 
 
 # Initialize file storage
-file_paths = FileStoragePaths()
-file_manager = FileManager(file_paths)
+storage = get_storage()
+file_paths = storage.paths
+file_manager = storage.file_manager
 
 
 class JobSearchResult(BaseModel):
@@ -0,0 +1,142 @@
+import argparse
+import gzip
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Set
+from src.core.database.job_postings import (
+  delete_job_postings,
+  get_expired_job_postings,
+  get_job_content_docs,
+)
+from src.core.database.job_postings_users_map import get_analysis_ids
+from src.core.database.maintenance import compact_database
+from src.core.file_storage.file_manager import FileManager
+from src.core.file_storage.storage import get_storage
+from src.core.schemas.retention import RetentionStats
+
+RETENTION_DAYS = int(os.getenv("RETENTION_DAYS", "90"))
+
+# Unreferenced content docs younger than this are kept: the scraper writes the
+# file before it records the file name in the database
+ORPHAN_GRACE_SECONDS = 60 * 60
+
+
+def _files_under(directory: Path) -> List[Path]:
+  return [path for path in directory.rglob("*") if path.is_file()]
+
+
+def _delete_file(path: Path, dry_run: bool) -> int:
+  """Deletes a file (unless dry_run) and returns its size."""
+  size = path.stat().st_size
+  if not dry_run:
+    path.unlink(missing_ok=True)
+  return size
+
+
+def run_retention(days: int = RETENTION_DAYS, dry_run: bool = False) -> RetentionStats:
+  """
+  Archives expired job postings and deletes files nothing refers to anymore.
+
+  1. Postings older than `days` are written, with their content doc text, to a
+     gzip-compressed JSON Lines archive, then deleted with their delivery
+     queue entries.
+  2. Content docs no longer referenced by a posting are deleted.
+  3. Analysis reports older than `days` that no delivery refers to are deleted.
+  4. The freed database pages are returned to the filesystem.
+
+  With dry_run, nothing is written or deleted and the returned stats tell what
+  would have been.
+  """
+  file_paths = get_storage().paths
+  # Uncached: archiving reads every expired content doc once
+  file_manager = FileManager(file_paths)
+  stats = RetentionStats(dry_run=dry_run, retention_days=days)
+
+  # 1. Archive expired postings; nothing is deleted until the archive is complete
+  archived_ids: List[int] = []
+  archived_docs: Set[str] = set()
+  archive_path = (
+    file_paths.archive_dir / f"job_postings_{datetime.now():%Y%m%d_%H%M%S}.jsonl.gz"
+  )
+  archive = None
+  try:
+    after_id = 0
+    while rows := get_expired_job_postings(days, after_id=after_id):
+      after_id = rows[-1]["id"]
+      for row in rows:
+        archived_ids.append(row["id"])
+        if row["content_doc"]:
+          archived_docs.add(row["content_doc"])
+        if dry_run:
+          continue
+        if archive is None:
+          archive = gzip.open(archive_path, "wt", encoding="utf-8")
+        content = None
+        if row["content_doc"]:
+          content = file_manager.read_file_sync(
+            file_paths.get_job_content_path(row["content_doc"])
+          )
+        archive.write(json.dumps({**row, "content": content}, ensure_ascii=False))
+        archive.write("\n")
+  finally:
+    if archive is not None:
+      archive.close()
+
+  stats.archived_postings = len(archived_ids)
+  if archive is not None:
+    stats.archive_file = str(archive_path)
+  if archived_ids and not dry_run:
+    delete_job_postings(archived_ids)
+
+  # 2. Content docs of archived postings and orphaned ones. Blobs are shared by
+  # postings with the same content, so a doc stays while any remaining posting
+  # refers to it (in a dry run, the archived postings still exist and are skipped)
+  archived = set(archived_ids)
+  referenced_docs = {
+    doc for job_id, doc in get_job_content_docs().items() if job_id not in archived
+  }
+  referenced_paths = {file_paths.get_job_content_path(doc) for doc in referenced_docs}
+  archived_paths = {file_paths.get_job_content_path(doc) for doc in archived_docs}
+  now = time.time()
+  for path in _files_under(file_paths.job_postings_dir):
+    if path in referenced_paths:
+      continue
+    if path in archived_paths or now - path.stat().st_mtime > ORPHAN_GRACE_SECONDS:
+      stats.bytes_freed += _delete_file(path, dry_run)
+      stats.deleted_content_docs += 1
+
+  # 3. Expired reports that no remaining delivery refers to
+  analysis_ids = {
+    analysis_id: job_id
+    for analysis_id, job_id in get_analysis_ids().items()
+    if job_id not in archived
+  }
+  report_cutoff = now - days * 24 * 60 * 60
+  for path in _files_under(file_paths.output_dir):
+    if path.name in analysis_ids or path.stat().st_mtime > report_cutoff:
+      continue
+    stats.bytes_freed += _delete_file(path, dry_run)
+    stats.deleted_reports += 1
+
+  # 4. Give the freed pages back to the filesystem
+  if not dry_run:
+    stats.pages_freed = compact_database()
+
+  print(
+    f"Retention ({'dry run' if dry_run else 'applied'}, {days} days): "
+    f"{stats.archived_postings} postings archived, "
+    f"{stats.deleted_content_docs} content docs and {stats.deleted_reports} reports "
+    f"deleted ({stats.bytes_freed} bytes), {stats.pages_freed} pages freed"
+  )
+  return stats
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Archive and clean up old job postings")
+  parser.add_argument("--days", type=int, default=RETENTION_DAYS)
+  parser.add_argument("--dry-run", action="store_true")
+  args = parser.parse_args()
+  print(run_retention(days=args.days, dry_run=args.dry_run).model_dump_json(indent=2))
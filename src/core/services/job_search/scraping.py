@@ -4,12 +4,12 @@ from browser_use import Agent
 from browser_use.browser import BrowserProfile
 from dotenv import load_dotenv
 from src.core.schemas.job_posting import JobPosting, JobPostingList
-from src.core.database.job_postings import save_job_postings, update_content_doc
-from src.core.file_storage.file_manager import FileManager
-from src.core.file_storage.paths import FileStoragePaths
-from src.core.services.utils.generate_random_data import generate_random_string
+from src.core.database import aio as db
+from src.core.file_storage.storage import get_storage
+from src.core.services.utils.hashing import compute_content_hash
 from urllib.parse import quote
 from src.core.llm.providers import get_structured_output_model
+from src.core.services.job_search.digest import extract_job_digest
 
 load_dotenv()
 
@@ -23,8 +23,9 @@ profile = BrowserProfile(
 llm = ChatGoogle(model="gemini-2.5-flash")
 
 # File storage initialization
-file_paths = FileStoragePaths()
-file_manager = FileManager(file_paths)
+storage = get_storage()
+file_paths = storage.paths
+file_manager = storage.file_manager
 
 
 async def get_job_search_urls(keyword: str) -> List[str]:
@@ -187,11 +188,25 @@ async def collect_and_extract_job_postings(
     # Step 3: DB에 JobPosting 저장 (초기 정보)
     # 데모를 위해 5개만 실행 (실제 운영 시 이 부분을 조절하세요)
     initial_postings_to_process = unique_postings[:5]
-    saved_postings = save_job_postings(initial_postings_to_process)
+    new_postings, existing_postings = await db.upsert_job_postings(
+      initial_postings_to_process
+    )
     print(
-      f"{len(saved_postings)}개의 채용 공고를 데이터베이스에 저장하고 ID를 부여했습니다."
+      f"{len(new_postings)}개의 새 채용 공고를 데이터베이스에 저장하고 ID를 부여했습니다. "
+      f"(기존 공고 {len(existing_postings)}개)"
     )
 
+    # 새 공고를 모든 사용자의 알림 대기열에 한 번에 추가
+    await db.enqueue_job_postings([posting.id for posting in new_postings])
+
+    # 이미 상세 내용이 저장된 기존 공고는 다시 스크랩하지 않음
+    saved_postings = list(new_postings)
+    for posting in existing_postings:
+      if posting.content_doc:
+        final_results.append(posting)
+      else:
+        saved_postings.append(posting)
+
     # Step 4: 각 공고의 상세 URL로 접속하여 상세 내용 추출, 구조화 및 업데이트
     for posting in saved_postings:
       try:
@@ -206,24 +221,31 @@ async def collect_and_extract_job_postings(
         detailed_posting = await extract_and_structure_job_detail(posting.url)
 
         if detailed_posting and detailed_posting.description:
-          # 파일명 생성
-          random_str = generate_random_string()
-          filename = f"{posting.id}_{random_str}.md"
-
-          # 파일 저장
+          # 내용의 해시로 압축 저장 (같은 내용을 다시 스크랩하면 기존 파일을 재사용)
+          filename = compute_content_hash(detailed_posting.description)
           file_path = file_paths.get_job_content_path(filename)
-          success = await file_manager.write_file_async(
-            file_path, detailed_posting.description
-          )
+          success = True
+          if not file_manager.file_exists(file_path):
+            success = await file_manager.write_file_async(
+              file_path, detailed_posting.description
+            )
 
           if success:
             # content_doc DB 업데이트
-            update_content_doc(posting.id, filename)
+            await db.update_content_doc(
+              posting.id, filename, content=detailed_posting.description
+            )
             posting.content_doc = filename
             print(
               f"  -> 상세 내용을 {filename}에 저장하고 데이터베이스를 업데이트했습니다."
             )
 
+            # 분석/요약 단계에서 재사용할 구조화된 요약을 한 번만 추출하여 저장
+            digest = await extract_job_digest(detailed_posting.description)
+            if digest:
+              await db.update_job_digest(posting.id, digest.model_dump_json())
+              print("  -> 채용 공고 요약(digest)을 저장했습니다.")
+
             # 참고: DB에 전체 상세내용(description, posted_at 등)을 업데이트하려면
             # `src/core/database/job_postings.py`에 `update_job_posting(id, data)`와 같은
             # 범용 업데이트 함수가 필요합니다. 현재는 메모리의 객체만 업데이트합니다.
@@ -0,0 +1,35 @@
+import asyncio
+from src.core.database import aio as db
+from src.core.file_storage.storage import get_storage
+
+
+async def reindex_content_docs() -> int:
+  """
+  Indexes the content doc text of every job posting in the full-text index.
+
+  New content docs are indexed by update_content_doc as they are scraped; this
+  backfills postings scraped before the index existed. Returns the number of
+  postings indexed.
+  """
+  storage = get_storage()
+  file_paths = storage.paths
+  file_manager = storage.file_manager
+  content_docs = await db.get_job_content_docs()
+
+  indexed = 0
+  for job_id, content_doc in content_docs.items():
+    content = await file_manager.read_file_async(
+      file_paths.get_job_content_path(content_doc)
+    )
+    if content is None:
+      print(f"Content doc not found for job_id {job_id}: {content_doc}")
+      continue
+    await db.update_job_search_body(job_id, content)
+    indexed += 1
+
+  print(f"Indexed {indexed} of {len(content_docs)} content docs.")
+  return indexed
+
+
+if __name__ == "__main__":
+  asyncio.run(reindex_content_docs())
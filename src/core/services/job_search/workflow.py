@@ -1,3 +1,4 @@
+from functools import lru_cache
 from langgraph.graph import StateGraph, END
 from src.core.schemas.job_search import JobSearchState
 from .nodes import (
@@ -26,9 +27,15 @@ def create_job_search_workflow():
   return workflow.compile()
 
 
+@lru_cache(maxsize=1)
+def get_job_search_workflow():
+  """컴파일된 채용공고 검색 워크플로우를 프로세스당 한 번만 생성하여 재사용합니다."""
+  return create_job_search_workflow()
+
+
 async def run_job_search_workflow(user_id: str, keyword: str | None = None):
   """사용자 이력서 기반으로 채용공고를 검색하고 결과를 반환합니다."""
-  app = create_job_search_workflow()
+  app = get_job_search_workflow()
   initial_state = (
     {"user_id": user_id, "job_keywords": [keyword]} if keyword else {"user_id": user_id}
   )
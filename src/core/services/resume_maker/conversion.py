@@ -0,0 +1,86 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from multiprocessing.connection import Connection
+from typing import Callable
+from markitdown import MarkItDown
+
+# Conversion limits
+MAX_CONVERSION_WORKERS = int(os.getenv("MAX_CONVERSION_WORKERS", "2"))
+CONVERSION_TIMEOUT_SECONDS = 120
+MAX_CONVERSION_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
+
+# Each conversion runs in its own process, forked from a server that has
+# MarkItDown imported already, so starting one costs milliseconds
+_context = multiprocessing.get_context("forkserver")
+_context.set_forkserver_preload(["markitdown"])
+# At most MAX_CONVERSION_WORKERS conversion processes run at once
+_slots = threading.BoundedSemaphore(MAX_CONVERSION_WORKERS)
+
+
+def _convert_in_worker(file_path: str) -> str:
+  """Runs inside a conversion process and returns the Markdown text of a file."""
+  return MarkItDown().convert(file_path).text_content
+
+
+def _run_conversion(convert: Callable[[str], str], file_path: str, conn: Connection):
+  """Conversion process entry point; sends back (True, text) or (False, error)."""
+  try:
+    conn.send((True, convert(file_path)))
+  except Exception as e:
+    conn.send((False, f"{type(e).__name__}: {e}"))
+  finally:
+    conn.close()
+
+
+def _convert_in_process(file_path: str) -> str:
+  """
+  Converts a file in a new process, killing it if it outlives the timeout.
+
+  Only this conversion's process is killed, so a hung or crashing file never
+  affects the conversions running next to it.
+  """
+  with _slots:
+    receiver, sender = _context.Pipe(duplex=False)
+    process = _context.Process(
+      target=_run_conversion,
+      args=(_convert_in_worker, file_path, sender),
+      daemon=True,
+    )
+    process.start()
+    sender.close()
+    try:
+      if not receiver.poll(CONVERSION_TIMEOUT_SECONDS):
+        raise ValueError(
+          f"Conversion timed out after {CONVERSION_TIMEOUT_SECONDS} seconds: {file_path}"
+        )
+      try:
+        succeeded, result = receiver.recv()
+      except EOFError:
+        raise ValueError(f"Conversion worker crashed while converting {file_path}")
+      if not succeeded:
+        raise ValueError(f"Conversion failed for {file_path}: {result}")
+      return result
+    finally:
+      receiver.close()
+      process.kill()
+      process.join()
+
+
+async def convert_to_markdown(file_path: str) -> str:
+  """
+  Converts a file to Markdown in a separate process, at most
+  MAX_CONVERSION_WORKERS at a time.
+
+  Raises:
+      ValueError: If the file is too large, the conversion fails or times out.
+  """
+  file_size = os.path.getsize(file_path)
+  if file_size > MAX_CONVERSION_FILE_SIZE:
+    raise ValueError(
+      f"File is too large to convert ({file_size} bytes, "
+      f"limit {MAX_CONVERSION_FILE_SIZE} bytes)"
+    )
+
+  return await asyncio.to_thread(_convert_in_process, file_path)
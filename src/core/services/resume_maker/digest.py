@@ -0,0 +1,67 @@
+from typing import Optional
+from src.core.database import aio as db
+from src.core.llm.providers import get_structured_output_model
+from src.core.schemas.resume_digest import ResumeDigest
+from src.core.services.utils.hashing import compute_content_hash
+
+
+def format_resume_digest(digest: ResumeDigest) -> str:
+  """Renders a resume digest as compact Markdown for use in prompts."""
+  lines = []
+  if digest.summary:
+    lines.append(f"- **요약**: {digest.summary}")
+  if digest.years_of_experience is not None:
+    lines.append(f"- **경력**: {digest.years_of_experience:g}년")
+  if digest.skills:
+    lines.append(f"- **보유 기술**: {', '.join(digest.skills)}")
+  if digest.key_projects:
+    lines.append("- **주요 프로젝트**:")
+    lines.extend(f"  - {project}" for project in digest.key_projects)
+  return "\n".join(lines)
+
+
+async def get_or_create_resume_digest(
+  user_id: str, resume_content: str
+) -> Optional[ResumeDigest]:
+  """
+  Returns the user's resume digest, generating it only when the resume changed.
+
+  The digest is stored on the user row together with the SHA-256 hash of the
+  resume it was extracted from, so repeated analyses of the same resume reuse it
+  without another LLM call.
+  """
+  content_hash = compute_content_hash(resume_content)
+
+  stored = await db.get_user_resume_digest(user_id)
+  if stored:
+    digest_json, stored_hash = stored
+    if stored_hash == content_hash:
+      try:
+        return ResumeDigest.model_validate_json(digest_json)
+      except ValueError as e:
+        print(f"Stored resume digest for user {user_id} is invalid: {e}")
+
+  print(f"--- Generating Resume Digest for user {user_id} ---")
+  structured_llm = get_structured_output_model().with_structured_output(ResumeDigest)
+  prompt = f"""다음 이력서를 분석해서 ResumeDigest 객체에 맞는 JSON으로 요약해줘.
+- 'summary': 지원자를 2~3문장으로 요약
+- 'years_of_experience': 총 경력 연수 (알 수 없으면 비워둬)
+- 'skills': 기술 스택과 핵심 역량 목록
+- 'key_projects': 주요 프로젝트를 성과 위주로 한 줄씩 요약 (최대 5개)
+
+---
+{resume_content}
+---
+"""
+
+  try:
+    digest = await structured_llm.ainvoke(prompt)
+  except Exception as e:
+    print(f"Error generating resume digest: {e}")
+    return None
+
+  if not digest:
+    return None
+
+  await db.update_user_resume_digest(user_id, digest.model_dump_json(), content_hash)
+  return digest
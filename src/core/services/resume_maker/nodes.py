@@ -1,12 +1,59 @@
+import asyncio
 from typing import Dict
 from src.core.schemas.resume_maker import ResumeMakerState
-from src.core.file_storage.file_manager import FileManager
-from src.core.file_storage.paths import FileStoragePaths
-from src.core.llm.providers import get_resume_generation_model
-from src.core.database.users import update_user
-from src.core.database.resume_sources import get_resume_sources_by_user
+from src.core.file_storage.storage import get_storage
+from src.core.llm.providers import (
+  RESUME_GENERATION_MODEL,
+  get_resume_generation_model,
+)
+from src.core.llm.prompt_builder import PromptBuilder
+from src.core.database import aio as db
+from src.core.services.utils.hashing import compute_content_hash
+from src.core.services.resume_maker.summarization import condense_sources
 from pathlib import Path
 
+PLAN_RESUME_PROMPT = """Based on the following source materials and job target, create a comprehensive plan for writing a professional resume.
+
+Job Target: {job_target}
+
+Source Materials:
+{source_materials}
+
+Create a detailed plan that includes:
+1. Key competencies and skills that should be emphasized for this job target
+2. Important achievements and experiences to highlight
+3. Specific keywords and terminology relevant to the role
+4. Recommended resume structure and sections
+5. Tailoring strategies for this specific position
+6. Quantifiable achievements to focus on
+7. Professional summary points
+
+Be specific and actionable. Focus on what makes this candidate stand out for this particular role."""
+
+GENERATE_RESUME_PROMPT = """Based on the following source materials and the provided plan, generate a professional, structured resume.
+
+Plan to follow:
+{plan}
+
+Source Materials:
+{source_materials}
+
+Job Target: {job_target}
+
+Generate a comprehensive, well-formatted resume that:
+1. Uses professional language and formatting
+2. Highlights relevant skills and experiences for the target role
+3. Includes quantifiable achievements and metrics
+4. Follows modern resume best practices
+5. Is ATS-friendly with appropriate keywords
+6. Has clear sections: Summary, Skills, Experience, Education, Projects (if relevant)
+7. Uses bullet points for achievements and responsibilities
+8. Is concise yet comprehensive
+
+Format the resume in Markdown for clarity.
+file content:
+"""
+
 
 async def load_resume_sources_node(state: ResumeMakerState) -> Dict:
   """Load source file names from the database for the given user."""
@@ -14,49 +61,101 @@ async def load_resume_sources_node(state: ResumeMakerState) -> Dict:
     if not state.user_id:
       raise ValueError("User ID is required to load resume sources.")
 
-    resume_sources = get_resume_sources_by_user(state.user_id)
+    resume_sources = await db.get_resume_sources_by_user(state.user_id)
     source_files = [Path(rs.source_file_name) for rs in resume_sources]
 
+    # Read every source once, concurrently, and share it with downstream nodes
+    file_manager = get_storage().file_manager
+    contents = await asyncio.gather(
+      *(file_manager.read_file_async(file_path) for file_path in source_files)
+    )
+    source_contents = [content for content in contents if content]
+
     print(f"Loaded {len(source_files)} source files for user {state.user_id}.")
-    return {"source_files": source_files}
+    return {"source_files": source_files, "source_contents": source_contents}
 
   except Exception as e:
     print(f"Error loading resume sources: {e}")
     return {}
 
 
-async def plan_resume_node(state: ResumeMakerState) -> Dict:
-  """Use LLM to create a detailed plan for writing the resume based on job target."""
+def _resume_cache_key(state: ResumeMakerState) -> str:
+  """Hashes everything the generated resume depends on."""
+  source_hashes = sorted(compute_content_hash(c) for c in state.source_contents)
+  return compute_content_hash(
+    "\n".join(
+      [state.user_id, state.job_target, RESUME_GENERATION_MODEL, *source_hashes]
+    )
+  )
+
+
+async def lookup_resume_cache_node(state: ResumeMakerState) -> Dict:
+  """Reuses the previous plan and resume if sources and job target are unchanged."""
+  cache_key = _resume_cache_key(state)
+  if state.force_regenerate:
+    print("Forced resume regeneration, skipping cache.")
+    return {"cache_key": cache_key, "cache_hit": False}
+
+  cached = await db.get_resume_generation(cache_key)
+  if not cached:
+    return {"cache_key": cache_key, "cache_hit": False}
+
+  plan_to_write_resume, final_resume = cached
+  print("Sources and job target unchanged, reusing cached resume.")
+  return {
+    "cache_key": cache_key,
+    "cache_hit": True,
+    "plan_to_write_resume": plan_to_write_resume,
+    "final_resume": final_resume,
+  }
+
+
+async def store_resume_cache_node(state: ResumeMakerState) -> Dict:
+  """Persists the generated plan and resume under the cache key."""
   try:
-    file_manager = FileManager()
-    contents = []
-    for file_path in state.source_files:
-      content = await file_manager.read_file_async(file_path)
-      if content:
-        contents.append(content)
+    if state.cache_key and state.plan_to_write_resume and state.final_resume:
+      await db.save_resume_generation(
+        state.cache_key,
+        state.user_id,
+        state.job_target,
+        RESUME_GENERATION_MODEL,
+        state.plan_to_write_resume,
+        state.final_resume,
+      )
+  except Exception as e:
+    print(f"Error caching generated resume: {e}")
+  return {}
 
-    full_content = "\n\n---\n\n".join(contents)
 
-    llm = get_resume_generation_model()
+async def summarize_sources_node(state: ResumeMakerState) -> Dict:
+  """Condense large source files so prompt size stays flat as sources grow."""
+  try:
+    condensed_sources = await condense_sources(state.source_contents)
+    print(
+      f"Condensed {len(state.source_contents)} sources into "
+      f"{len(condensed_sources)} prompt sections."
+    )
+    return {"condensed_sources": condensed_sources}
 
-    # Create detailed planning prompt
-    planning_prompt = f"""Based on the following source materials and job target, create a comprehensive plan for writing a professional resume.
+  except Exception as e:
+    print(f"Error summarizing resume sources: {e}")
+    return {}
 
-Job Target: {state.job_target or "General position"}
 
-Source Materials:
-{full_content}
+async def plan_resume_node(state: ResumeMakerState) -> Dict:
+  """Use LLM to create a detailed plan for writing the resume based on job target."""
+  try:
+    full_content = "\n\n---\n\n".join(state.condensed_sources or state.source_contents)
 
-Create a detailed plan that includes:
-1. Key competencies and skills that should be emphasized for this job target
-2. Important achievements and experiences to highlight
-3. Specific keywords and terminology relevant to the role
-4. Recommended resume structure and sections
-5. Tailoring strategies for this specific position
-6. Quantifiable achievements to focus on
-7. Professional summary points
+    llm = get_resume_generation_model()
 
-Be specific and actionable. Focus on what makes this candidate stand out for this particular role."""
+    # Create detailed planning prompt
+    builder = PromptBuilder("plan_resume", RESUME_GENERATION_MODEL, PLAN_RESUME_PROMPT)
+    builder.add_section(
+      "job_target", state.job_target or "General position", priority=2
+    )
+    builder.add_section("source_materials", full_content, priority=0)
+    planning_prompt = PLAN_RESUME_PROMPT.format(**builder.build())
 
     plan_response = await llm.ainvoke(planning_prompt)
     plan_to_write_resume = plan_response.content
@@ -72,41 +171,20 @@ Be specific and actionable. Focus on what makes this candidate stand out for thi
 async def generate_resume_node(state: ResumeMakerState) -> Dict:
   """Use LLM to generate a structured, professional resume based on the plan."""
   try:
-    file_manager = FileManager()
-    contents = []
-    for file_path in state.source_files:
-      content = await file_manager.read_file_async(file_path)
-      if content:
-        contents.append(content)
-
-    full_content = "\n\n---\n\n".join(contents)
+    full_content = "\n\n---\n\n".join(state.condensed_sources or state.source_contents)
 
     llm = get_resume_generation_model()
 
     # Generate resume prompt
-    resume_prompt = f"""Based on the following source materials and the provided plan, generate a professional, structured resume.
-
-Plan to follow:
-{state.plan_to_write_resume}
-
-Source Materials:
-{full_content}
-
-Job Target: {state.job_target or "General position"}
-
-Generate a comprehensive, well-formatted resume that:
-1. Uses professional language and formatting
-2. Highlights relevant skills and experiences for the target role
-3. Includes quantifiable achievements and metrics
-4. Follows modern resume best practices
-5. Is ATS-friendly with appropriate keywords
-6. Has clear sections: Summary, Skills, Experience, Education, Projects (if relevant)
-7. Uses bullet points for achievements and responsibilities
-8. Is concise yet comprehensive
-
-Format the resume in Markdown for clarity.
-file content:
-"""
+    builder = PromptBuilder(
+      "generate_resume", RESUME_GENERATION_MODEL, GENERATE_RESUME_PROMPT
+    )
+    builder.add_section(
+      "job_target", state.job_target or "General position", priority=2
+    )
+    builder.add_section("plan", state.plan_to_write_resume, priority=1)
+    builder.add_section("source_materials", full_content, priority=0)
+    resume_prompt = GENERATE_RESUME_PROMPT.format(**builder.build())
 
     resume_response = await llm.ainvoke(resume_prompt)
     final_resume = resume_response.content
@@ -123,8 +201,9 @@ async def save_resume_node(state: ResumeMakerState) -> None:
   """Save the generated resume to a file."""
   try:
     if state.final_resume:
-      file_paths = FileStoragePaths()
-      file_manager = FileManager()
+      storage = get_storage()
+      file_paths = storage.paths
+      file_manager = storage.file_manager
 
       output_path = file_paths.get_resume_path(f"{state.user_id}_resume.md")
       result = await file_manager.write_file_async(output_path, state.final_resume)
@@ -144,7 +223,7 @@ async def update_user_resume_file_node(state: ResumeMakerState) -> Dict:
 
     # Update the user's resume_file field (assuming user_id is available in state)
     if hasattr(state, "user_id") and state.user_id:
-      update_user(state.user_id, resume_file=resume_path)
+      await db.update_user(state.user_id, resume_file=resume_path)
       print(f"✅ Updated user {state.user_id}'s resume_file to: {resume_path}")
     else:
       raise ValueError("User ID is required to update resume file.")
@@ -1,27 +1,35 @@
+import asyncio
 import os
-import time
-from markitdown import MarkItDown
-from src.core.database.resume_sources import save_resume_source
+from typing import Optional
+from src.core.database import aio as db
 from src.core.schemas.resume_source import ResumeSource
-from src.core.file_storage.file_manager import FileManager
-from src.core.file_storage.paths import FileStoragePaths
-from src.core.services.utils.generate_random_data import generate_random_string
+from src.core.file_storage.storage import get_storage
+from src.core.services.utils.hashing import get_file_hash
+from src.core.services.resume_maker.conversion import convert_to_markdown
 
 
-async def upload_resume(file_path: str, file_name: str, user_id: str) -> ResumeSource:
+async def upload_resume(
+  file_path: str, file_name: str, user_id: str, content_hash: Optional[str] = None
+) -> ResumeSource:
   """
   Converts a resume file to Markdown, saves it, and stores metadata in the database.
 
+  Uploads are content-addressed: the Markdown conversion is stored under the
+  file's SHA-256, so identical files are converted only once, and uploading a
+  file the user already has returns the existing record.
+
   Args:
       file_path (str): Path to the input resume file (e.g., PDF or DOCX).
+      file_name (str): Original name of the uploaded file.
       user_id (str): ID of the user uploading the resume.
+      content_hash (str, optional): SHA-256 of the file if already computed.
 
   Returns:
-      ResumeSource: The created resume source record.
+      ResumeSource: The created (or already existing) resume source record.
 
   Raises:
       FileNotFoundError: If the input file does not exist.
-      ValueError: If the file cannot be converted to Markdown.
+      ValueError: If the file cannot be converted to Markdown or saved.
   """
   # Check if file exists
   if not os.path.exists(file_path):
@@ -30,35 +38,43 @@ async def upload_resume(file_path: str, file_name: str, user_id: str) -> ResumeS
   # Get original file name without path
   original_file_name = file_name
 
-  # Convert file to Markdown
-  try:
-    md = MarkItDown()
-    result = md.convert(file_path)
-    markdown_content = result.text_content
-  except Exception as e:
-    raise ValueError(f"Failed to convert file to Markdown: {str(e)}")
+  # Streamed uploads were hashed while written (see remember_file_hash)
+  if content_hash is None:
+    content_hash = await asyncio.to_thread(get_file_hash, file_path)
+
+  # Same file uploaded again by the same user (e.g. a retried Discord message)
+  existing = await db.get_resume_source_by_hash(user_id, content_hash)
+  if existing:
+    print(f"Resume source already uploaded, reusing id {existing.id}")
+    return existing
 
-  # Generate unique filename
-  timestamp = int(time.time())
-  random_str = generate_random_string()
-  filename = f"{user_id}_{timestamp}_{random_str}.md"
+  storage = get_storage()
+  file_paths = storage.paths
+  file_manager = storage.file_manager
+  output_path = file_paths.resume_sources_dir / f"{content_hash}.md"
 
-  try:
-    file_paths = FileStoragePaths()
-    file_manager = FileManager()
+  # Convert only if this content has never been converted before
+  if not output_path.exists():
+    # Convert file to Markdown (off the event loop, in a separate conversion process)
+    try:
+      markdown_content = await convert_to_markdown(file_path)
+    except Exception as e:
+      raise ValueError(f"Failed to convert file to Markdown: {str(e)}")
 
-    output_path = file_paths.resume_sources_dir / filename
-    result = await file_manager.write_file_async(output_path, markdown_content)
-  except Exception as e:
-    raise ValueError(f"Failed to save Markdown file: {str(e)}")
+    # write_file_async reports failures by returning False; don't record a
+    # source whose Markdown file was never written
+    if not await file_manager.write_file_async(output_path, markdown_content):
+      raise ValueError(f"Failed to save Markdown file: {output_path}")
 
-  # Save metadata to resume_sources table
+  # Save metadata to resume_sources table; if a concurrent upload of the same
+  # file saved it first, that record's ID is returned
   resume_source = ResumeSource(
     user_id=user_id,
     source_file_name=str(output_path),
     original_file_name=original_file_name,
+    content_hash=content_hash,
   )
-  resume_source_id = save_resume_source(resume_source)
+  resume_source_id = await db.save_resume_source(resume_source)
   resume_source.id = resume_source_id
 
   return resume_source
@@ -0,0 +1,81 @@
+import asyncio
+from typing import List
+from src.core.database import aio as db
+from src.core.llm.prompt_builder import PromptBuilder, estimate_tokens
+from src.core.llm.providers import SUMMARIZATION_MODEL, get_summarization_model
+from src.core.services.utils.hashing import compute_content_hash
+
+# Sources shorter than this are passed through unchanged
+SOURCE_SUMMARY_MIN_TOKENS = 1500
+# If the condensed corpus is still larger than this, it is reduced once more
+CONDENSED_CORPUS_MAX_TOKENS = 12000
+MAX_CONCURRENT_SUMMARIES = 4
+
+SUMMARIZE_SOURCE_PROMPT = """Condense the following resume source document into notes for writing a resume.
+
+Keep every concrete fact: roles, companies, dates, technologies, projects, responsibilities, quantifiable achievements, education and certifications.
+Drop filler, repeated content and formatting noise. Answer with concise Markdown bullet points in the document's language.
+
+Document:
+{document}"""
+
+REDUCE_SOURCES_PROMPT = """The following are notes condensed from several resume source documents of the same candidate.
+
+Merge them into a single set of notes for writing a resume. Remove duplicates, keep every distinct concrete fact (roles, companies, dates, technologies, projects, quantifiable achievements, education, certifications) and group them by topic. Answer with concise Markdown bullet points.
+
+Notes:
+{document}"""
+
+
+async def _summarize(text: str, template: str, semaphore: asyncio.Semaphore) -> str:
+  """Summarizes a text once per (content hash, model) and caches the result."""
+  content_hash = compute_content_hash(template + text)
+  cached = await db.get_resume_source_summaries([content_hash], SUMMARIZATION_MODEL)
+  if content_hash in cached:
+    return cached[content_hash]
+
+  builder = PromptBuilder("summarize_resume_source", SUMMARIZATION_MODEL, template)
+  builder.add_section("document", text)
+  prompt = template.format(**builder.build())
+
+  async with semaphore:
+    response = await get_summarization_model().ainvoke(prompt)
+  summary = str(response.content)
+
+  await db.save_resume_source_summary(content_hash, SUMMARIZATION_MODEL, summary)
+  return summary
+
+
+async def condense_sources(contents: List[str]) -> List[str]:
+  """
+  Map-reduce pre-pass over a user's resume sources.
+
+  Large sources are summarized individually and concurrently (map); if the
+  combined notes are still too large they are merged into one summary (reduce).
+  Every summary is cached by content hash, so only new or changed sources cost
+  an LLM call.
+  """
+  semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+
+  async def _condense(content: str) -> str:
+    if estimate_tokens(content) < SOURCE_SUMMARY_MIN_TOKENS:
+      return content
+    try:
+      return await _summarize(content, SUMMARIZE_SOURCE_PROMPT, semaphore)
+    except Exception as e:
+      print(f"Error summarizing resume source, using it as is: {e}")
+      return content
+
+  condensed = list(await asyncio.gather(*(_condense(c) for c in contents)))
+
+  total_tokens = sum(estimate_tokens(c) for c in condensed)
+  if len(condensed) > 1 and total_tokens > CONDENSED_CORPUS_MAX_TOKENS:
+    try:
+      merged = await _summarize(
+        "\n\n---\n\n".join(condensed), REDUCE_SOURCES_PROMPT, semaphore
+      )
+      return [merged]
+    except Exception as e:
+      print(f"Error merging resume source summaries: {e}")
+
+  return condensed
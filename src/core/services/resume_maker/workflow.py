@@ -1,7 +1,11 @@
+from functools import lru_cache
 from langgraph.graph import StateGraph, END
 from src.core.schemas.resume_maker import ResumeMakerState
 from src.core.services.resume_maker.nodes import (
   load_resume_sources_node,
+  lookup_resume_cache_node,
+  store_resume_cache_node,
+  summarize_sources_node,
   plan_resume_node,
   generate_resume_node,
   save_resume_node,
@@ -17,33 +21,53 @@ def build_resume_maker_workflow():
 
   # 노드 추가
   workflow.add_node("load_resume_sources", load_resume_sources_node)
+  workflow.add_node("lookup_resume_cache", lookup_resume_cache_node)
+  workflow.add_node("summarize_sources", summarize_sources_node)
   workflow.add_node("plan_resume", plan_resume_node)
   workflow.add_node("generate_resume", generate_resume_node)
+  workflow.add_node("store_resume_cache", store_resume_cache_node)
   workflow.add_node("save_resume", save_resume_node)
   workflow.add_node("update_user_resume_file", update_user_resume_file_node)
 
   # 엣지 연결 (순차적 실행)
   workflow.set_entry_point("load_resume_sources")
-  workflow.add_edge("load_resume_sources", "plan_resume")
+  workflow.add_edge("load_resume_sources", "lookup_resume_cache")
+  # 소스와 직무가 그대로면 캐시된 이력서를 사용하고 LLM 호출을 건너뜀
+  workflow.add_conditional_edges(
+    "lookup_resume_cache",
+    lambda state: "save_resume" if state.cache_hit else "summarize_sources",
+    ["save_resume", "summarize_sources"],
+  )
+  workflow.add_edge("summarize_sources", "plan_resume")
   workflow.add_edge("plan_resume", "generate_resume")
-  workflow.add_edge("generate_resume", "save_resume")
+  workflow.add_edge("generate_resume", "store_resume_cache")
+  workflow.add_edge("store_resume_cache", "save_resume")
   workflow.add_edge("save_resume", "update_user_resume_file")
   workflow.add_edge("update_user_resume_file", END)
 
   return workflow.compile()
 
 
-async def run_resume_maker(job_target: str = "", user_id: str = ""):
+@lru_cache(maxsize=1)
+def get_resume_maker_workflow():
+  """컴파일된 Resume maker 워크플로우를 프로세스당 한 번만 생성하여 재사용합니다."""
+  return build_resume_maker_workflow()
+
+
+async def run_resume_maker(
+  job_target: str = "", user_id: str = "", force_regenerate: bool = False
+):
   """Resume maker를 실행합니다."""
 
   # 초기 상태 설정 (단순화된 State에 맞게 수정)
   initial_state = ResumeMakerState(
     user_id=user_id,
     job_target=job_target,
+    force_regenerate=force_regenerate,
   )
 
   # 워크플로우 실행
-  workflow = build_resume_maker_workflow()
+  workflow = get_resume_maker_workflow()
   final_state = await workflow.ainvoke(initial_state)
 
   return final_state
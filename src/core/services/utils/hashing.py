@@ -0,0 +1,52 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Tuple
+
+# Digests of files hashed while they were written (e.g. streamed uploads), by
+# path; reused only while the file's size and mtime are unchanged
+KNOWN_FILE_HASHES_SIZE = 1024
+_known_file_hashes: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+_known_file_hashes_lock = threading.Lock()
+
+
+def compute_content_hash(content: str | bytes) -> str:
+  """Returns the SHA-256 hex digest of the given text or bytes."""
+  if isinstance(content, str):
+    content = content.encode("utf-8")
+  return hashlib.sha256(content).hexdigest()
+
+
+def compute_file_hash(file_path: str | Path, chunk_size: int = 1024 * 1024) -> str:
+  """Returns the SHA-256 hex digest of a file, read in chunks."""
+  digest = hashlib.sha256()
+  with open(file_path, "rb") as f:
+    for chunk in iter(lambda: f.read(chunk_size), b""):
+      digest.update(chunk)
+  return digest.hexdigest()
+
+
+def remember_file_hash(file_path: str | Path, content_hash: str):
+  """Records the SHA-256 of a file just written, so get_file_hash needn't read it."""
+  stat = os.stat(file_path)
+  key = os.path.abspath(file_path)
+  with _known_file_hashes_lock:
+    _known_file_hashes[key] = (stat.st_size, stat.st_mtime_ns, content_hash)
+    _known_file_hashes.move_to_end(key)
+    while len(_known_file_hashes) > KNOWN_FILE_HASHES_SIZE:
+      _known_file_hashes.popitem(last=False)
+
+
+def get_file_hash(file_path: str | Path) -> str:
+  """
+  Returns the SHA-256 hex digest of a file, reusing the digest recorded by
+  remember_file_hash if the file hasn't changed since.
+  """
+  stat = os.stat(file_path)
+  with _known_file_hashes_lock:
+    known = _known_file_hashes.get(os.path.abspath(file_path))
+  if known and known[:2] == (stat.st_size, stat.st_mtime_ns):
+    return known[2]
+  return compute_file_hash(file_path)
@@ -1,11 +1,13 @@
 import asyncio
 from src.core.database.init import init_all_database
+from src.core.file_storage.storage import get_storage
 from src.bot.run import run_bot
 
 
 async def main():
   """Initializes the database, schedules jobs, and runs the bot."""
   init_all_database()
+  get_storage()
 
   # Start the bot
   bot_task = asyncio.create_task(run_bot())
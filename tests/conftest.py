@@ -0,0 +1,12 @@
+import pytest
+from src.core.database import config
+from src.core.database.connection import close_db_connection
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+  """Points the repositories at an empty database file for one test."""
+  close_db_connection()
+  monkeypatch.setattr(config, "DB_FILE", str(tmp_path / "test.db"))
+  yield config.DB_FILE
+  close_db_connection()
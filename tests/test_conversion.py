@@ -0,0 +1,100 @@
+import asyncio
+import os
+import time
+import pytest
+from src.core.services.resume_maker import conversion
+
+
+def _hang(file_path: str) -> str:
+  with open(f"{file_path}.pid", "a", encoding="utf-8") as f:
+    f.write(f"{os.getpid()}\n")
+  time.sleep(60)
+  return ""
+
+
+def _is_running(pid: int) -> bool:
+  try:
+    os.kill(pid, 0)
+  except ProcessLookupError:
+    return False
+  # Terminated children stay as zombies until reaped; check their state
+  with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+    return f.read().split(")")[-1].split()[0] != "Z"
+
+
+def _crash(file_path: str) -> str:
+  os._exit(1)
+
+
+def _echo(file_path: str) -> str:
+  with open(file_path, encoding="utf-8") as f:
+    return f.read()
+
+
+def _hang_pids(file_path: str):
+  try:
+    with open(f"{file_path}.pid", encoding="utf-8") as f:
+      return [int(line) for line in f]
+  except FileNotFoundError:
+    return []
+
+
+def _hang_or_echo_after_hang_killed(file_path: str) -> str:
+  """Hangs on hang.txt; other files are echoed once the hung conversion is killed."""
+  hang_file = os.path.join(os.path.dirname(file_path), "hang.txt")
+  if file_path == hang_file:
+    return _hang(file_path)
+  while not _hang_pids(hang_file) or any(map(_is_running, _hang_pids(hang_file))):
+    time.sleep(0.05)
+  return _echo(file_path)
+
+
+@pytest.fixture
+def resume_file(tmp_path, monkeypatch):
+  monkeypatch.setattr(conversion, "CONVERSION_TIMEOUT_SECONDS", 1)
+  file_path = tmp_path / "resume.txt"
+  file_path.write_text("# Resume", encoding="utf-8")
+  return str(file_path)
+
+
+def test_timed_out_conversions_are_killed(resume_file, monkeypatch):
+  monkeypatch.setattr(conversion, "_convert_in_worker", _hang)
+  # More hung conversions than slots: each one must free its slot
+  for _ in range(conversion.MAX_CONVERSION_WORKERS + 1):
+    with pytest.raises(ValueError, match="timed out"):
+      asyncio.run(conversion.convert_to_markdown(resume_file))
+
+  pids = _hang_pids(resume_file)
+  assert len(pids) == conversion.MAX_CONVERSION_WORKERS + 1
+  assert not any(_is_running(pid) for pid in pids)
+
+  monkeypatch.setattr(conversion, "_convert_in_worker", _echo)
+  assert asyncio.run(conversion.convert_to_markdown(resume_file)) == "# Resume"
+
+
+def test_crashed_conversion_fails_alone(resume_file, monkeypatch):
+  monkeypatch.setattr(conversion, "_convert_in_worker", _crash)
+  with pytest.raises(ValueError, match="crashed"):
+    asyncio.run(conversion.convert_to_markdown(resume_file))
+
+  monkeypatch.setattr(conversion, "_convert_in_worker", _echo)
+  assert asyncio.run(conversion.convert_to_markdown(resume_file)) == "# Resume"
+
+
+def test_concurrent_conversion_survives_another_timeout(resume_file, monkeypatch):
+  monkeypatch.setattr(conversion, "CONVERSION_TIMEOUT_SECONDS", 2)
+  monkeypatch.setattr(conversion, "_convert_in_worker", _hang_or_echo_after_hang_killed)
+  hang_file = os.path.join(os.path.dirname(resume_file), "hang.txt")
+  with open(hang_file, "w", encoding="utf-8") as f:
+    f.write("")
+
+  async def convert_both():
+    hung = asyncio.create_task(conversion.convert_to_markdown(hang_file))
+    await asyncio.sleep(1)
+    converted = await conversion.convert_to_markdown(resume_file)
+    with pytest.raises(ValueError, match="timed out"):
+      await hung
+    return converted
+
+  # The second conversion only finishes after the first one has been killed
+  assert asyncio.run(convert_both()) == "# Resume"
@@ -0,0 +1,79 @@
+from src.core.database import config
+from src.core.database.connection import get_db_connection
+from src.core.database.job_postings import init_job_postings_db, save_job_postings
+from src.core.database.job_postings_users_map import (
+  claim_next_job_posting_for_user,
+  init_job_postings_users_map_db,
+)
+from src.core.database.migrations import MIGRATIONS, apply_migrations
+from src.core.database.resume_generations import init_resume_generations_db
+from src.core.database.resume_sources import init_resume_sources_db
+from src.core.database.users import init_users_db, save_user
+from src.core.schemas.job_posting import JobPosting
+from src.core.schemas.user import UserCreate
+
+
+def _init_version_2_database():
+  """Creates the tables and applies migrations 1-2, as before the delivery queue."""
+  init_users_db()
+  init_job_postings_db()
+  init_resume_sources_db()
+  init_job_postings_users_map_db()
+  init_resume_generations_db()
+  with get_db_connection() as conn:
+    for version, _, statements in MIGRATIONS:
+      if version > 2:
+        break
+      for statement in statements:
+        conn.execute(statement)
+    conn.execute("PRAGMA user_version = 2")
+    conn.commit()
+
+
+def _save_postings(count: int):
+  return save_job_postings(
+    [
+      JobPosting(title=f"Job {i}", company="Acme", url=f"https://example.com/{i}")
+      for i in range(count)
+    ]
+  )
+
+
+def _age_posting(job_posting_id: int, days: int):
+  with get_db_connection() as conn:
+    conn.execute(
+      "UPDATE job_postings SET created_at = datetime('now', ?) WHERE id = ?",
+      (f"-{days} days", job_posting_id),
+    )
+    conn.commit()
+
+
+def test_upgrade_queues_recent_postings_for_existing_users(temp_db):
+  _init_version_2_database()
+  postings = _save_postings(3)
+  _age_posting(postings[0].id, config.QUEUE_BACKFILL_DAYS + 1)
+  with get_db_connection() as conn:
+    conn.execute("INSERT INTO users (id, name) VALUES ('alice', 'Alice')")
+    conn.commit()
+
+  apply_migrations()
+
+  claimed = claim_next_job_posting_for_user("alice")
+  assert claimed is not None
+  assert claimed.id == postings[1].id
+  assert claim_next_job_posting_for_user("alice").id == postings[2].id
+  assert claim_next_job_posting_for_user("alice") is None
+
+
+def test_new_user_gets_recent_postings(temp_db):
+  _init_version_2_database()
+  apply_migrations()
+  postings = _save_postings(2)
+  _age_posting(postings[1].id, config.QUEUE_BACKFILL_DAYS + 1)
+
+  user = save_user(UserCreate(name="Bob"))
+
+  claimed = claim_next_job_posting_for_user(user.id)
+  assert claimed is not None
+  assert claimed.id == postings[0].id
+  assert claim_next_job_posting_for_user(user.id) is None
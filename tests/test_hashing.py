@@ -0,0 +1,17 @@
+from src.core.services.utils.hashing import (
+  compute_file_hash,
+  get_file_hash,
+  remember_file_hash,
+)
+
+
+def test_remembered_hash_is_reused_until_the_file_changes(tmp_path):
+  file_path = tmp_path / "resume.pdf"
+  file_path.write_bytes(b"resume")
+  # A digest the file can't have shows that get_file_hash didn't read it
+  remember_file_hash(file_path, "streamed")
+
+  assert get_file_hash(str(file_path)) == "streamed"
+
+  file_path.write_bytes(b"updated resume")
+  assert get_file_hash(file_path) == compute_file_hash(file_path)
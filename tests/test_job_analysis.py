@@ -0,0 +1,133 @@
+import asyncio
+import itertools
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from src.core.agents.job_finding_agent import create_job_finding_agent
+from src.core.database.connection import get_db_connection
+from src.core.database.init import init_all_database
+from src.core.database.job_postings import save_job_postings
+from src.core.database.users import save_user
+from src.core.file_storage.file_manager import FileManager
+from src.core.file_storage.paths import FileStoragePaths
+from src.core.schemas.job_posting import JobPosting
+from src.core.schemas.user import UserCreate
+from src.core.services.job_analysis import nodes
+from src.core.services.job_analysis.workflow import run_job_analysis
+
+
+class _FakeToolChatModel(GenericFakeChatModel):
+  """Replies with canned messages; accepts tools and ignores them."""
+
+  def bind_tools(self, tools, **kwargs):
+    return self
+
+
+def _fail(_):
+  raise RuntimeError("model unavailable")
+
+
+def _fit_model():
+  return GenericFakeChatModel(messages=itertools.cycle([AIMessage("적합합니다.")]))
+
+
+@pytest.fixture
+def queued_posting(temp_db, tmp_path, monkeypatch):
+  """A user with one queued posting, and file storage in tmp_path."""
+  paths = FileStoragePaths(str(tmp_path / "storage"))
+  monkeypatch.setattr(nodes, "file_paths", paths)
+  monkeypatch.setattr(nodes, "file_manager", FileManager(paths))
+
+  init_all_database()
+  (posting,) = save_job_postings(
+    [JobPosting(title="Backend Engineer", company="Acme", url="https://example.com/1")]
+  )
+  user = save_user(UserCreate(name="Alice"))
+  return user.id, posting.id
+
+
+def _ask_for_analysis(user_id: str):
+  """Sends one message to the agent, which calls the job_analysis tool."""
+  llm = _FakeToolChatModel(
+    messages=iter(
+      [
+        AIMessage(
+          "", tool_calls=[{"name": "job_analysis", "args": {}, "id": "call_1"}]
+        ),
+        AIMessage("Here is your analysis."),
+      ]
+    )
+  )
+  agent = create_job_finding_agent(user_id, llm=llm)
+  asyncio.run(agent.ainvoke({"messages": [("user", "이 공고 분석해줘")]}))
+
+
+def _delivery(user_id: str, job_posting_id: int):
+  with get_db_connection() as conn:
+    return conn.execute(
+      """
+      SELECT claimed_at, delivered_at, analysis_id FROM job_postings_users_map
+      WHERE user_id = ? AND job_posting_id = ?
+      """,
+      (user_id, job_posting_id),
+    ).fetchone()
+
+
+def test_agent_analysis_marks_the_claimed_posting_delivered(
+  queued_posting, monkeypatch
+):
+  user_id, job_posting_id = queued_posting
+  monkeypatch.setattr(nodes, "get_job_analysis_model", _fit_model)
+
+  _ask_for_analysis(user_id)
+
+  claimed_at, delivered_at, analysis_id = _delivery(user_id, job_posting_id)
+  assert delivered_at is not None
+  assert analysis_id and analysis_id.endswith(".md")
+
+
+def test_agent_analysis_releases_the_claim_when_analysis_fails(
+  queued_posting, monkeypatch
+):
+  user_id, job_posting_id = queued_posting
+  monkeypatch.setattr(nodes, "get_job_analysis_model", lambda: RunnableLambda(_fail))
+
+  _ask_for_analysis(user_id)
+
+  claimed_at, delivered_at, analysis_id = _delivery(user_id, job_posting_id)
+  assert claimed_at is None
+  assert delivered_at is None
+
+
+def _read_state(job_posting_id: int):
+  with get_db_connection() as conn:
+    return conn.execute(
+      "SELECT claimed_at, read_at FROM job_postings WHERE id = ?",
+      (job_posting_id,),
+    ).fetchone()
+
+
+def test_analysis_without_a_user_marks_the_claimed_posting_read(
+  queued_posting, monkeypatch
+):
+  _, job_posting_id = queued_posting
+  monkeypatch.setattr(nodes, "get_job_analysis_model", _fit_model)
+
+  asyncio.run(run_job_analysis())
+
+  claimed_at, read_at = _read_state(job_posting_id)
+  assert read_at is not None
+
+
+def test_analysis_without_a_user_releases_the_claim_when_analysis_fails(
+  queued_posting, monkeypatch
+):
+  _, job_posting_id = queued_posting
+  monkeypatch.setattr(nodes, "get_job_analysis_model", lambda: RunnableLambda(_fail))
+
+  asyncio.run(run_job_analysis())
+
+  claimed_at, read_at = _read_state(job_posting_id)
+  assert claimed_at is None
+  assert read_at is None
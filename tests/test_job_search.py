@@ -0,0 +1,35 @@
+from src.core.database import job_postings
+from src.core.database.init import init_all_database
+from src.core.database.job_postings import save_job_postings, search_job_postings
+from src.core.schemas.job_posting import JobPosting
+
+
+def _save_postings(title: str, count: int, start: int = 0):
+  save_job_postings(
+    [
+      JobPosting(title=title, company="Acme", url=f"https://example.com/{start + i}")
+      for i in range(count)
+    ]
+  )
+
+
+def test_broad_query_is_flagged_truncated(temp_db, monkeypatch):
+  monkeypatch.setattr(job_postings, "SEARCH_RANK_WINDOW", 5)
+  init_all_database()
+  _save_postings("Python backend engineer", 8)
+  _save_postings("Elixir engineer", 2, start=100)
+
+  seen = []
+  after = None
+  while True:
+    page = search_job_postings("python", limit=2, after=after)
+    assert page.truncated
+    seen += [hit.id for hit in page.hits]
+    after = page.next_cursor
+    if not after:
+      break
+  assert len(seen) == len(set(seen)) == 5
+
+  page = search_job_postings("elixir", limit=20)
+  assert not page.truncated
+  assert len(page.hits) == 2
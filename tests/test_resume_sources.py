@@ -0,0 +1,86 @@
+import asyncio
+import pytest
+from src.core.database.connection import get_db_connection
+from src.core.database.init import init_all_database
+from src.core.database.migrations import MIGRATIONS, apply_migrations
+from src.core.database.resume_sources import save_resume_source
+from src.core.file_storage.file_manager import FileManager
+from src.core.file_storage.paths import FileStoragePaths
+from src.core.file_storage.storage import StorageContext
+from src.core.schemas.resume_source import ResumeSource
+from src.core.services.resume_maker import source
+
+CONTENT_HASH = "ab" * 32
+
+
+def _resume_source(original_file_name: str = "resume.pdf") -> ResumeSource:
+  return ResumeSource(
+    user_id="alice",
+    source_file_name=f"{CONTENT_HASH}.md",
+    original_file_name=original_file_name,
+    content_hash=CONTENT_HASH,
+  )
+
+
+def _count_sources() -> int:
+  with get_db_connection() as conn:
+    return conn.execute("SELECT COUNT(*) FROM resume_sources").fetchone()[0]
+
+
+def test_saving_the_same_content_twice_returns_the_first_source(temp_db):
+  init_all_database()
+
+  first_id = save_resume_source(_resume_source())
+  second_id = save_resume_source(_resume_source("resume (1).pdf"))
+
+  assert second_id == first_id
+  assert _count_sources() == 1
+
+
+def test_upgrade_removes_duplicate_sources(temp_db):
+  pending_migrations = list(MIGRATIONS)
+  MIGRATIONS[:] = [migration for migration in pending_migrations if migration[0] <= 3]
+  try:
+    init_all_database()
+  finally:
+    MIGRATIONS[:] = pending_migrations
+  with get_db_connection() as conn:
+    for _ in range(2):
+      conn.execute(
+        """
+        INSERT INTO resume_sources (user_id, source_file_name, original_file_name, content_hash)
+        VALUES ('alice', 'a.md', 'a.pdf', ?)
+        """,
+        (CONTENT_HASH,),
+      )
+    conn.commit()
+
+  apply_migrations()
+
+  assert _count_sources() == 1
+  assert save_resume_source(_resume_source()) == 1
+
+
+class _ReadOnlyFileManager(FileManager):
+  async def write_file_async(self, file_path, content) -> bool:
+    return False
+
+
+def test_upload_is_not_recorded_when_the_markdown_cannot_be_saved(
+  temp_db, tmp_path, monkeypatch
+):
+  init_all_database()
+  paths = FileStoragePaths(str(tmp_path / "storage"))
+  storage = StorageContext(paths, _ReadOnlyFileManager(paths))
+  monkeypatch.setattr(source, "get_storage", lambda: storage)
+
+  async def convert_to_markdown(file_path: str) -> str:
+    return "# Resume"
+
+  monkeypatch.setattr(source, "convert_to_markdown", convert_to_markdown)
+  resume_file = tmp_path / "resume.txt"
+  resume_file.write_text("# Resume", encoding="utf-8")
+
+  with pytest.raises(ValueError, match="Failed to save"):
+    asyncio.run(source.upload_resume(str(resume_file), "resume.txt", "alice"))
+  assert _count_sources() == 0
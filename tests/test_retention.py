@@ -0,0 +1,60 @@
+import pytest
+from src.core.database.connection import get_db_connection
+from src.core.database.init import init_all_database
+from src.core.database.job_postings import save_job_postings, update_content_doc
+from src.core.file_storage.storage import get_storage
+from src.core.schemas.job_posting import JobPosting
+from src.core.services.job_search.retention import run_retention
+from src.core.services.utils.hashing import compute_content_hash
+
+CONTENT = "# Backend engineer\nPython, SQLite"
+
+
+@pytest.fixture
+def storage(temp_db, tmp_path, monkeypatch):
+  monkeypatch.chdir(tmp_path)
+  get_storage.cache_clear()
+  init_all_database()
+  yield get_storage()
+  get_storage.cache_clear()
+
+
+def _save_posting_with_shared_blob(storage, index: int, expired: bool) -> int:
+  posting = save_job_postings(
+    [JobPosting(title="Backend", company="Acme", url=f"https://example.com/{index}")]
+  )[0]
+  content_hash = compute_content_hash(CONTENT)
+  storage.file_manager.write_file_sync(
+    storage.paths.get_job_content_path(content_hash), CONTENT
+  )
+  update_content_doc(posting.id, content_hash, content=CONTENT)
+  if expired:
+    with get_db_connection() as conn:
+      conn.execute(
+        "UPDATE job_postings SET created_at = datetime('now', '-400 days') WHERE id = ?",
+        (posting.id,),
+      )
+      conn.commit()
+  return posting.id
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_blob_shared_with_a_live_posting_is_kept(storage, dry_run):
+  _save_posting_with_shared_blob(storage, 0, expired=True)
+  _save_posting_with_shared_blob(storage, 1, expired=False)
+  blob_path = storage.paths.get_job_content_path(compute_content_hash(CONTENT))
+
+  stats = run_retention(days=90, dry_run=dry_run)
+
+  assert stats.archived_postings == 1
+  assert stats.deleted_content_docs == 0
+  assert blob_path.exists()
+
+
+def test_dry_run_counts_blob_only_used_by_archived_postings(storage):
+  _save_posting_with_shared_blob(storage, 0, expired=True)
+
+  stats = run_retention(days=90, dry_run=True)
+
+  assert stats.archived_postings == 1
+  assert stats.deleted_content_docs == 1